@@ -0,0 +1,652 @@
+#!/usr/bin/env node
+
+/**
+ * Hook Latency Benchmark (Node.js)
+ * Records real hook stdin payloads and replays them against the .mjs and .sh
+ * hook implementations and the hook daemon (reached through Node or through
+ * hook-client.sh) inside synthetic home directories (seeded todo files and
+ * session stats), reporting startup time, p50/p95/p99 latency, peak RSS and
+ * fs/syscall counts per hook as a table or JSON.
+ * Cross-platform: Windows, macOS, Linux (.sh hooks need bash/python3)
+ *
+ * Usage:
+ *   # as a hook command, appends each payload to ~/.claude/hook-bench/payloads.jsonl
+ *   node hook-bench.mjs record [--event PreToolUse] [--out <dir>]
+ *
+ *   node hook-bench.mjs run [--payloads <file>] [--todos 10,1000,10000]
+ *                           [--impl mjs,sh,daemon,client] [--events Stop,PreToolUse]
+ *                           [--runs 30] [--concurrency 4] [--stats-lines 100000]
+ *                           [--strace] [--timeout 10000] [--label v2.1]
+ *                           [--json] [--out report.json] [--keep]
+ *
+ *   node hook-bench.mjs compare <old.json> <new.json> [--threshold 10]
+ *
+ * Measurements:
+ *   startup_ms   median time to start and load the hook without real work: .sh
+ *                hooks run with an empty payload (so a wrapper that execs node
+ *                counts Node startup too, see exec_target), mjs imports the entry
+ *                and its handler, daemon imports only the thin entry, client
+ *                runs hook-client.sh (no Node) against the daemon
+ *   p50/p95/p99  wall time per hook invocation at the given concurrency
+ *   max_rss_kb   peak RSS of the hook process tree (probe or getrusage wrapper)
+ *   fs           fs calls made by .mjs hooks (probe), or by any hook under --strace
+ *   syscalls     total syscalls, only with --strace
+ */
+
+import { spawn, spawnSync } from 'child_process';
+import {
+  appendFileSync, existsSync, mkdirSync, mkdtempSync, readFileSync, rmSync, statSync, utimesSync, writeFileSync
+} from 'fs';
+import { dirname, join } from 'path';
+import { homedir, tmpdir, cpus } from 'os';
+import { fileURLToPath, pathToFileURL } from 'url';
+import { isMain, parseArgs } from '../common.mjs';
+import { readStdin } from '../hook-client.mjs';
+
+const BENCH_DIR = dirname(fileURLToPath(import.meta.url));
+const SCRIPTS_DIR = dirname(BENCH_DIR);
+const PROBE = join(BENCH_DIR, 'hook-probe.mjs');
+const CLIENT_SH = join(SCRIPTS_DIR, 'hook-client.sh');
+const DEFAULT_PAYLOADS = join(BENCH_DIR, 'hook-payloads.jsonl');
+const RECORD_DIR = join(homedir(), '.claude', 'hook-bench');
+
+// Stop recording once the payload file reaches this size
+const RECORD_MAX_BYTES = 16 * 1024 * 1024;
+
+// Replayed payloads are rewritten to this session so the seeded data applies
+const BENCH_SESSION = 'hook-bench-session';
+
+// Hook implementations per event
+const HOOKS = [
+  { event: 'UserPromptSubmit', hook: 'keyword-detector', files: { mjs: 'keyword-detector.mjs', sh: 'keyword-detector.sh' } },
+  { event: 'PreToolUse', hook: 'pre-tool-enforcer', files: { mjs: 'pre-tool-enforcer.mjs', sh: 'pre-tool-enforcer.sh' } },
+  { event: 'PostToolUse', hook: 'post-tool-verifier', files: { mjs: 'post-tool-verifier.mjs', sh: 'post-tool-verifier.sh' } },
+  { event: 'PostToolUse', hook: 'context-monitor', files: { mjs: 'context-monitor.mjs', sh: 'context-monitor.sh' } },
+  { event: 'Stop', hook: 'persistent-mode', files: { mjs: 'persistent-mode.mjs', sh: 'persistent-mode.sh' } },
+  { event: 'Stop', hook: 'stop-continuation', files: { sh: 'stop-continuation.sh' } },
+  { event: 'SessionStart', hook: 'session-start', files: { mjs: 'session-start.mjs' } },
+];
+
+const TOOLS = ['Read', 'Edit', 'Bash', 'Grep', 'Glob', 'Write'];
+
+// ---------------------------------------------------------------------------
+// Recording
+
+// Append one hook payload to the recording file and let the hook chain continue
+async function record(args) {
+  try {
+    const stdin = await readStdin();
+    let payload = null;
+    try { payload = JSON.parse(stdin); } catch {}
+    const event = args.event || payload?.hook_event_name || 'unknown';
+    const dir = args.out || RECORD_DIR;
+    const file = join(dir, 'payloads.jsonl');
+    mkdirSync(dir, { recursive: true });
+    if (!existsSync(file) || statSync(file).size < RECORD_MAX_BYTES) {
+      appendFileSync(file, JSON.stringify(payload ? { event, payload } : { event, stdin }) + '\n');
+    }
+  } catch {}
+  console.log(JSON.stringify({ continue: true }));
+}
+
+// ---------------------------------------------------------------------------
+// Fixtures
+
+// Recorded payloads grouped by event, as raw stdin strings pointed at the sandbox
+function loadPayloads(path, sandbox) {
+  const byEvent = {};
+  for (const line of readFileSync(path, 'utf-8').split('\n')) {
+    if (!line.trim()) continue;
+    let entry;
+    try { entry = JSON.parse(line); } catch { continue; }
+
+    let stdin = entry.stdin ?? '';
+    if (entry.payload && typeof entry.payload === 'object') {
+      const payload = { ...entry.payload };
+      for (const key of ['session_id', 'sessionId']) if (key in payload) payload[key] = BENCH_SESSION;
+      for (const key of ['cwd', 'directory']) if (key in payload) payload[key] = sandbox.project;
+      if ('transcript_path' in payload) payload.transcript_path = sandbox.transcript;
+      stdin = JSON.stringify(payload);
+    }
+    (byEvent[entry.event] ||= []).push(stdin);
+  }
+  return byEvent;
+}
+
+// Todo list as written by TodoWrite; every tenth file still has open items
+function todoList(i) {
+  const statuses = i % 10 === 0
+    ? ['pending', 'in_progress', 'completed', 'completed', 'completed']
+    : ['completed', 'completed', 'completed', 'completed', 'completed'];
+  return statuses.map((status, n) => ({
+    content: `Seeded task ${i}.${n}`,
+    status,
+    activeForm: `Working on seeded task ${i}.${n}`,
+    id: `${i}-${n}`,
+  }));
+}
+
+// Build a home directory and project with `todoCount` todo files and a large stats history
+function seedSandbox(root, todoCount, statsLines) {
+  const home = join(root, `home-${todoCount}`);
+  const project = join(root, `project-${todoCount}`);
+  rmSync(home, { recursive: true, force: true });
+  rmSync(project, { recursive: true, force: true });
+
+  const claudeDir = join(home, '.claude');
+  const todosDir = join(claudeDir, 'todos');
+  const statsDir = join(claudeDir, 'session-stats');
+  mkdirSync(todosDir, { recursive: true });
+  mkdirSync(statsDir, { recursive: true });
+  mkdirSync(join(project, '.sisyphus'), { recursive: true });
+
+  // Todo files spread over many sessions and ages (one minute apart)
+  const now = Date.now();
+  for (let i = 0; i < todoCount; i++) {
+    const session = i < 3 ? BENCH_SESSION : `seed-${i % 200}`;
+    const file = join(todosDir, `${session}-agent-${i.toString(16).padStart(8, '0')}.json`);
+    writeFileSync(file, JSON.stringify(todoList(i)));
+    const mtime = new Date(now - i * 60 * 1000);
+    utimesSync(file, mtime, mtime);
+  }
+  writeFileSync(join(project, '.sisyphus', 'todos.json'), JSON.stringify({ todos: todoList(0) }));
+
+  // Append-only stats log for the bench session, compacted up to its end
+  const counts = {};
+  let log = '';
+  const started = now - statsLines * 1000;
+  for (let i = 0; i < statsLines; i++) {
+    const tool = TOOLS[i % TOOLS.length];
+    counts[tool] = (counts[tool] || 0) + 1;
+    log += `${started + i * 1000}\t${tool}\n`;
+  }
+  writeFileSync(join(statsDir, `${BENCH_SESSION}.log`), log);
+  writeFileSync(join(statsDir, `${BENCH_SESSION}.snap.json`), JSON.stringify({
+    offset: Buffer.byteLength(log),
+    tool_counts: counts,
+    total_calls: statsLines,
+    last_tool: TOOLS[(statsLines - 1) % TOOLS.length],
+    started_at: started,
+    updated_at: started + statsLines * 1000,
+  }));
+
+  // Legacy single-file stats, rewritten on every call by post-tool-verifier.sh
+  const sessions = {};
+  for (let s = 0; s < Math.max(1, Math.round(statsLines / 50)); s++) {
+    sessions[`seed-${s}`] = {
+      tool_counts: Object.fromEntries(TOOLS.map(t => [t, 8])),
+      last_tool: 'Read',
+      total_calls: 50,
+      started_at: Math.round(started / 1000),
+      updated_at: Math.round(now / 1000),
+    };
+  }
+  writeFileSync(join(claudeDir, '.session-stats.json'), JSON.stringify({ sessions }, null, 2));
+
+  // Transcript of tool round-trips for hooks that read transcript_path
+  const transcript = join(project, 'transcript.jsonl');
+  let lines = '';
+  for (let i = 0; i < 500; i++) {
+    const tool = TOOLS[i % TOOLS.length];
+    const id = `toolu_${i}`;
+    lines += JSON.stringify({
+      type: 'assistant',
+      message: {
+        role: 'assistant',
+        content: [{ type: 'tool_use', id, name: tool, input: { file_path: `/tmp/project/src/file-${i}.ts` } }],
+        usage: { input_tokens: 12, cache_read_input_tokens: 20000 + i * 150, output_tokens: 80 },
+      },
+    }) + '\n';
+    lines += JSON.stringify({
+      type: 'user',
+      message: { role: 'user', content: [{ type: 'tool_result', tool_use_id: id, content: `seeded output ${i}\n`.repeat(20) }] },
+    }) + '\n';
+  }
+  writeFileSync(transcript, lines);
+
+  return { home, project, transcript };
+}
+
+// ---------------------------------------------------------------------------
+// Process runners
+
+// Interpreter named by a script's shebang line
+function interpreterFor(path) {
+  try {
+    const first = readFileSync(path, 'utf-8').split('\n', 1)[0];
+    if (first.startsWith('#!')) {
+      const parts = first.slice(2).trim().split(/\s+/);
+      return parts[0].endsWith('/env') ? parts.slice(1) : parts;
+    }
+  } catch {}
+  return ['bash'];
+}
+
+// True if `command` can be run
+function available(command) {
+  try {
+    return spawnSync(command, ['--version'], { stdio: 'ignore' }).status === 0;
+  } catch {
+    return false;
+  }
+}
+
+// Spawn once, feed stdin, and time until exit
+function spawnTimed(argv, stdin, { env, cwd, timeoutMs }) {
+  return new Promise((done) => {
+    let stdout = '';
+    let timedOut = false;
+    let settled = false;
+    const begin = process.hrtime.bigint();
+    const finish = (code) => {
+      if (settled) return;
+      settled = true;
+      clearTimeout(timer);
+      done({ ms: Number(process.hrtime.bigint() - begin) / 1e6, code, stdout, timedOut });
+    };
+
+    const child = spawn(argv[0], argv.slice(1), { env, cwd, stdio: ['pipe', 'pipe', 'ignore'] });
+    const timer = setTimeout(() => {
+      timedOut = true;
+      child.kill('SIGKILL');
+    }, timeoutMs);
+    child.stdout.on('data', (chunk) => { stdout += chunk; });
+    child.on('error', () => finish(-1));
+    child.on('close', (code) => finish(code));
+    child.stdin.on('error', () => {});
+    child.stdin.end(stdin);
+  });
+}
+
+// A hook response must be a JSON object on stdout
+function validResponse(result) {
+  if (result.code !== 0 || result.timedOut) return false;
+  try {
+    return typeof JSON.parse(result.stdout) === 'object';
+  } catch {
+    return false;
+  }
+}
+
+// Replay payloads `runs` times with up to `concurrency` hooks in flight
+async function replay(argv, payloads, { runs, concurrency, ...options }) {
+  const samples = [];
+  let errors = 0;
+  let timeouts = 0;
+  let next = 0;
+
+  async function worker() {
+    while (next < runs && timeouts === 0) {
+      const stdin = payloads[next++ % payloads.length];
+      const result = await spawnTimed(argv, stdin, options);
+      if (result.timedOut) {
+        timeouts++;
+        continue;
+      }
+      samples.push(result.ms);
+      if (!validResponse(result)) errors++;
+    }
+  }
+
+  await Promise.all(Array.from({ length: concurrency }, worker));
+  return { samples, errors, timeouts };
+}
+
+// Python wrapper reporting getrusage(RUSAGE_CHILDREN) for the whole process tree
+const RUSAGE_WRAPPER = [
+  'import json, resource, subprocess, sys',
+  'subprocess.run(sys.argv[2:], stdout=subprocess.DEVNULL)',
+  'u = resource.getrusage(resource.RUSAGE_CHILDREN)',
+  "rss = u.ru_maxrss // 1024 if sys.platform == 'darwin' else u.ru_maxrss",
+  "open(sys.argv[1], 'w').write(json.dumps({'max_rss_kb': rss, 'cpu_ms': (u.ru_utime + u.ru_stime) * 1000}))",
+].join('\n');
+
+// Syscall groups taken from `strace -c` output
+const STRACE_GROUPS = {
+  reads: ['read', 'pread64', 'readv'],
+  writes: ['write', 'pwrite64', 'writev', 'rename', 'renameat', 'renameat2', 'unlink', 'unlinkat', 'mkdir', 'mkdirat'],
+  stats: ['stat', 'lstat', 'fstat', 'newfstatat', 'statx', 'access', 'faccessat', 'faccessat2'],
+  dirs: ['getdents', 'getdents64'],
+  opens: ['open', 'openat', 'openat2'],
+};
+
+// Parse the summary table written by `strace -c`
+function parseStrace(text) {
+  const calls = {};
+  let total = 0;
+  for (const line of text.split('\n')) {
+    const parts = line.trim().split(/\s+/);
+    if (parts.length < 5 || !/^\d/.test(parts[0])) continue;
+    const name = parts[parts.length - 1];
+    const count = Number(parts[3]);
+    if (name === 'total') {
+      total = count;
+    } else if (Number.isFinite(count)) {
+      calls[name] = count;
+    }
+  }
+  const fs = {};
+  for (const [group, names] of Object.entries(STRACE_GROUPS)) {
+    fs[group] = names.reduce((sum, n) => sum + (calls[n] || 0), 0);
+  }
+  fs.total = Object.values(fs).reduce((a, b) => a + b, 0);
+  return { syscalls: total, fs };
+}
+
+// Peak RSS, fs counts and syscalls from a few sequential instrumented runs
+async function profile(impl, file, hookArgv, payloads, { runs, strace, scratch, ...options }) {
+  const result = { max_rss_kb: null, cpu_ms: null, fs: null, syscalls: null };
+  const keepMax = (key, value) => {
+    if (value == null) return;
+    result[key] = Math.max(result[key] ?? 0, value);
+  };
+  const keepFs = (fs) => {
+    result.fs ||= {};
+    for (const [k, v] of Object.entries(fs)) result.fs[k] = Math.max(result.fs[k] ?? 0, v);
+  };
+  const shell = impl === 'sh' || impl === 'client';
+  const python = available('python3');
+
+  for (let i = 0; i < runs; i++) {
+    const stdin = payloads[i % payloads.length];
+    const out = join(scratch, `probe-${process.pid}-${i}.json`);
+    rmSync(out, { force: true });
+
+    if (shell) {
+      if (!python) break;
+      await spawnTimed(['python3', '-c', RUSAGE_WRAPPER, out, ...hookArgv], stdin, options);
+    } else {
+      const argv = [process.execPath, '--import', pathToFileURL(PROBE).href, file];
+      await spawnTimed(argv, stdin, { ...options, env: { ...options.env, HOOK_BENCH_PROBE_OUT: out } });
+    }
+    try {
+      const probe = JSON.parse(readFileSync(out, 'utf-8'));
+      keepMax('max_rss_kb', probe.max_rss_kb);
+      keepMax('cpu_ms', probe.cpu_ms);
+      if (probe.fs) keepFs(probe.fs);
+    } catch {}
+
+    if (strace) {
+      const traceOut = join(scratch, `strace-${process.pid}-${i}.txt`);
+      await spawnTimed(['strace', '-f', '-c', '-o', traceOut, ...hookArgv], stdin, options);
+      try {
+        const traced = parseStrace(readFileSync(traceOut, 'utf-8'));
+        keepMax('syscalls', traced.syscalls);
+        // The in-process probe is exact for .mjs hooks; strace covers shell pipelines
+        if (shell) keepFs(traced.fs);
+      } catch {}
+    }
+  }
+
+  if (result.cpu_ms != null) result.cpu_ms = Number(result.cpu_ms.toFixed(2));
+  return result;
+}
+
+// Script a shell hook hands off to with `exec node ...`, if any
+function execTarget(file) {
+  try {
+    return /^\s*exec\s+node\s+"?\$SCRIPT_DIR\/([^"\s]+)/m.exec(readFileSync(file, 'utf-8'))?.[1] || null;
+  } catch {
+    return null;
+  }
+}
+
+/**
+ * Median time to start the hook without doing real work. A shell hook (and
+ * hook-client.sh for client) runs for real on an empty payload, so wrappers
+ * that exec node include Node startup; mjs imports the entry plus its handler
+ * (hooks/<name>.mjs), which is what an in-process run loads; daemon imports
+ * only the entry.
+ */
+async function startupTime(impl, file, hookArgv, hook, { runs, ...options }) {
+  let argv = hookArgv;
+  if (impl === 'mjs' || impl === 'daemon') {
+    const modules = [file];
+    const handler = join(SCRIPTS_DIR, 'hooks', `${hook}.mjs`);
+    if (impl === 'mjs' && existsSync(handler)) modules.push(handler);
+    const imports = modules.map(m => `await import(${JSON.stringify(pathToFileURL(m).href)});`).join(' ');
+    argv = [process.execPath, '--input-type=module', '-e', imports];
+  }
+  const samples = [];
+  for (let i = 0; i < runs; i++) samples.push((await spawnTimed(argv, '', options)).ms);
+  return percentile(samples.sort((a, b) => a - b), 50);
+}
+
+// Start a hook daemon bound to the sandbox and wait for its socket
+async function startDaemon(env, socket) {
+  const child = spawn(process.execPath, [join(SCRIPTS_DIR, 'hook-daemon.mjs'), 'serve'], { env, stdio: 'ignore' });
+  for (let i = 0; i < 100 && !existsSync(socket); i++) {
+    await new Promise(r => setTimeout(r, 30));
+  }
+  return child;
+}
+
+// Peak RSS of a running process (Linux only)
+function processPeakRss(pid) {
+  try {
+    const match = readFileSync(`/proc/${pid}/status`, 'utf-8').match(/VmHWM:\s+(\d+)/);
+    return match ? Number(match[1]) : null;
+  } catch {
+    return null;
+  }
+}
+
+// ---------------------------------------------------------------------------
+// Reporting
+
+// Nearest-rank percentile of a sorted array
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  const rank = Math.ceil((p / 100) * sorted.length) - 1;
+  return sorted[Math.min(sorted.length - 1, Math.max(0, rank))];
+}
+
+const round = (value) => (value == null ? null : Number(value.toFixed(3)));
+
+function printTable(report) {
+  const columns = [
+    ['event', 18], ['hook', 20], ['impl', 8], ['todos', 7], ['ok', 9], ['startup', 9],
+    ['p50', 9], ['p95', 9], ['p99', 9], ['rss KB', 9], ['fs ops', 8], ['syscalls', 9],
+  ];
+  console.log(columns.map(([name, width]) => name.padEnd(width)).join(''));
+  for (const r of report.results) {
+    const cells = [
+      r.event, r.hook, r.impl, r.todos,
+      r.timeouts ? 'TIMEOUT' : `${r.runs - r.errors}/${r.runs}`,
+      r.startup_ms, r.p50_ms, r.p95_ms, r.p99_ms,
+      r.max_rss_kb, r.fs?.total, r.syscalls,
+    ];
+    console.log(cells.map((cell, i) => String(cell ?? '-').padEnd(columns[i][1])).join(''));
+  }
+}
+
+
+const list = (value, fallback) => (typeof value === 'string' ? value.split(',').map(s => s.trim()).filter(Boolean) : fallback);
+
+// ---------------------------------------------------------------------------
+// Commands
+
+async function run(args) {
+  const options = {
+    payloads: typeof args.payloads === 'string' ? args.payloads : DEFAULT_PAYLOADS,
+    todos: list(args.todos, ['10', '1000', '10000']).map(Number),
+    impls: list(args.impl, ['mjs', 'sh']),
+    events: list(args.events, null),
+    runs: Number(args.runs) || 30,
+    concurrency: Number(args.concurrency) || 4,
+    statsLines: Number(args['stats-lines']) || 100000,
+    profileRuns: Number(args['profile-runs']) || 3,
+    startupRuns: Number(args['startup-runs']) || 10,
+    timeoutMs: Number(args.timeout) || 10000,
+    strace: Boolean(args.strace),
+  };
+  if (options.strace && !available('strace')) {
+    console.error('strace not found; syscall counts disabled');
+    options.strace = false;
+  }
+  if (process.platform === 'win32') {
+    options.impls = options.impls.filter(i => i !== 'daemon' && i !== 'client');
+  }
+
+  const root = mkdtempSync(join(tmpdir(), 'sisyphus-hook-bench-'));
+  const scratch = join(root, 'scratch');
+  mkdirSync(scratch);
+  const results = [];
+
+  try {
+    for (const todos of options.todos) {
+      const sandbox = seedSandbox(root, todos, options.statsLines);
+      const payloads = loadPayloads(options.payloads, sandbox);
+      const baseEnv = { ...process.env, HOME: sandbox.home, USERPROFILE: sandbox.home, SISYPHUS_HOOKD: '0' };
+      const socket = join(root, `hookd-${todos}.sock`);
+      let daemon = null;
+
+      for (const impl of options.impls) {
+        let env = baseEnv;
+        if (impl === 'daemon' || impl === 'client') {
+          env = { ...baseEnv, SISYPHUS_HOOKD: '1', SISYPHUS_HOOKD_SOCKET: socket };
+          daemon = await startDaemon(env, socket);
+        }
+        const spawnOptions = { env, cwd: sandbox.project, timeoutMs: options.timeoutMs };
+
+        for (const spec of HOOKS) {
+          const file = spec.files[impl === 'daemon' || impl === 'client' ? 'mjs' : impl];
+          const inputs = payloads[spec.event];
+          if (!file || !inputs?.length) continue;
+          if (options.events && !options.events.includes(spec.event)) continue;
+
+          const path = join(SCRIPTS_DIR, file);
+          const argv = impl === 'sh' ? [...interpreterFor(path), path]
+            : impl === 'client' ? ['bash', CLIENT_SH, spec.hook]
+              : [process.execPath, path];
+          const row = { event: spec.event, hook: spec.hook, impl, todos, runs: 0, errors: 0, timeouts: 0 };
+
+          // Warm the page cache (and the daemon) before timing
+          const warm = await spawnTimed(argv, inputs[0], spawnOptions);
+          if (warm.timedOut) {
+            results.push({ ...row, timeouts: 1 });
+            if (!args.json) console.error(`${spec.hook} (${impl}, ${todos} todos): timed out, skipped`);
+            continue;
+          }
+
+          const replayed = await replay(argv, inputs, { runs: options.runs, concurrency: options.concurrency, ...spawnOptions });
+          const sorted = replayed.samples.sort((a, b) => a - b);
+          const resources = await profile(impl, path, argv, inputs, {
+            runs: options.profileRuns, strace: options.strace, scratch, ...spawnOptions,
+          });
+
+          results.push({
+            ...row,
+            runs: sorted.length,
+            errors: replayed.errors,
+            timeouts: replayed.timeouts,
+            startup_ms: round(await startupTime(impl, path, argv, spec.hook, { runs: options.startupRuns, ...spawnOptions })),
+            ...(impl === 'sh' && execTarget(path) ? { exec_target: execTarget(path) } : {}),
+            p50_ms: round(percentile(sorted, 50)),
+            p95_ms: round(percentile(sorted, 95)),
+            p99_ms: round(percentile(sorted, 99)),
+            mean_ms: round(sorted.reduce((a, b) => a + b, 0) / (sorted.length || 1)),
+            ...resources,
+          });
+          if (!args.json) console.error(`${spec.hook} (${impl}, ${todos} todos): p50 ${round(percentile(sorted, 50))} ms`);
+        }
+
+        if (daemon) {
+          const rss = processPeakRss(daemon.pid);
+          for (const r of results) if (r.impl === impl && r.todos === todos) r.daemon_rss_kb = rss;
+          daemon.kill('SIGTERM');
+          daemon = null;
+        }
+      }
+    }
+  } finally {
+    if (!args.keep) rmSync(root, { recursive: true, force: true });
+  }
+
+  const report = {
+    label: typeof args.label === 'string' ? args.label : null,
+    created_at: new Date().toISOString(),
+    node: process.version,
+    platform: `${process.platform}-${process.arch}`,
+    cpus: cpus().length,
+    options,
+    results,
+  };
+
+  if (typeof args.out === 'string') writeFileSync(args.out, JSON.stringify(report, null, 2) + '\n');
+  if (args.json) {
+    console.log(JSON.stringify(report, null, 2));
+  } else {
+    printTable(report);
+    if (args.keep) console.log(`\nsandbox kept at ${root}`);
+  }
+}
+
+// Compare two reports and flag p95/RSS regressions beyond the threshold (percent)
+function compare(args) {
+  const [oldPath, newPath] = args._;
+  if (!oldPath || !newPath) {
+    console.error('usage: hook-bench.mjs compare <old.json> <new.json> [--threshold 10]');
+    process.exitCode = 1;
+    return;
+  }
+  const threshold = Number(args.threshold) || 10;
+  const key = (r) => `${r.event}/${r.hook}/${r.impl}/${r.todos}`;
+  const before = new Map(JSON.parse(readFileSync(oldPath, 'utf-8')).results.map(r => [key(r), r]));
+  const after = JSON.parse(readFileSync(newPath, 'utf-8')).results;
+
+  const change = (a, b) => (a && b != null ? Number((((b - a) / a) * 100).toFixed(1)) : null);
+  const rows = [];
+  for (const r of after) {
+    const old = before.get(key(r));
+    if (!old) continue;
+    const p95 = change(old.p95_ms, r.p95_ms);
+    const rss = change(old.max_rss_kb, r.max_rss_kb);
+    rows.push({
+      case: key(r),
+      p50_ms: [old.p50_ms, r.p50_ms],
+      p95_ms: [old.p95_ms, r.p95_ms],
+      p95_change_pct: p95,
+      rss_change_pct: rss,
+      regression: (p95 ?? 0) > threshold || (rss ?? 0) > threshold,
+    });
+  }
+
+  if (args.json) {
+    console.log(JSON.stringify({ threshold_pct: threshold, rows }, null, 2));
+  } else {
+    for (const row of rows) {
+      const flag = row.regression ? 'REGRESSION' : '';
+      console.log(`${row.case.padEnd(48)} p95 ${row.p95_ms[0]} -> ${row.p95_ms[1]} ms (${row.p95_change_pct ?? '-'}%)  rss ${row.rss_change_pct ?? '-'}%  ${flag}`);
+    }
+  }
+  process.exitCode = rows.some(r => r.regression) ? 1 : 0;
+}
+
+async function main() {
+  const command = process.argv[2] || 'run';
+  const args = parseArgs(process.argv.slice(3));
+
+  switch (command) {
+    case 'record':
+      await record(args);
+      break;
+
+    case 'run':
+      await run(args);
+      break;
+
+    case 'compare':
+      compare(args);
+      break;
+
+    default:
+      console.error(`unknown command: ${command}`);
+      console.error('usage: hook-bench.mjs record | run [options] | compare <old.json> <new.json>');
+      process.exitCode = 1;
+  }
+}
+
+if (isMain(import.meta.url)) {
+  main();
+}
@@ -0,0 +1,52 @@
+/**
+ * Hook Benchmark Probe (Node.js)
+ * Preloaded with `node --import` by hook-bench.mjs. Counts synchronous fs
+ * calls made by the hook and writes them, together with peak RSS and CPU
+ * time, to $HOOK_BENCH_PROBE_OUT when the process exits.
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+import fs from 'fs';
+import { syncBuiltinESMExports } from 'module';
+
+const OUT = process.env.HOOK_BENCH_PROBE_OUT;
+
+// fs functions grouped the way the report shows them
+const GROUPS = {
+  reads: ['readFileSync', 'readSync'],
+  writes: ['writeFileSync', 'appendFileSync', 'writeSync', 'renameSync', 'unlinkSync', 'mkdirSync'],
+  stats: ['statSync', 'lstatSync', 'fstatSync', 'existsSync'],
+  dirs: ['readdirSync'],
+  opens: ['openSync'],
+};
+
+const counts = {};
+const writeFileSync = fs.writeFileSync;
+
+if (OUT) {
+  for (const [group, names] of Object.entries(GROUPS)) {
+    counts[group] = 0;
+    for (const name of names) {
+      const original = fs[name];
+      if (typeof original !== 'function') continue;
+      fs[name] = function (...args) {
+        counts[group]++;
+        return original.apply(this, args);
+      };
+    }
+  }
+  // Make `import { readFileSync } from 'fs'` see the counting wrappers
+  syncBuiltinESMExports();
+
+  process.on('exit', () => {
+    const usage = process.resourceUsage();
+    const total = Object.values(counts).reduce((a, b) => a + b, 0);
+    try {
+      writeFileSync(OUT, JSON.stringify({
+        max_rss_kb: usage.maxRSS,
+        cpu_ms: (usage.userCPUTime + usage.systemCPUTime) / 1000,
+        fs: { ...counts, total },
+      }));
+    } catch {}
+  });
+}
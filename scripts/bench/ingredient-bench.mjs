@@ -0,0 +1,227 @@
+#!/usr/bin/env node
+
+/**
+ * Ingredient Index Benchmark
+ * Generates a synthetic formulation repository (JSON formulas, markdown
+ * formulation tables, skill notes and reports), builds the ingredient index
+ * and compares query latency and output size against the ingredient-explorer
+ * Grep strategy (one synonym alternation over json + md files). Also reports
+ * how many of the grep-matched lines the index finds.
+ *
+ * Usage: node scripts/bench/ingredient-bench.mjs [--files 2000] [--runs 15] [--root <dir>] [--keep] [--json]
+ *   --root   benchmark an existing repository instead of a generated one
+ */
+
+import { mkdtempSync, mkdirSync, writeFileSync, rmSync, utimesSync } from 'fs';
+import { spawnSync } from 'child_process';
+import { join, resolve } from 'path';
+import { tmpdir } from 'os';
+import { fileURLToPath } from 'url';
+import { parseArgs } from '../common.mjs';
+import { loadSynonyms, refreshIndex, queryIndex, resolveTerm } from '../ingredient-index.mjs';
+
+const CLI = fileURLToPath(new URL('../ingredient-index.mjs', import.meta.url));
+
+// Query terms: INCI, Korean, English synonym, partial and CAS lookups
+const TERMS = ['Niacinamide', '레티놀', 'Vitamin C', 'sodium hyaluronate', '병풀추출물', 'hyaluron', '98-92-0'];
+
+// Deterministic PRNG (mulberry32) so runs are comparable
+function rng(seed) {
+  return () => {
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const FILLER = [
+  '제형 안정성은 40°C 4주 가속 조건에서 확인한다.',
+  'Viscosity was measured at 25°C with spindle 4 at 20 rpm.',
+  'pH 5.5 ± 0.3 범위에서 관리하며 충진 전 재확인한다.',
+  'The emulsion remained homogeneous after three freeze-thaw cycles.',
+  '원료 입고 시 COA와 INCI명을 대조한다.',
+  'Sensory panel scored spreadability 4.2/5 and stickiness 1.8/5.',
+];
+
+// Write `files` synthetic documents under root
+function generateRepo(root, files) {
+  const random = rng(20260217);
+  const pick = (list) => list[Math.floor(random() * list.length)];
+  const { ingredients } = loadSynonyms();
+  const nameOf = (item) => {
+    const names = [item.inci, ...(item.en || []), ...(item.ko || [])];
+    return random() < 0.6 ? item.inci : pick(names);
+  };
+  const pct = () => Number((random() < 0.3 ? random() * 0.5 : random() * 10).toFixed(2));
+  const prose = (lines) => Array.from({ length: lines }, () => (
+    random() < 0.35 ? `${nameOf(pick(ingredients))} ${pct()}% 적용 시 ${pick(FILLER)}` : pick(FILLER)
+  )).join('\n');
+
+  for (let n = 0; n < files; n++) {
+    const kind = n % 10;
+    let path;
+    let text;
+    if (kind < 4) {
+      path = join('formulas', `batch-${Math.floor(n / 200)}`, `formula-${n}.json`);
+      const items = Array.from({ length: 14 }, () => ({ inci: pick(ingredients).inci, percent: pct(), phase: pick(['A', 'B', 'C']) }));
+      text = JSON.stringify({ id: `F-${n}`, product: `Serum ${n}`, ingredients: items }, null, 2);
+    } else if (kind < 7) {
+      path = join('docs', `line-${Math.floor(n / 300)}`, `product-${n}-formulation.md`);
+      const rows = Array.from({ length: 16 }, () => {
+        const item = pick(ingredients);
+        return `| ${item.inci} | ${item.ko?.[0] || ''} | ${pct()} |`;
+      });
+      text = `# Product ${n}\n\n| INCI | 한글명 | 함량(%) |\n|---|---|---|\n${rows.join('\n')}\n\n## Notes\n${prose(20)}\n`;
+    } else if (kind < 8) {
+      path = join('cosmetic-skills', `skill-${n % 40}`, `ref-${n}.md`);
+      text = `# Reference ${n}\n\n${prose(60)}\n`;
+    } else {
+      path = join('outputs', `2026-0${1 + (n % 9)}`, `report-${n}.md`);
+      text = `# Report ${n}\n\n${prose(80)}\n`;
+    }
+    mkdirSync(join(root, path, '..'), { recursive: true });
+    writeFileSync(join(root, path), text);
+  }
+}
+
+const escapeRegex = (text) => text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+// The Grep alternation the agent would use for a term: every synonym of every match
+function grepPattern(term) {
+  const { ingredients } = loadSynonyms();
+  const names = [];
+  for (const id of resolveTerm(term)) {
+    const item = ingredients[id];
+    names.push(item.inci, item.cas, ...(item.en || []), ...(item.ko || []));
+  }
+  return names.filter(Boolean).map(escapeRegex).join('|');
+}
+
+// ripgrep when installed (what the Grep tool runs), else GNU grep
+function grepCommand(root, pattern) {
+  const rg = spawnSync('rg', ['--version'], { stdio: 'ignore' });
+  if (!rg.error && rg.status === 0) {
+    return ['rg', ['-n', '-i', '--no-heading', '--type', 'json', '--type', 'md', '-e', pattern, root]];
+  }
+  return ['grep', ['-rnEi', '--include=*.json', '--include=*.md', '--exclude-dir=.*', '--exclude-dir=node_modules', pattern, root]];
+}
+
+function stats(samples) {
+  const sorted = [...samples].sort((a, b) => a - b);
+  const at = (p) => sorted[Math.min(sorted.length - 1, Math.floor(p * sorted.length))];
+  return { p50: Number(at(0.5).toFixed(2)), p95: Number(at(0.95).toFixed(2)) };
+}
+
+// Wall time of fn in milliseconds
+function timed(fn) {
+  const begin = process.hrtime.bigint();
+  const value = fn();
+  return [Number(process.hrtime.bigint() - begin) / 1e6, value];
+}
+
+// Wall time and stdout size of a child process, over `runs` runs
+function timeSpawn(command, args, runs, env) {
+  const samples = [];
+  let stdout = '';
+  for (let i = 0; i < runs; i++) {
+    const [ms, result] = timed(() => spawnSync(command, args, { encoding: 'utf-8', env, maxBuffer: 256 * 1024 * 1024 }));
+    samples.push(ms);
+    stdout = result.stdout || '';
+  }
+  return { ...stats(samples), bytes: Buffer.byteLength(stdout), stdout };
+}
+
+
+function main() {
+  const args = parseArgs(process.argv.slice(2));
+  const runs = Number(args.runs) || 15;
+  const files = Number(args.files) || 2000;
+  const generated = typeof args.root !== 'string';
+  const root = generated ? mkdtempSync(join(tmpdir(), 'ingredient-bench-')) : resolve(args.root);
+  const env = { ...process.env, LC_ALL: 'C.UTF-8' };
+
+  try {
+    if (generated) generateRepo(root, files);
+
+    // Index maintenance
+    const [fullMs, full] = timed(() => refreshIndex(root, { full: true }));
+    const [noopMs] = timed(() => refreshIndex(root));
+    const touched = Object.keys(full.meta.files).slice(0, Math.max(1, Math.floor(full.scanned / 100)));
+    const later = new Date(Date.now() + 5000);
+    for (const rel of touched) utimesSync(join(root, rel), later, later);
+    const [incrementalMs, incremental] = timed(() => refreshIndex(root));
+    const build = {
+      files: Object.keys(incremental.meta.files).length,
+      full_ms: Number(fullMs.toFixed(1)),
+      noop_refresh_ms: Number(noopMs.toFixed(1)),
+      incremental_ms: Number(incrementalMs.toFixed(1)),
+      incremental_files: incremental.scanned,
+    };
+
+    const queries = TERMS.map((term) => {
+      const pattern = grepPattern(term);
+      const [command, grepArgs] = grepCommand(root, pattern);
+      const grep = timeSpawn(command, grepArgs, runs, env);
+      const cli = timeSpawn(process.execPath, [CLI, 'query', term, '--root', root], runs, env);
+      const cliRefresh = timeSpawn(process.execPath, [CLI, 'query', term, '--root', root, '--refresh'], runs, env);
+
+      const samples = [];
+      for (let i = 0; i < runs; i++) samples.push(timed(() => queryIndex(root, term, { refresh: false }))[0]);
+      const result = queryIndex(root, term, { limit: Infinity, refresh: false });
+
+      // Lines grep reports that the index also found
+      const grepLines = new Set(grep.stdout.split('\n').filter(Boolean).map((line) => {
+        const rest = line.startsWith(root) ? line.slice(root.length + 1) : line;
+        const match = /^(.*?):(\d+):/.exec(rest);
+        return match ? `${match[1]}:${match[2]}` : rest;
+      }));
+      const indexLines = new Set(result.hits.map(h => `${h.file}:${h.line}`));
+      let common = 0;
+      for (const key of grepLines) if (indexLines.has(key)) common++;
+
+      return {
+        term,
+        grep: { p50: grep.p50, p95: grep.p95, bytes: grep.bytes, lines: grepLines.size },
+        index_cli: { p50: cli.p50, p95: cli.p95, bytes: cli.bytes },
+        index_cli_refresh: { p50: cliRefresh.p50, p95: cliRefresh.p95 },
+        index_in_process: stats(samples),
+        index_lines: indexLines.size,
+        with_pct: result.hits.filter(h => h.pct !== null).length,
+        grep_lines_found: common,
+      };
+    });
+
+    const report = { root: generated ? `(generated, ${files} files)` : root, runs, build, queries };
+    if (args.json) {
+      console.log(JSON.stringify(report, null, 2));
+    } else {
+      console.log(`repo: ${report.root}, index ${build.files} files`);
+      console.log(`build: full ${build.full_ms} ms, no-op refresh ${build.noop_refresh_ms} ms, ${build.incremental_files} touched ${build.incremental_ms} ms`);
+      console.log('');
+      console.log('term'.padEnd(20) + 'grep p50'.padStart(10) + 'cli p50'.padStart(10) + 'cli+r p50'.padStart(12) + 'in-proc'.padStart(10)
+        + 'grep KB'.padStart(10) + 'cli KB'.padStart(9) + 'lines g/i'.padStart(13) + 'found'.padStart(8) + 'w/ %'.padStart(7));
+      for (const q of queries) {
+        console.log(q.term.padEnd(20)
+          + String(q.grep.p50).padStart(10)
+          + String(q.index_cli.p50).padStart(10)
+          + String(q.index_cli_refresh.p50).padStart(12)
+          + String(q.index_in_process.p50).padStart(10)
+          + (q.grep.bytes / 1024).toFixed(1).padStart(10)
+          + (q.index_cli.bytes / 1024).toFixed(1).padStart(9)
+          + `${q.grep.lines}/${q.index_lines}`.padStart(13)
+          + `${Math.round((q.grep_lines_found / Math.max(1, q.grep.lines)) * 100)}%`.padStart(8)
+          + String(q.with_pct).padStart(7));
+      }
+      console.log('');
+      console.log('ms; cli = query within the refresh interval, cli+r = --refresh (mtime walk first); cli KB is the default top-50 report');
+      console.log('lines g/i = lines matched by grep / by the index; found = share of grep lines the index reports');
+      console.log('(grep also matches longer names such as "Ascorbic Acid" inside "3-O-Ethyl Ascorbic Acid")');
+    }
+  } finally {
+    if (generated && !args.keep) rmSync(root, { recursive: true, force: true });
+    else if (generated) console.error(`kept ${root}`);
+  }
+}
+
+main();
@@ -0,0 +1,166 @@
+#!/usr/bin/env node
+
+/**
+ * Keyword Detector Benchmark
+ * Checks that the table-driven detector classifies every prompt in
+ * keyword-corpus.jsonl, and a seeded set of random prompts, exactly like the
+ * previous hard-coded regex implementation, then times both on small prompts
+ * and on large pasted logs. Exits non-zero on any mismatch, or when the
+ * detector is slower than the reference on a log by more than the tolerance.
+ *
+ * Usage: node scripts/bench/keyword-bench.mjs [--fuzz 100000] [--seed 1] [--json]
+ */
+
+import { readFileSync } from 'fs';
+import { detectKeyword } from '../hooks/keyword-detector.mjs';
+
+// Previous implementation, kept verbatim as the reference
+function removeCodeBlocks(text) {
+  return text
+    .replace(/```[\s\S]*?```/g, '')
+    .replace(/`[^`]+`/g, '');
+}
+
+function legacyDetect(prompt) {
+  const cleanPrompt = removeCodeBlocks(prompt).toLowerCase();
+  const koreanUltrawork = /심층분석|tech dna|백서|화이트페이퍼|카피라이팅|K-Dense|k-dense/i.test(prompt);
+  if (/\b(ultrawork|ulw|uw|deep\s*dive|comprehensive\s*analysis)\b/.test(cleanPrompt) || koreanUltrawork) return 'ultrawork';
+  if (/\b(ultrathink|think)\b/.test(cleanPrompt)) return 'think';
+  if (/\b(search|find|locate|lookup|explore|discover|scan|grep|query|browse|detect|trace|seek|track|pinpoint|hunt)\b|where\s+is|show\s+me|list\s+all/.test(cleanPrompt)) return 'search';
+  if (/\b(analyze|analyse|investigate|examine|research|study|deep.?dive|inspect|audit|evaluate|assess|review|diagnose|scrutinize|dissect|debug|comprehend|interpret|breakdown|understand)\b|why\s+is|how\s+does|how\s+to/.test(cleanPrompt)) return 'analyze';
+  return null;
+}
+
+// A slower uncapped scan than the reference by more than this fails the run
+const SLOWDOWN_RATIO = 1.25;
+const SLOWDOWN_SLACK_MS = 0.5;
+
+// Fragments random prompts are assembled from: triggers, near-misses, code markers, odd whitespace
+const FUZZ_PIECES = [
+  'ultrawork', 'ulw', 'uw', 'deep', 'dive', 'deepdive', 'deep dive', 'deep\tdive', 'deepédive', 'deep-dive',
+  'comprehensive', 'analysis', 'think', 'ultrathink', 'search', 'find', 'where', 'is', 'show', 'me', 'list', 'all',
+  'analyze', 'review', 'how', 'to', 'does', 'why', '심층분석', '백서', '카피라이팅', 'tech', 'dna', 'tech dna', 'Tech\tDNA',
+  'K-Dense', 'k-dense', '`', '``', '```', '\n', ' ', '  ', '\t', '\u00a0', '_', '-', 'é', 'x', 'İ', 'ſ', '\u212a',
+];
+
+// Deterministic PRNG (mulberry32) so fuzz runs are reproducible
+function rng(seed) {
+  return () => {
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+// Random prompts compared against the reference; returns the disagreements
+function fuzz(count, seed) {
+  const random = rng(seed);
+  const found = [];
+  for (let n = 0; n < count; n++) {
+    let prompt = '';
+    const pieces = 1 + Math.floor(random() * 8);
+    for (let k = 0; k < pieces; k++) prompt += FUZZ_PIECES[Math.floor(random() * FUZZ_PIECES.length)];
+    const legacy = legacyDetect(prompt);
+    const compiled = detectKeyword(prompt, Infinity);
+    if (legacy !== compiled) found.push({ prompt, legacy, compiled });
+  }
+  return found;
+}
+
+// Median wall time of fn over `runs` runs, in milliseconds
+function time(fn, runs) {
+  const samples = [];
+  for (let i = 0; i < runs; i++) {
+    const begin = process.hrtime.bigint();
+    fn();
+    samples.push(Number(process.hrtime.bigint() - begin) / 1e6);
+  }
+  samples.sort((a, b) => a - b);
+  return samples[Math.floor(samples.length / 2)];
+}
+
+// A pasted log of roughly `bytes` bytes with code fences and a keyword near the end
+function syntheticLog(bytes, keyword) {
+  const line = '2026-02-19T10:15:03Z INFO batch=ORX-221 viscosity=12450cP pH=5.6 status=ok `tmp`\n';
+  const block = '```\n' + line.repeat(20) + '```\n';
+  let text = '';
+  while (text.length < bytes) text += line.repeat(50) + block;
+  return text + `\nplease ${keyword} this\n`;
+}
+
+// Value following `flag` on the command line
+function argValue(flag) {
+  const at = process.argv.indexOf(flag);
+  return at === -1 ? undefined : process.argv[at + 1];
+}
+
+function main() {
+  const asJson = process.argv.includes('--json');
+  const corpus = readFileSync(new URL('./keyword-corpus.jsonl', import.meta.url), 'utf-8')
+    .split('\n').filter(Boolean).map(line => JSON.parse(line));
+
+  const mismatches = [];
+  for (const { prompt, expected } of corpus) {
+    const legacy = legacyDetect(prompt);
+    const compiled = detectKeyword(prompt, Infinity);
+    if (legacy !== compiled || (expected !== undefined && expected !== compiled)) {
+      mismatches.push({ prompt, expected, legacy, compiled });
+    }
+  }
+
+  const fuzzCount = Number(argValue('--fuzz') ?? 100000);
+  const fuzzMismatches = fuzz(fuzzCount, Number(argValue('--seed') ?? 1));
+
+  const cases = [
+    { name: 'corpus (all prompts)', runs: 200, legacy: () => corpus.forEach(c => legacyDetect(c.prompt)), compiled: () => corpus.forEach(c => detectKeyword(c.prompt)) },
+  ];
+  for (const size of [64 * 1024, 1024 * 1024, 2 * 1024 * 1024]) {
+    for (const keyword of ['analyze', 'nothing']) {
+      const text = syntheticLog(size, keyword);
+      cases.push({
+        name: `log ${Math.round(size / 1024)} KiB, ${keyword === 'nothing' ? 'no keyword' : 'keyword at end'}`,
+        runs: size > 100000 ? 10 : 50,
+        legacy: () => legacyDetect(text),
+        compiled: () => detectKeyword(text, Infinity),
+        capped: () => detectKeyword(text),
+      });
+    }
+  }
+
+  const timings = cases.map(c => ({
+    case: c.name,
+    legacy_ms: Number(time(c.legacy, c.runs).toFixed(3)),
+    compiled_ms: Number(time(c.compiled, c.runs).toFixed(3)),
+    capped_ms: c.capped ? Number(time(c.capped, c.runs).toFixed(3)) : null,
+  }));
+
+  const slowdowns = timings.filter(t => t.case.startsWith('log ') && t.compiled_ms > t.legacy_ms * SLOWDOWN_RATIO + SLOWDOWN_SLACK_MS);
+
+  const report = {
+    corpus_size: corpus.length,
+    mismatches,
+    fuzz: { prompts: fuzzCount, mismatches: fuzzMismatches.length, examples: fuzzMismatches.slice(0, 20) },
+    timings,
+    slowdowns: slowdowns.map(t => t.case),
+  };
+  if (asJson) {
+    console.log(JSON.stringify(report, null, 2));
+  } else {
+    console.log(`corpus: ${corpus.length} prompts, ${mismatches.length} mismatches`);
+    for (const m of mismatches) console.log(`  MISMATCH ${JSON.stringify(m)}`);
+    console.log(`fuzz: ${fuzzCount} random prompts, ${fuzzMismatches.length} mismatches`);
+    for (const m of fuzzMismatches.slice(0, 20)) console.log(`  MISMATCH ${JSON.stringify(m)}`);
+    console.log('');
+    console.log('case'.padEnd(36) + 'legacy ms'.padStart(12) + 'compiled ms'.padStart(14) + 'capped ms'.padStart(12));
+    for (const t of timings) {
+      console.log(t.case.padEnd(36) + String(t.legacy_ms).padStart(12) + String(t.compiled_ms).padStart(14) + String(t.capped_ms ?? '-').padStart(12));
+    }
+    for (const t of slowdowns) {
+      console.log(`SLOWDOWN ${t.case}: ${t.compiled_ms} ms vs ${t.legacy_ms} ms (limit ${SLOWDOWN_RATIO}x + ${SLOWDOWN_SLACK_MS} ms)`);
+    }
+  }
+  process.exitCode = mismatches.length || fuzzMismatches.length || slowdowns.length ? 1 : 0;
+}
+
+main();
@@ -0,0 +1,47 @@
+#!/bin/bash
+# Oh-My-Claude-Sisyphus Manifest Builder
+# Regenerates scripts/install/MANIFEST (sha256 + path of every agent, command
+# and hook source file). Run after editing anything under scripts/install/, or
+# any of the SHARED_SCRIPTS below.
+#
+# Usage: scripts/build-manifest.sh [--check]
+#   --check   exit 1 if MANIFEST is out of date instead of rewriting it
+
+set -e
+
+SCRIPTS_DIR="$(cd "$(dirname "$0")" && pwd)"
+INSTALL_DIR="$SCRIPTS_DIR/install"
+cd "$INSTALL_DIR"
+
+# CLIs the agents run, installed to ~/.claude/sisyphus/ (with their imports).
+# They are hashed and copied from scripts/ itself, not from install/.
+SHARED_SCRIPTS="ingredient-index.mjs keyword-matcher.mjs common.mjs ingredient-synonyms.json"
+
+if command -v sha256sum &> /dev/null; then
+  HASH_CMD="sha256sum"
+elif command -v shasum &> /dev/null; then
+  HASH_CMD="shasum -a 256"
+else
+  echo "sha256sum or shasum is required" >&2
+  exit 1
+fi
+
+TMP_MANIFEST="MANIFEST.tmp.$$"
+{
+  find agents commands hooks -type f | LC_ALL=C sort | xargs $HASH_CMD
+  (cd "$SCRIPTS_DIR" && printf '%s\n' $SHARED_SCRIPTS | LC_ALL=C sort | xargs $HASH_CMD) | sed 's#  #  sisyphus/#'
+} > "$TMP_MANIFEST"
+
+if [ "$1" = "--check" ]; then
+  if cmp -s "$TMP_MANIFEST" MANIFEST; then
+    rm -f "$TMP_MANIFEST"
+    echo "MANIFEST is up to date"
+    exit 0
+  fi
+  rm -f "$TMP_MANIFEST"
+  echo "MANIFEST is out of date; run scripts/build-manifest.sh" >&2
+  exit 1
+fi
+
+mv -f "$TMP_MANIFEST" MANIFEST
+echo "Wrote $(wc -l < MANIFEST | tr -d ' ') entries to $INSTALL_DIR/MANIFEST"
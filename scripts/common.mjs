@@ -0,0 +1,93 @@
+/**
+ * Sisyphus Common Helpers (Node.js)
+ * Small dependency-free helpers shared by the hooks, CLIs and agent tools:
+ * entry-point detection, CLI argument parsing, atomic JSON writes and the
+ * throttled expiry sweep.
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+import {
+  existsSync, mkdirSync, readdirSync, renameSync, statSync, unlinkSync, utimesSync, writeFileSync
+} from 'fs';
+import { dirname, join, resolve } from 'path';
+import { fileURLToPath } from 'url';
+
+// Minimum time between two directory scans of sweepDir
+const SWEEP_INTERVAL_MS = 60 * 60 * 1000;
+
+// True when the module at metaUrl is the script node was started with
+export function isMain(metaUrl) {
+  if (!process.argv[1]) return false;
+  try {
+    return resolve(process.argv[1]) === fileURLToPath(metaUrl);
+  } catch {
+    return false;
+  }
+}
+
+// Parse `--flag value` pairs; other arguments are collected in `_`
+export function parseArgs(argv) {
+  const args = { _: [] };
+  for (let i = 0; i < argv.length; i++) {
+    if (!argv[i].startsWith('--')) {
+      args._.push(argv[i]);
+      continue;
+    }
+    const key = argv[i].slice(2);
+    const next = argv[i + 1];
+    if (next === undefined || next.startsWith('--')) {
+      args[key] = true;
+    } else {
+      args[key] = next;
+      i++;
+    }
+  }
+  return args;
+}
+
+// Write JSON with write-then-rename so readers never see a partial file; false on failure
+export function writeJsonAtomic(path, data, { space } = {}) {
+  try {
+    mkdirSync(dirname(path), { recursive: true });
+    const tmp = `${path}.${process.pid}.tmp`;
+    writeFileSync(tmp, JSON.stringify(data, null, space));
+    renameSync(tmp, path);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+// Delete files in dir whose name passes `match` and that are older than
+// maxAgeMs, at most once an hour (throttled through a .last-sweep marker
+// file's mtime). `onRemove(path)` cleans up files tied to a removed one.
+// Returns the removed names.
+export function sweepDir(dir, { maxAgeMs, match, onRemove, force = false }) {
+  const marker = join(dir, '.last-sweep');
+  const now = Date.now();
+  try {
+    if (!force && now - statSync(marker).mtimeMs < SWEEP_INTERVAL_MS) return [];
+  } catch {}
+
+  const removed = [];
+  try {
+    if (existsSync(marker)) {
+      utimesSync(marker, new Date(now), new Date(now));
+    } else {
+      writeFileSync(marker, '');
+    }
+
+    const cutoff = now - maxAgeMs;
+    for (const name of readdirSync(dir)) {
+      if (!match(name)) continue;
+      const path = join(dir, name);
+      try {
+        if (statSync(path).mtimeMs >= cutoff) continue;
+        unlinkSync(path);
+        if (onRemove) onRemove(path);
+        removed.push(name);
+      } catch {}
+    }
+  } catch {}
+  return removed;
+}
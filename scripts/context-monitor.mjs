@@ -0,0 +1,15 @@
+#!/usr/bin/env node
+
+/**
+ * PostToolUse Hook: Context Monitor (Node.js)
+ * Entry point: hands the payload to the hook daemon and loads the handler
+ * (hooks/context-monitor.mjs) only when it has to run in-process.
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+import { isMain } from './common.mjs';
+import { runHook } from './hook-client.mjs';
+
+if (isMain(import.meta.url)) {
+  runHook('context-monitor', () => import('./hooks/context-monitor.mjs'));
+}
@@ -2,6 +2,13 @@
 # context-monitor.sh — 컨텍스트 사용량 추적 (PostToolUse hook)
 # 장시간 작업 시 컨텍스트 한도 접근 경고
 
+# Prefer the Node.js meter (per-session token estimate from the transcript tail)
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+if command -v node &> /dev/null && [ -f "$SCRIPT_DIR/context-monitor.mjs" ]; then
+  . "$SCRIPT_DIR/hook-client.sh" context-monitor
+fi
+
+# Fallback without Node.js: global tool-call counter
 INPUT=$(cat)
 
 # Track invocation count in a state file
@@ -0,0 +1,103 @@
+/**
+ * Sisyphus Hook Client (Node.js)
+ * Shared entry point for hook scripts: forwards the hook payload to the
+ * resident hook daemon when it is running, otherwise loads the handler from
+ * hooks/ and runs it in-process.
+ * Cross-platform: Windows, macOS, Linux (the daemon itself is Unix-socket only)
+ */
+
+import { createConnection } from 'net';
+import { join } from 'path';
+import { homedir } from 'os';
+
+// Per-user daemon socket
+export const SOCKET_PATH = process.env.SISYPHUS_HOOKD_SOCKET
+  || join(homedir(), '.claude', '.sisyphus-hookd.sock');
+
+// How long a hook waits for the daemon's reply (only a failed connection falls back to in-process)
+export const DAEMON_TIMEOUT_MS = Number(process.env.SISYPHUS_HOOKD_TIMEOUT_MS) || 2000;
+
+// Read all stdin
+export async function readStdin() {
+  const chunks = [];
+  for await (const chunk of process.stdin) {
+    chunks.push(chunk);
+  }
+  return Buffer.concat(chunks).toString('utf-8');
+}
+
+/**
+ * Send one request line to the daemon and resolve with its parsed reply.
+ * Resolves null when the daemon could not be reached (nothing was sent), and
+ * { ok: false, sent: true } when the request went out but no reply came back.
+ */
+export function requestDaemon(request, timeoutMs = DAEMON_TIMEOUT_MS) {
+  return new Promise((done) => {
+    if (process.platform === 'win32') {
+      done(null);
+      return;
+    }
+
+    let buffer = '';
+    let sent = false;
+    let settled = false;
+    const finish = (value) => {
+      if (settled) return;
+      settled = true;
+      socket.destroy();
+      done(value ?? (sent ? { ok: false, sent: true } : null));
+    };
+
+    const socket = createConnection(SOCKET_PATH);
+    socket.setTimeout(timeoutMs, () => finish(null));
+    socket.on('error', () => finish(null));
+    socket.on('connect', () => {
+      sent = true;
+      socket.write(JSON.stringify(request) + '\n');
+    });
+    socket.on('data', (chunk) => {
+      buffer += chunk.toString('utf-8');
+      const newline = buffer.indexOf('\n');
+      if (newline === -1) return;
+      try {
+        finish(JSON.parse(buffer.slice(0, newline)));
+      } catch {
+        finish(null);
+      }
+    });
+    socket.on('end', () => finish(null));
+  });
+}
+
+/**
+ * Run a hook: try the daemon first, fall back to the in-process handler.
+ * `load` imports the handler module ({ handle }); it is only called on the
+ * fallback path, so a daemon-served hook loads nothing but this file.
+ */
+export async function runHook(name, load, { indent } = {}) {
+  let response = null;
+  try {
+    const input = await readStdin();
+    const context = { cwd: process.cwd() };
+
+    if (process.env.SISYPHUS_HOOKD !== '0') {
+      const reply = await requestDaemon({ hook: name, input, context });
+      if (reply?.ok) {
+        response = reply.response;
+      } else if (reply?.sent) {
+        // The daemon may still be running the handler; running it here too would apply its state changes twice
+        response = { continue: true };
+      }
+    }
+
+    if (!response) {
+      const { handle } = await load();
+      response = handle(input, context);
+    }
+  } catch {
+    // On any error, allow continuation
+    response = { continue: true };
+  }
+
+  console.log(JSON.stringify(response, null, indent));
+}
@@ -0,0 +1,52 @@
+#!/bin/bash
+# Sisyphus Hook Client (shell)
+# Hook entry point that reaches the hook daemon without starting Node: the
+# payload goes to the daemon's Unix socket through socat (or perl when socat
+# is missing) and the reply is printed as the hook response. When no daemon
+# is listening it execs the Node.js entry point (scripts/<hook>.mjs).
+#
+# Usage (hook command):   bash hook-client.sh <hook>
+# From a .sh wrapper:     . "$SCRIPT_DIR/hook-client.sh" <hook>   (never returns)
+#
+# Hooks: keyword-detector, pre-tool-enforcer, post-tool-verifier,
+#        persistent-mode, session-start, context-monitor
+
+HOOKD_HOOK="$1"
+HOOKD_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+HOOKD_SOCKET="${SISYPHUS_HOOKD_SOCKET:-$HOME/.claude/.sisyphus-hookd.sock}"
+HOOKD_TIMEOUT_MS="${SISYPHUS_HOOKD_TIMEOUT_MS:-2000}"
+HOOKD_TIMEOUT="$((HOOKD_TIMEOUT_MS / 1000)).$(printf '%03d' $((HOOKD_TIMEOUT_MS % 1000)))"
+
+# Send stdin to the daemon and print its reply. Exits 3 (nothing sent) when
+# the socket does not accept connections; an empty reply means it timed out.
+hookd_send() {
+  if command -v socat &> /dev/null; then
+    socat -T "$HOOKD_TIMEOUT" -t "$HOOKD_TIMEOUT" - "UNIX-CONNECT:$HOOKD_SOCKET" 2>/dev/null || return 3
+  elif command -v perl &> /dev/null; then
+    perl -MIO::Socket::UNIX -MTime::HiRes=alarm -e '
+      my $socket = IO::Socket::UNIX->new(Peer => $ARGV[0]) or exit 3;
+      local $/;
+      print $socket scalar(<STDIN>);
+      shutdown($socket, 1);
+      my $reply = "";
+      eval { local $SIG{ALRM} = sub { die "timeout\n" }; alarm $ARGV[1]; $reply = <$socket> // ""; alarm 0 };
+      print $reply;
+    ' "$HOOKD_SOCKET" "$HOOKD_TIMEOUT"
+  else
+    return 3
+  fi
+}
+
+if [ "$SISYPHUS_HOOKD" != "0" ] && [ -S "$HOOKD_SOCKET" ]; then
+  HOOKD_INPUT=$(cat)
+  # JSON payloads stay valid with their line breaks folded to spaces
+  if HOOKD_REPLY=$({ printf '%s\t%s\t' "$HOOKD_HOOK" "$PWD"; printf '%s' "$HOOKD_INPUT" | tr '\r\n' '  '; printf '\n'; } | hookd_send); then
+    # Sent but no reply: the daemon may still run the hook, so never run it here too
+    [ -n "$HOOKD_REPLY" ] || HOOKD_REPLY='{"continue": true}'
+    printf '%s\n' "$HOOKD_REPLY"
+    exit 0
+  fi
+  SISYPHUS_HOOKD=0 exec node "$HOOKD_DIR/$HOOKD_HOOK.mjs" <<< "$HOOKD_INPUT"
+fi
+
+exec node "$HOOKD_DIR/$HOOKD_HOOK.mjs"
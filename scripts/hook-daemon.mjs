@@ -0,0 +1,258 @@
+#!/usr/bin/env node
+
+/**
+ * Sisyphus Hook Daemon (Node.js)
+ * Optional resident hook server: loads the hook handlers once and answers
+ * hook requests over a per-user Unix socket, tracking per-hook latency.
+ * Platforms: macOS, Linux (hooks run in-process on Windows)
+ *
+ * Protocol: one JSON request per line ({ hook, input, context } or { cmd }),
+ * answered by one JSON reply line. hook-client.sh sends `<hook>\t<cwd>\t<payload>`
+ * instead and gets the bare hook response, after which the socket is closed.
+ *
+ * Usage:
+ *   node hook-daemon.mjs start     # start in the background
+ *   node hook-daemon.mjs serve     # run in the foreground
+ *   node hook-daemon.mjs stop
+ *   node hook-daemon.mjs status
+ *   node hook-daemon.mjs stats     # per-hook p50/p99 latency as JSON
+ */
+
+import { createServer } from 'net';
+import { spawn } from 'child_process';
+import { existsSync, mkdirSync, unlinkSync, chmodSync } from 'fs';
+import { dirname } from 'path';
+import { fileURLToPath } from 'url';
+import { isMain } from './common.mjs';
+import { DAEMON_TIMEOUT_MS, SOCKET_PATH, requestDaemon } from './hook-client.mjs';
+import { setLockTimeout } from './state-store.mjs';
+import { handle as keywordDetector } from './hooks/keyword-detector.mjs';
+import { handle as persistentMode } from './hooks/persistent-mode.mjs';
+import { handle as preToolEnforcer } from './hooks/pre-tool-enforcer.mjs';
+import { handle as postToolVerifier } from './hooks/post-tool-verifier.mjs';
+import { handle as sessionStart } from './hooks/session-start.mjs';
+import { handle as contextMonitor } from './hooks/context-monitor.mjs';
+
+const HANDLERS = {
+  'keyword-detector': keywordDetector,
+  'persistent-mode': persistentMode,
+  'pre-tool-enforcer': preToolEnforcer,
+  'post-tool-verifier': postToolVerifier,
+  'session-start': sessionStart,
+  'context-monitor': contextMonitor,
+};
+
+// Shut down after this long without requests
+const IDLE_TIMEOUT_MS = Number(process.env.SISYPHUS_HOOKD_IDLE_MS) || 30 * 60 * 1000;
+
+// Latency samples kept per hook (ring buffer)
+const SAMPLE_WINDOW = 1024;
+
+const latency = {};
+const startedAt = Date.now();
+
+// Record one handler duration in milliseconds
+function recordLatency(hook, ms, failed) {
+  const entry = latency[hook] || (latency[hook] = { count: 0, errors: 0, samples: [], next: 0 });
+  entry.count++;
+  if (failed) entry.errors++;
+  if (entry.samples.length < SAMPLE_WINDOW) {
+    entry.samples.push(ms);
+  } else {
+    entry.samples[entry.next] = ms;
+    entry.next = (entry.next + 1) % SAMPLE_WINDOW;
+  }
+}
+
+// Nearest-rank percentile of a sorted array
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  const rank = Math.ceil((p / 100) * sorted.length) - 1;
+  return sorted[Math.min(sorted.length - 1, Math.max(0, rank))];
+}
+
+// Summarize latency samples for every hook seen so far
+function latencyReport() {
+  const hooks = {};
+  for (const [hook, entry] of Object.entries(latency)) {
+    const sorted = [...entry.samples].sort((a, b) => a - b);
+    hooks[hook] = {
+      count: entry.count,
+      errors: entry.errors,
+      p50_ms: Number(percentile(sorted, 50).toFixed(3)),
+      p99_ms: Number(percentile(sorted, 99).toFixed(3)),
+      max_ms: Number((sorted[sorted.length - 1] || 0).toFixed(3)),
+    };
+  }
+  return {
+    pid: process.pid,
+    uptime_s: Math.round((Date.now() - startedAt) / 1000),
+    hooks,
+  };
+}
+
+// Dispatch one decoded request
+function dispatch(request) {
+  if (request.cmd === 'ping') return { ok: true, pid: process.pid };
+  if (request.cmd === 'stats') return { ok: true, stats: latencyReport() };
+  if (request.cmd === 'shutdown') return { ok: true, shutdown: true };
+
+  const handler = HANDLERS[request.hook];
+  if (!handler) return { ok: false, error: `unknown hook: ${request.hook}` };
+
+  const begin = process.hrtime.bigint();
+  let response;
+  let failed = false;
+  try {
+    response = handler(String(request.input ?? ''), request.context || {});
+  } catch {
+    failed = true;
+    response = { continue: true };
+  }
+  recordLatency(request.hook, Number(process.hrtime.bigint() - begin) / 1e6, failed);
+  return { ok: true, response };
+}
+
+/**
+ * Dispatch one `<hook>\t<cwd>\t<payload>` line from hook-client.sh and return
+ * the hook response itself (newlines in the JSON payload were folded to spaces).
+ */
+function dispatchRaw(line) {
+  const [hook, cwd = ''] = line.split('\t', 2);
+  const input = line.slice(hook.length + cwd.length + 2);
+  const reply = dispatch({ hook, input, context: { cwd } });
+  return reply.ok ? reply.response : { continue: true };
+}
+
+// Remove a socket file left behind by a dead daemon
+async function clearStaleSocket() {
+  if (!existsSync(SOCKET_PATH)) return true;
+  const reply = await requestDaemon({ cmd: 'ping' }, 500);
+  if (reply?.ok) return false;
+  try { unlinkSync(SOCKET_PATH); } catch {}
+  return true;
+}
+
+async function serve() {
+  // A state lock wait blocks every queued request: keep it well under the client's timeout
+  setLockTimeout(Math.min(1000, DAEMON_TIMEOUT_MS / 2));
+  try { mkdirSync(dirname(SOCKET_PATH), { recursive: true }); } catch {}
+  if (!(await clearStaleSocket())) {
+    console.error(`hook daemon already running on ${SOCKET_PATH}`);
+    process.exit(1);
+  }
+
+  let idleTimer = null;
+  const server = createServer((socket) => {
+    resetIdle();
+    let buffer = '';
+    socket.setEncoding('utf-8');
+    socket.on('error', () => {});
+    socket.on('data', (chunk) => {
+      buffer += chunk;
+      let newline;
+      while ((newline = buffer.indexOf('\n')) !== -1) {
+        const line = buffer.slice(0, newline);
+        buffer = buffer.slice(newline + 1);
+
+        // Shell client (hook-client.sh): bare hook response, then close
+        if (!line.startsWith('{')) {
+          socket.end(JSON.stringify(dispatchRaw(line)) + '\n');
+          return;
+        }
+
+        let reply;
+        try {
+          reply = dispatch(JSON.parse(line));
+        } catch {
+          reply = { ok: false, error: 'malformed request' };
+        }
+        socket.write(JSON.stringify(reply) + '\n');
+        if (reply.shutdown) shutdown();
+      }
+    });
+  });
+
+  function resetIdle() {
+    if (idleTimer) clearTimeout(idleTimer);
+    idleTimer = setTimeout(shutdown, IDLE_TIMEOUT_MS);
+    idleTimer.unref();
+  }
+
+  function shutdown() {
+    server.close();
+    try { unlinkSync(SOCKET_PATH); } catch {}
+    setTimeout(() => process.exit(0), 50).unref();
+  }
+
+  process.on('SIGTERM', shutdown);
+  process.on('SIGINT', shutdown);
+
+  server.listen(SOCKET_PATH, () => {
+    // Socket is per-user: nobody else may connect
+    try { chmodSync(SOCKET_PATH, 0o600); } catch {}
+    resetIdle();
+  });
+}
+
+async function main() {
+  const command = process.argv[2] || 'status';
+
+  if (process.platform === 'win32') {
+    console.error('hook daemon is not supported on Windows; hooks run in-process');
+    process.exit(1);
+  }
+
+  switch (command) {
+    case 'serve':
+      await serve();
+      return;
+
+    case 'start': {
+      if ((await requestDaemon({ cmd: 'ping' }, 500))?.ok) {
+        console.log(`hook daemon already running on ${SOCKET_PATH}`);
+        return;
+      }
+      const child = spawn(process.execPath, [fileURLToPath(import.meta.url), 'serve'], {
+        detached: true,
+        stdio: 'ignore',
+      });
+      child.unref();
+      console.log(`hook daemon started (pid ${child.pid}) on ${SOCKET_PATH}`);
+      return;
+    }
+
+    case 'stop': {
+      const reply = await requestDaemon({ cmd: 'shutdown' }, 1000);
+      console.log(reply?.ok ? 'hook daemon stopped' : 'hook daemon not running');
+      return;
+    }
+
+    case 'status': {
+      const reply = await requestDaemon({ cmd: 'ping' }, 1000);
+      console.log(reply?.ok ? `hook daemon running (pid ${reply.pid}) on ${SOCKET_PATH}` : 'hook daemon not running');
+      process.exitCode = reply?.ok ? 0 : 1;
+      return;
+    }
+
+    case 'stats': {
+      const reply = await requestDaemon({ cmd: 'stats' }, 1000);
+      if (!reply?.ok) {
+        console.error('hook daemon not running');
+        process.exitCode = 1;
+        return;
+      }
+      console.log(JSON.stringify(reply.stats, null, 2));
+      return;
+    }
+
+    default:
+      console.error(`unknown command: ${command}`);
+      console.error('usage: hook-daemon.mjs start|serve|stop|status|stats');
+      process.exitCode = 1;
+  }
+}
+
+if (isMain(import.meta.url)) {
+  main();
+}
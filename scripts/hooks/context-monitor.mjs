@@ -0,0 +1,302 @@
+/**
+ * PostToolUse Hook: Context Monitor (Node.js)
+ * Estimates how full the session's context window is by tailing the session
+ * transcript from a remembered byte offset, and warns as usage crosses the
+ * configured thresholds. Only newly appended transcript bytes are read.
+ * Cross-platform: Windows, macOS, Linux
+ *
+ * State (~/.claude/context-meter/<session>.json):
+ *   offset            transcript bytes already accounted for
+ *   usage_tokens      context size reported by the last assistant `usage`
+ *   pending_tokens    estimate for everything appended after that message
+ *   by_tool           estimated tokens per tool (tool_use input + tool_result)
+ *   warned            highest threshold (percent) already reported
+ * Files untouched for SISYPHUS_CONTEXT_METER_TTL_DAYS (default 7) are swept.
+ */
+
+import { closeSync, fstatSync, openSync, readFileSync, readSync } from 'fs';
+import { join } from 'path';
+import { homedir } from 'os';
+import { sweepDir, writeJsonAtomic } from '../common.mjs';
+
+export const METER_DIR = join(homedir(), '.claude', 'context-meter');
+
+// Context window size in tokens
+const CONTEXT_WINDOW = Number(process.env.SISYPHUS_CONTEXT_WINDOW) || 200000;
+
+// Warning thresholds as percentages of the window
+const WARN_LEVELS = (process.env.SISYPHUS_CONTEXT_WARN || '50,75,90')
+  .split(',').map(Number).filter(n => n > 0 && n <= 100).sort((a, b) => a - b);
+
+// Rough token cost of an image block
+const IMAGE_TOKENS = 1600;
+
+// tool_use ids remembered while waiting for their tool_result
+const MAX_OPEN_TOOL_IDS = 512;
+
+// Meter files untouched for this long are deleted
+const TTL_DAYS = Number(process.env.SISYPHUS_CONTEXT_METER_TTL_DAYS) || 7;
+
+/**
+ * Fast approximate token count: ~4 ASCII characters per token, one token per
+ * non-ASCII character (Hangul, CJK). Uses the UTF-8 length instead of a
+ * per-character loop: each BMP non-ASCII character adds 1-2 extra bytes.
+ */
+export function estimateTokens(text) {
+  if (!text) return 0;
+  const extra = Buffer.byteLength(text, 'utf-8') - text.length;
+  const nonAscii = Math.min(text.length, Math.round(extra / 2));
+  return Math.ceil((text.length - nonAscii) / 4 + nonAscii);
+}
+
+// Session ids become file names
+function shardName(sessionId) {
+  return String(sessionId || 'unknown').replace(/[^A-Za-z0-9._-]/g, '_').slice(0, 128);
+}
+
+function statePath(sessionId) {
+  return join(METER_DIR, `${shardName(sessionId)}.json`);
+}
+
+function emptyState(transcript) {
+  return {
+    transcript,
+    offset: 0,
+    usage_tokens: 0,
+    pending_tokens: 0,
+    by_tool: {},
+    tool_ids: {},
+    warned: 0,
+    updated_at: 0,
+  };
+}
+
+function loadState(sessionId, transcript) {
+  try {
+    const state = JSON.parse(readFileSync(statePath(sessionId), 'utf-8'));
+    if (state.transcript === transcript) return { ...emptyState(transcript), ...state };
+  } catch {}
+  return emptyState(transcript);
+}
+
+// Write the state atomically (write-then-rename)
+function saveState(sessionId, state) {
+  writeJsonAtomic(statePath(sessionId), state);
+}
+
+// Delete meter files (and leftover temp files) older than the TTL (throttled to one scan an hour)
+export function sweepExpired({ days = TTL_DAYS, force = false } = {}) {
+  return sweepDir(METER_DIR, {
+    maxAgeMs: days * 24 * 3600 * 1000,
+    match: name => name.endsWith('.json') || name.endsWith('.tmp'),
+    force,
+  });
+}
+
+// Bytes appended to the transcript since `offset`, up to the last complete line
+function readAppended(path, offset) {
+  let fd;
+  try {
+    fd = openSync(path, 'r');
+  } catch {
+    return null;
+  }
+  try {
+    const size = fstatSync(fd).size;
+    // Truncated or replaced transcript: start over
+    if (size < offset) return { text: '', end: 0, reset: true };
+    if (size === offset) return { text: '', end: offset, reset: false };
+    const buffer = Buffer.alloc(size - offset);
+    const read = readSync(fd, buffer, 0, buffer.length, offset);
+    const lastNewline = buffer.lastIndexOf(0x0a, read - 1);
+    if (lastNewline === -1) return { text: '', end: offset, reset: false };
+    return { text: buffer.toString('utf-8', 0, lastNewline + 1), end: offset + lastNewline + 1, reset: false };
+  } finally {
+    closeSync(fd);
+  }
+}
+
+// Tokens in a tool_result content field (string or content blocks)
+function resultTokens(content) {
+  if (typeof content === 'string') return estimateTokens(content);
+  if (!Array.isArray(content)) return 0;
+  let tokens = 0;
+  for (const block of content) {
+    if (block?.type === 'image') tokens += IMAGE_TOKENS;
+    else if (typeof block?.text === 'string') tokens += estimateTokens(block.text);
+  }
+  return tokens;
+}
+
+// Add tokens to a tool's running total
+function charge(state, tool, tokens) {
+  if (!tokens) return;
+  state.by_tool[tool] = (state.by_tool[tool] || 0) + tokens;
+}
+
+// Fold one transcript entry into the state
+function account(state, entry) {
+  // Compaction replaces the conversation with a summary
+  if (entry.type === 'system' && entry.subtype === 'compact_boundary') {
+    state.usage_tokens = 0;
+    state.pending_tokens = 0;
+    state.warned = 0;
+    return;
+  }
+
+  const message = entry.message;
+  if (!message) return;
+
+  const usage = message.usage;
+  if (usage && entry.type === 'assistant') {
+    // Authoritative size of the prompt that produced this message, plus its output
+    state.usage_tokens = (usage.input_tokens || 0)
+      + (usage.cache_creation_input_tokens || 0)
+      + (usage.cache_read_input_tokens || 0)
+      + (usage.output_tokens || 0);
+    state.pending_tokens = 0;
+    for (const block of Array.isArray(message.content) ? message.content : []) {
+      if (block?.type === 'tool_use') {
+        state.tool_ids[block.id] = block.name;
+        charge(state, block.name, estimateTokens(JSON.stringify(block.input ?? {})));
+      }
+    }
+    return;
+  }
+
+  const content = message.content;
+  if (typeof content === 'string') {
+    state.pending_tokens += estimateTokens(content);
+    return;
+  }
+  if (!Array.isArray(content)) return;
+
+  for (const block of content) {
+    let tokens = 0;
+    switch (block?.type) {
+      case 'text':
+        tokens = estimateTokens(block.text);
+        break;
+      case 'thinking':
+        tokens = estimateTokens(block.thinking);
+        break;
+      case 'image':
+        tokens = IMAGE_TOKENS;
+        break;
+      case 'tool_use':
+        tokens = estimateTokens(JSON.stringify(block.input ?? {}));
+        state.tool_ids[block.id] = block.name;
+        charge(state, block.name, tokens);
+        break;
+      case 'tool_result': {
+        tokens = resultTokens(block.content);
+        const tool = state.tool_ids[block.tool_use_id] || 'unknown';
+        delete state.tool_ids[block.tool_use_id];
+        charge(state, tool, tokens);
+        break;
+      }
+    }
+    state.pending_tokens += tokens;
+  }
+}
+
+// Keep the open tool_use map bounded (oldest ids first)
+function trimToolIds(state) {
+  const ids = Object.keys(state.tool_ids);
+  for (let i = 0; i < ids.length - MAX_OPEN_TOOL_IDS; i++) delete state.tool_ids[ids[i]];
+}
+
+/**
+ * Bring a session's meter up to date and return its state.
+ * Reads only transcript bytes appended since the last call. Without a
+ * readable transcript, the hook payload's tool input/output is counted instead.
+ */
+export function updateMeter({ sessionId, transcriptPath = '', toolName = '', toolInput, toolOutput }) {
+  const state = loadState(sessionId, transcriptPath);
+  let appended = transcriptPath ? readAppended(transcriptPath, state.offset) : null;
+  if (appended?.reset) {
+    Object.assign(state, emptyState(transcriptPath));
+    appended = readAppended(transcriptPath, 0);
+  }
+
+  if (appended) {
+    for (const line of appended.text.split('\n')) {
+      if (!line) continue;
+      try {
+        account(state, JSON.parse(line));
+      } catch {}
+    }
+    state.offset = appended.end;
+    trimToolIds(state);
+  } else {
+    const input = typeof toolInput === 'string' ? toolInput : JSON.stringify(toolInput ?? '');
+    const output = typeof toolOutput === 'string' ? toolOutput : JSON.stringify(toolOutput ?? '');
+    const tokens = estimateTokens(input) + estimateTokens(output);
+    state.pending_tokens += tokens;
+    charge(state, toolName || 'unknown', tokens);
+  }
+
+  state.updated_at = Date.now();
+  saveState(sessionId, state);
+  sweepExpired();
+  return state;
+}
+
+// Tokens currently estimated to be in the context window
+export function contextTokens(state) {
+  return state.usage_tokens + state.pending_tokens;
+}
+
+// "Read 45k, Bash 20k, Grep 8k"
+function topTools(state, count = 3) {
+  return Object.entries(state.by_tool)
+    .sort((a, b) => b[1] - a[1])
+    .slice(0, count)
+    .map(([tool, tokens]) => `${tool} ${Math.round(tokens / 1000)}k`)
+    .join(', ');
+}
+
+// Warning text for a newly crossed threshold
+function warningMessage(level, state) {
+  const used = contextTokens(state);
+  const summary = `~${Math.round(used / 1000)}k/${Math.round(CONTEXT_WINDOW / 1000)}k 토큰 (${Math.round((used / CONTEXT_WINDOW) * 100)}%)`;
+  const tools = topTools(state);
+  const byTool = tools ? ` 세션 누적 도구별: ${tools}.` : '';
+
+  if (level >= 90) {
+    return `🔴 context-monitor: 컨텍스트 ${summary} 사용!${byTool} 즉시 현재 작업 상태를 저장하고 새 세션을 시작하세요.`;
+  }
+  if (level >= 75) {
+    return `⚠️ context-monitor: 컨텍스트 ${summary} 사용.${byTool} 작업 요약 후 새 세션 시작을 권장합니다.`;
+  }
+  return `📊 context-monitor: 컨텍스트 ${summary} 사용.${byTool} 필요시 중간 요약을 고려하세요.`;
+}
+
+// Hook handler: returns the hook response for a raw stdin payload
+export function handle(input, context = {}) {
+  try {
+    const data = JSON.parse(input);
+    const sessionId = data.sessionId || data.session_id || 'unknown';
+
+    const state = updateMeter({
+      sessionId,
+      transcriptPath: data.transcript_path || data.transcriptPath || '',
+      toolName: data.tool_name || data.toolName || '',
+      toolInput: data.tool_input ?? data.toolInput,
+      toolOutput: data.tool_response ?? data.toolOutput,
+    });
+
+    // Report each threshold once per session (again after a compaction)
+    const percent = (contextTokens(state) / CONTEXT_WINDOW) * 100;
+    const level = WARN_LEVELS.filter(l => percent >= l).pop() || 0;
+    if (level > state.warned) {
+      state.warned = level;
+      saveState(sessionId, state);
+      return { continue: true, message: warningMessage(level, state) };
+    }
+
+    return { continue: true };
+  } catch {
+    return { continue: true };
+  }
+}
@@ -0,0 +1,231 @@
+/**
+ * Sisyphus Keyword Detector Hook (Node.js)
+ * Detects ultrawork/ultrathink/search/analyze keywords and injects enhanced mode messages
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+import { readFileSync } from 'fs';
+import { updateSession } from '../state-store.mjs';
+
+// SISYPHUS_MODEL_ROUTER=0 turns routing off; model-router.mjs (and its rule
+// table) is then never loaded
+const ROUTER_ENABLED = process.env.SISYPHUS_MODEL_ROUTER !== '0';
+const router = ROUTER_ENABLED ? await import('../model-router.mjs') : null;
+
+// Only the first N characters of a prompt are scanned for keywords
+const SCAN_CAP = Number(process.env.SISYPHUS_KEYWORD_SCAN_CAP) || 512 * 1024;
+
+// Trigger vocabulary, compiled once per process (once per daemon)
+const KEYWORD_TABLE = JSON.parse(readFileSync(new URL('../keyword-table.json', import.meta.url), 'utf-8'));
+const KEYWORD_PATTERNS = compileKeywordTable(KEYWORD_TABLE);
+
+// Regex source for one table term (see keyword-table.json for the syntax)
+function termSource(term, literal) {
+  const escaped = term.replace(/[.*+?^${}()|[\]\\]/g, '\\$&').replace(/\\\{any\\\}/g, '.?');
+  return literal ? escaped : escaped.replace(/ +/g, '\\s+');
+}
+
+/**
+ * One pair of regexes per category, in priority order: `plain` runs on the
+ * lowercased prompt with code removed, `raw` (inCode rules) on the original
+ * prompt, case-insensitively.
+ */
+function compileKeywordTable(table) {
+  return table.categories.map((category) => {
+    const parts = { plain: [], raw: [] };
+    for (const rule of table.rules) {
+      if (rule.category !== category) continue;
+      const terms = rule.terms.map(term => termSource(term, rule.literal)).join('|');
+      parts[rule.inCode ? 'raw' : 'plain'].push(rule.boundary ? `\\b(?:${terms})\\b` : terms);
+    }
+    return {
+      category,
+      plain: parts.plain.length ? new RegExp(parts.plain.join('|')) : null,
+      raw: parts.raw.length ? new RegExp(parts.raw.join('|'), 'i') : null,
+    };
+  });
+}
+
+// Strip ``` fenced blocks, then `inline` spans
+function removeCodeBlocks(text) {
+  if (!text.includes('`')) return text;
+  return text
+    .replace(/```[\s\S]*?```/g, '')
+    .replace(/`[^`]+`/g, '');
+}
+
+const ULTRAWORK_MESSAGE = `<ultrawork-mode>
+
+**MANDATORY**: You MUST say "ULTRAWORK MODE ENABLED!" to the user as your first response when this mode activates. This is non-negotiable.
+
+[CODE RED] Maximum precision required. Ultrathink before acting.
+
+YOU MUST LEVERAGE ALL AVAILABLE AGENTS TO THEIR FULLEST POTENTIAL.
+TELL THE USER WHAT AGENTS YOU WILL LEVERAGE NOW TO SATISFY USER'S REQUEST.
+
+## AGENT UTILIZATION PRINCIPLES
+- **Codebase Exploration**: Spawn exploration agents using BACKGROUND TASKS
+- **Documentation & References**: Use librarian-type agents via BACKGROUND TASKS
+- **Planning & Strategy**: NEVER plan yourself - spawn planning agent
+- **High-IQ Reasoning**: Use oracle for architecture decisions
+- **Frontend/UI Tasks**: Delegate to frontend-engineer
+
+## EXECUTION RULES
+- **TODO**: Track EVERY step. Mark complete IMMEDIATELY.
+- **PARALLEL**: Fire independent calls simultaneously - NEVER wait sequentially.
+- **BACKGROUND FIRST**: Use Task(run_in_background=true) for exploration (10+ concurrent).
+- **VERIFY**: Check ALL requirements met before done.
+- **DELEGATE**: Orchestrate specialized agents.
+
+## ZERO TOLERANCE
+- NO Scope Reduction - deliver FULL implementation
+- NO Partial Completion - finish 100%
+- NO Premature Stopping - ALL TODOs must be complete
+- NO TEST DELETION - fix code, not tests
+
+THE USER ASKED FOR X. DELIVER EXACTLY X.
+
+</ultrawork-mode>
+
+---
+`;
+
+const ULTRATHINK_MESSAGE = `<think-mode>
+
+**ULTRATHINK MODE ENABLED** - Extended reasoning activated.
+
+You are now in deep thinking mode. Take your time to:
+1. Thoroughly analyze the problem from multiple angles
+2. Consider edge cases and potential issues
+3. Think through the implications of each approach
+4. Reason step-by-step before acting
+
+Use your extended thinking capabilities to provide the most thorough and well-reasoned response.
+
+</think-mode>
+
+---
+`;
+
+const SEARCH_MESSAGE = `<search-mode>
+MAXIMIZE SEARCH EFFORT. Launch multiple background agents IN PARALLEL:
+- explore agents (codebase patterns, file structures)
+- librarian agents (remote repos, official docs, GitHub examples)
+Plus direct tools: Grep, Glob
+NEVER stop at first result - be exhaustive.
+</search-mode>
+
+---
+`;
+
+const ANALYZE_MESSAGE = `<analyze-mode>
+ANALYSIS MODE. Gather context before diving deep:
+
+CONTEXT GATHERING (parallel):
+- 1-2 explore agents (codebase patterns, implementations)
+- 1-2 librarian agents (if external library involved)
+- Direct tools: Grep, Glob, LSP for targeted searches
+
+IF COMPLEX (architecture, multi-system, debugging after 2+ failures):
+- Consult oracle agent for strategic guidance
+
+SYNTHESIZE findings before proceeding.
+</analyze-mode>
+
+---
+`;
+
+// Extract prompt from various JSON structures
+function extractPrompt(input) {
+  try {
+    const data = JSON.parse(input);
+    if (data.prompt) return data.prompt;
+    if (data.message?.content) return data.message.content;
+    if (Array.isArray(data.parts)) {
+      return data.parts
+        .filter(p => p.type === 'text')
+        .map(p => p.text)
+        .join(' ');
+    }
+    return '';
+  } catch {
+    // Fallback: try to extract with regex
+    const match = input.match(/"(?:prompt|content|text)"\s*:\s*"([^"]+)"/);
+    return match ? match[1] : '';
+  }
+}
+
+// Highest-priority keyword category in the first `cap` characters of the prompt (code ignored), or null
+export function detectKeyword(prompt, cap = SCAN_CAP) {
+  const text = prompt.length > cap ? prompt.slice(0, cap) : prompt;
+  const clean = removeCodeBlocks(text).toLowerCase();
+  for (const { category, plain, raw } of KEYWORD_PATTERNS) {
+    if ((plain && plain.test(clean)) || (raw && raw.test(text))) return category;
+  }
+  return null;
+}
+
+// Start ultrawork for this session in the project state store
+function activateUltraworkState(directory, sessionId, prompt) {
+  const now = new Date().toISOString();
+  updateSession(directory, sessionId, (session) => {
+    session.ultrawork = {
+      active: true,
+      started_at: now,
+      original_prompt: prompt,
+      reinforcement_count: 0,
+      last_checked_at: now
+    };
+  });
+}
+
+// Hook handler: returns the hook response for a raw stdin payload
+export function handle(input, context = {}) {
+  try {
+    if (!input.trim()) {
+      return { continue: true };
+    }
+
+    let data = {};
+    try { data = JSON.parse(input); } catch {}
+    const directory = data.directory || context.cwd || process.cwd();
+    const sessionId = data.sessionId || data.session_id || '';
+
+    const prompt = extractPrompt(input);
+    if (!prompt) {
+      return { continue: true };
+    }
+
+    const keyword = detectKeyword(prompt);
+    let message = '';
+
+    // Ultrawork (highest priority) — includes Korean triggers for model upgrade
+    if (keyword === 'ultrawork') {
+      activateUltraworkState(directory, sessionId, prompt);
+      message = ULTRAWORK_MESSAGE;
+    } else if (keyword === 'think') {
+      message = ULTRATHINK_MESSAGE;
+    } else if (keyword === 'search') {
+      message = SEARCH_MESSAGE;
+    } else if (keyword === 'analyze') {
+      message = ANALYZE_MESSAGE;
+    }
+
+    // Model tier recommendation (ultrawork already carries its own model guidance)
+    if (router) {
+      try {
+        const route = router.routePrompt(prompt, { sessionId });
+        if (keyword !== 'ultrawork') message = router.routingMessage(route) + message;
+      } catch {}
+    }
+
+    // No keywords detected and no routing note
+    if (!message) {
+      return { continue: true };
+    }
+    return { continue: true, message };
+  } catch (error) {
+    // On any error, allow continuation
+    return { continue: true };
+  }
+}
@@ -0,0 +1,151 @@
+/**
+ * PostToolUse Hook: Verification Reminder System (Node.js)
+ * Monitors tool execution and provides contextual guidance
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+import { recordToolCall } from '../session-stats.mjs';
+
+// Detect failures in Bash output
+function detectBashFailure(output) {
+  const errorPatterns = [
+    /error:/i,
+    /failed/i,
+    /cannot/i,
+    /permission denied/i,
+    /command not found/i,
+    /no such file/i,
+    /exit code: [1-9]/i,
+    /exit status [1-9]/i,
+    /fatal:/i,
+    /abort/i,
+  ];
+
+  return errorPatterns.some(pattern => pattern.test(output));
+}
+
+// Detect background operation
+function detectBackgroundOperation(output) {
+  const bgPatterns = [
+    /started/i,
+    /running/i,
+    /background/i,
+    /async/i,
+    /task_id/i,
+    /spawned/i,
+  ];
+
+  return bgPatterns.some(pattern => pattern.test(output));
+}
+
+// Detect write failure
+function detectWriteFailure(output) {
+  const errorPatterns = [
+    /error/i,
+    /failed/i,
+    /permission denied/i,
+    /read-only/i,
+    /not found/i,
+  ];
+
+  return errorPatterns.some(pattern => pattern.test(output));
+}
+
+// Generate contextual message
+function generateMessage(toolName, toolOutput, sessionId, toolCount) {
+  let message = '';
+
+  switch (toolName) {
+    case 'Bash':
+      if (detectBashFailure(toolOutput)) {
+        message = 'Command failed. Please investigate the error and fix before continuing.';
+      } else if (detectBackgroundOperation(toolOutput)) {
+        message = 'Background operation detected. Remember to verify results before proceeding.';
+      }
+      break;
+
+    case 'Task':
+      if (detectWriteFailure(toolOutput)) {
+        message = 'Task delegation failed. Verify agent name and parameters.';
+      } else if (detectBackgroundOperation(toolOutput)) {
+        message = 'Background task launched. Use TaskOutput to check results when needed.';
+      } else if (toolCount > 5) {
+        message = `Multiple tasks delegated (${toolCount} total). Track their completion status.`;
+      }
+      break;
+
+    case 'Edit':
+      if (detectWriteFailure(toolOutput)) {
+        message = 'Edit operation failed. Verify file exists and content matches exactly.';
+      } else {
+        message = 'Code modified. Verify changes work as expected before marking complete.';
+      }
+      break;
+
+    case 'Write':
+      if (detectWriteFailure(toolOutput)) {
+        message = 'Write operation failed. Check file permissions and directory existence.';
+      } else {
+        message = 'File written. Test the changes to ensure they work correctly.';
+      }
+      break;
+
+    case 'TodoWrite':
+      if (/created|added/i.test(toolOutput)) {
+        message = 'Todo list updated. Proceed with next task on the list.';
+      } else if (/completed|done/i.test(toolOutput)) {
+        message = 'Task marked complete. Continue with remaining todos.';
+      } else if (/in_progress/i.test(toolOutput)) {
+        message = 'Task marked in progress. Focus on completing this task.';
+      }
+      break;
+
+    case 'Read':
+      if (toolCount > 10) {
+        message = `Extensive reading (${toolCount} files). Consider using Grep for pattern searches.`;
+      }
+      break;
+
+    case 'Grep':
+      if (/^0$|no matches/i.test(toolOutput)) {
+        message = 'No matches found. Verify pattern syntax or try broader search.';
+      }
+      break;
+
+    case 'Glob':
+      if (!toolOutput.trim() || /no files/i.test(toolOutput)) {
+        message = 'No files matched pattern. Verify glob syntax and directory.';
+      }
+      break;
+  }
+
+  return message;
+}
+
+// Hook handler: returns the hook response for a raw stdin payload
+export function handle(input, context = {}) {
+  try {
+    const data = JSON.parse(input);
+
+    const toolName = data.toolName || '';
+    const toolOutput = data.toolOutput || '';
+    const sessionId = data.sessionId || data.session_id || 'unknown';
+
+    // Record the call in the append-only session stats log
+    const toolCount = recordToolCall(sessionId, toolName);
+
+    // Generate contextual message
+    const message = generateMessage(toolName, toolOutput, sessionId, toolCount);
+
+    // Build response
+    const response = { continue: true };
+    if (message) {
+      response.message = message;
+    }
+
+    return response;
+  } catch (error) {
+    // On error, always continue
+    return { continue: true };
+  }
+}
@@ -0,0 +1,66 @@
+/**
+ * PreToolUse Hook: Sisyphus Reminder Enforcer (Node.js)
+ * Injects contextual reminders before every tool execution
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+import { getTodoCounts } from '../todo-index.mjs';
+
+// Simple JSON field extraction
+function extractJsonField(input, field, defaultValue = '') {
+  try {
+    const data = JSON.parse(input);
+    return data[field] ?? defaultValue;
+  } catch {
+    // Fallback regex extraction
+    const match = input.match(new RegExp(`"${field}"\\s*:\\s*"([^"]*)"`, 'i'));
+    return match ? match[1] : defaultValue;
+  }
+}
+
+// Get todo status for the current session and project
+function getTodoStatus(directory, sessionId) {
+  const { pending, in_progress: inProgress } = getTodoCounts({ sessionId, directory });
+
+  if (pending + inProgress > 0) {
+    return `[${inProgress} active, ${pending} pending] `;
+  }
+
+  return '';
+}
+
+// Generate contextual message based on tool type
+function generateMessage(toolName, todoStatus) {
+  const messages = {
+    TodoWrite: `${todoStatus}Mark todos in_progress BEFORE starting, completed IMMEDIATELY after finishing.`,
+    Bash: `${todoStatus}Use parallel execution for independent tasks. Use run_in_background for long operations (npm install, builds, tests).`,
+    Task: `${todoStatus}Launch multiple agents in parallel when tasks are independent. Use run_in_background for long operations.`,
+    Edit: `${todoStatus}Verify changes work after editing. Test functionality before marking complete.`,
+    Write: `${todoStatus}Verify changes work after editing. Test functionality before marking complete.`,
+    Read: `${todoStatus}Read multiple files in parallel when possible for faster analysis.`,
+    Grep: `${todoStatus}Combine searches in parallel when investigating multiple patterns.`,
+    Glob: `${todoStatus}Combine searches in parallel when investigating multiple patterns.`,
+  };
+
+  return messages[toolName] || `${todoStatus}The boulder never stops. Continue until all tasks complete.`;
+}
+
+// Hook handler: returns the hook response for a raw stdin payload
+export function handle(input, context = {}) {
+  try {
+    const toolName = extractJsonField(input, 'toolName', 'unknown');
+    const directory = extractJsonField(input, 'directory', context.cwd || process.cwd());
+    const sessionId = extractJsonField(input, 'sessionId') || extractJsonField(input, 'session_id');
+
+    const todoStatus = getTodoStatus(directory, sessionId);
+    const message = generateMessage(toolName, todoStatus);
+
+    return {
+      continue: true,
+      message: message
+    };
+  } catch (error) {
+    // On error, always continue
+    return { continue: true };
+  }
+}
@@ -0,0 +1,104 @@
+/**
+ * Sisyphus Session Start Hook (Node.js)
+ * Restores persistent mode states when session starts
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+import { updateSession } from '../state-store.mjs';
+import { getTodoCounts } from '../todo-index.mjs';
+
+// Newest other session in the project with `mode` active
+function latestActive(state, session, mode) {
+  return Object.values(state.sessions)
+    .filter(other => other !== session && other[mode]?.active)
+    .sort((a, b) => (b.updated_at || 0) - (a.updated_at || 0))[0];
+}
+
+// Carry active ultrawork / ralph state from an earlier session in this project over to this one
+function restoreModes(session, state) {
+  if (!session.ultrawork?.active) {
+    const source = latestActive(state, session, 'ultrawork');
+    if (source) session.ultrawork = structuredClone(source.ultrawork);
+  }
+  if (!session.ralph?.active) {
+    const source = latestActive(state, session, 'ralph');
+    if (source) {
+      session.ralph = structuredClone(source.ralph);
+      if (source.verification) session.verification = structuredClone(source.verification);
+    }
+  }
+  return { ultraworkState: session.ultrawork, ralphState: session.ralph };
+}
+
+// Hook handler: returns the hook response for a raw stdin payload
+export function handle(input, context = {}) {
+  try {
+    let data = {};
+    try { data = JSON.parse(input); } catch {}
+
+    const directory = data.directory || context.cwd || process.cwd();
+    const sessionId = data.sessionId || data.session_id || '';
+    const messages = [];
+
+    // Project state for this session, adopting modes left active by an earlier session
+    const { ultraworkState, ralphState } = updateSession(directory, sessionId, restoreModes);
+
+    if (ultraworkState?.active) {
+      messages.push(`<session-restore>
+
+[ULTRAWORK MODE RESTORED]
+
+You have an active ultrawork session from ${ultraworkState.started_at}.
+Original task: ${ultraworkState.original_prompt}
+
+Continue working in ultrawork mode until all tasks are complete.
+
+</session-restore>
+
+---
+`);
+    }
+
+    if (ralphState?.active) {
+      messages.push(`<session-restore>
+
+[RALPH LOOP RESTORED]
+
+You have an active ralph-loop session.
+Original task: ${ralphState.prompt || 'Task in progress'}
+Iteration: ${ralphState.iteration || 1}/${ralphState.max_iterations || 10}
+
+Continue working until the task is verified complete.
+
+</session-restore>
+
+---
+`);
+    }
+
+    // Check for incomplete todos left by earlier sessions in this project
+    const incompleteCount = getTodoCounts({ directory }).incomplete;
+
+    if (incompleteCount > 0) {
+      messages.push(`<session-restore>
+
+[PENDING TASKS DETECTED]
+
+You have ${incompleteCount} incomplete tasks from a previous session.
+Please continue working on these tasks.
+
+</session-restore>
+
+---
+`);
+    }
+
+    if (messages.length > 0) {
+      return { continue: true, message: messages.join('\n') };
+    } else {
+      return { continue: true };
+    }
+  } catch (error) {
+    return { continue: true };
+  }
+}
@@ -0,0 +1,570 @@
+#!/usr/bin/env node
+
+/**
+ * Sisyphus Ingredient Index (Node.js)
+ * On-disk inverted index of ingredient mentions in a project: INCI name ->
+ * file, line and the concentration (%) written next to the mention. Korean,
+ * English and INCI synonyms from ingredient-synonyms.json resolve to one INCI
+ * key, and only files whose mtime/size changed are re-scanned.
+ * Cross-platform: Windows, macOS, Linux
+ *
+ * Usage:
+ *   node ingredient-index.mjs build [--root <dir>] [--full]
+ *   node ingredient-index.mjs query <term> [--root <dir>] [--limit 50] [--min <pct>] [--max <pct>] [--json] [--refresh | --no-refresh]
+ *   node ingredient-index.mjs status [--root <dir>]
+ *
+ * Index (<root>/.sisyphus/ingredient-index/):
+ *   files.json            relative path -> [mtimeMs, size, [ingredient ids]]
+ *   postings/<inci>.json  relative path -> flat [line, pct, ...] pairs (pct null when unknown)
+ *
+ * A query reads only the postings of the ingredients it asks for. The mtime
+ * walk runs when the last one is older than SISYPHUS_INGREDIENT_REFRESH_SEC.
+ */
+
+import { existsSync, readFileSync, readdirSync, statSync, mkdirSync, rmSync, unlinkSync, utimesSync } from 'fs';
+import { join, resolve, extname } from 'path';
+import { createHash } from 'crypto';
+import { fileURLToPath } from 'url';
+import { isMain, parseArgs, writeJsonAtomic } from './common.mjs';
+import { compilePatterns, scanText } from './keyword-matcher.mjs';
+
+const INDEX_VERSION = 1;
+
+const SYNONYMS_FILE = new URL('./ingredient-synonyms.json', import.meta.url);
+const SYNONYMS_PATH = fileURLToPath(SYNONYMS_FILE);
+
+// File types the ingredient-explorer agent searched (json/md) plus other tabular notes
+const EXTENSIONS = new Set(['.json', '.md', '.markdown', '.csv', '.tsv', '.txt', '.yaml', '.yml']);
+
+// Never scanned, in addition to hidden directories (which ripgrep skips as well)
+const SKIP_DIRS = new Set(['node_modules', 'dist', 'build', 'venv', '__pycache__']);
+
+// Larger files are exports or generated data, not formulations
+const MAX_FILE_BYTES = Number(process.env.SISYPHUS_INGREDIENT_MAX_BYTES) || 4 * 1024 * 1024;
+
+// Queries re-check file mtimes when the last check is older than this
+const REFRESH_SECONDS = process.env.SISYPHUS_INGREDIENT_REFRESH_SEC !== undefined
+  ? Number(process.env.SISYPHUS_INGREDIENT_REFRESH_SEC) || 0
+  : 60;
+
+// File entry layout: [mtimeMs, size, ingredientIds]
+const MTIME = 0, SIZE = 1, INGREDIENTS = 2;
+
+// Postings per file are flat pairs: line, pct
+const STRIDE = 2;
+
+// "Niacinamide 5%", "Retinol: 0.5 %", "레티놀(0.1%)"
+const PCT_AFTER = /^[^0-9%\n]{0,24}?(\d{1,3}(?:[.,]\d+)?)\s*(?:%|％|w\/w)/i;
+
+// "5% Niacinamide"
+const PCT_BEFORE = /(\d{1,3}(?:[.,]\d+)?)\s*(?:%|％)\s*[(["']?\s*$/;
+
+// "percent": 5, "함량": "0.5", pct: 2
+const PCT_KEYED = /["']?(?:percent|pct|concentration|conc|content|wt|w\/w|%|함량|농도|배합량|배합비)["']?\s*[:=]\s*["']?(\d{1,3}(?:[.,]\d+)?)/i;
+
+// Markdown table header cell naming the concentration column
+const PCT_HEADER = /%|함량|농도|w\/w|\bwt\b|conc/i;
+
+// Lines searched around a JSON mention for a keyed concentration
+const JSON_WINDOW = 4;
+
+// Synonym table and its automaton, loaded once per process
+let synonyms = null;
+
+// Query-side key: case, whitespace, hyphens and underscores are ignored
+function foldTerm(term) {
+  return String(term).toLowerCase().replace(/[\s_-]+/g, '');
+}
+
+/**
+ * Load ingredient-synonyms.json: every INCI name, CAS number and
+ * English/Korean synonym maps back to its ingredient.
+ */
+export function loadSynonyms() {
+  if (synonyms) return synonyms;
+  const raw = readFileSync(SYNONYMS_FILE, 'utf-8');
+  const ingredients = JSON.parse(raw).ingredients || [];
+  const lookup = new Map();
+  ingredients.forEach((item, id) => {
+    for (const term of termsOf(item)) lookup.set(foldTerm(term), id);
+  });
+
+  synonyms = {
+    hash: createHash('sha1').update(raw).digest('hex').slice(0, 12),
+    ingredients,
+    lookup,
+    automaton: null,
+  };
+  return synonyms;
+}
+
+const termsOf = (item) => [item.inci, item.cas, ...(item.en || []), ...(item.ko || [])].filter(Boolean);
+
+/**
+ * One automaton over all synonyms, compiled only when files are scanned
+ * (queries never need it). ASCII terms need word boundaries; Hangul terms do not.
+ */
+function synonymAutomaton() {
+  const table = loadSynonyms();
+  if (table.automaton) return table.automaton;
+  const entries = [];
+  table.ingredients.forEach((item, id) => {
+    for (const term of termsOf(item)) {
+      const length = term.replace(/\s+/g, ' ').length;
+      entries.push({ text: term, value: { id, length }, boundary: /^[\x00-\x7f]*$/.test(term) });
+    }
+  });
+  table.automaton = compilePatterns(entries);
+  return table.automaton;
+}
+
+/**
+ * Ingredient ids a query term refers to: an exact synonym/INCI/CAS match, or
+ * every ingredient with a synonym containing the term ("hyaluron" finds both
+ * Hyaluronic Acid and Sodium Hyaluronate).
+ */
+export function resolveTerm(term) {
+  const { lookup } = loadSynonyms();
+  const key = foldTerm(term);
+  if (!key) return [];
+  if (lookup.has(key)) return [lookup.get(key)];
+  if (key.length < 3) return [];
+  const ids = new Set();
+  for (const [synonym, id] of lookup) {
+    if (synonym.includes(key)) ids.add(id);
+  }
+  return [...ids];
+}
+
+export function indexDir(root) {
+  return join(root, '.sisyphus', 'ingredient-index');
+}
+
+const metaPath = (root) => join(indexDir(root), 'files.json');
+
+const postingsDir = (root) => join(indexDir(root), 'postings');
+
+// "Butyrospermum Parkii (Shea) Butter" -> butyrospermum-parkii-shea-butter.json
+const shardPath = (root, inci) => join(postingsDir(root), `${inci.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-|-$/g, '')}.json`);
+
+function readJson(path) {
+  try {
+    return JSON.parse(readFileSync(path, 'utf-8'));
+  } catch {
+    return null;
+  }
+}
+
+
+function emptyMeta(hash) {
+  return { version: INDEX_VERSION, synonyms: hash, built_at: 0, files: {} };
+}
+
+function loadMeta(root) {
+  const data = readJson(metaPath(root));
+  return data?.version === INDEX_VERSION && data.files ? data : null;
+}
+
+// Visit indexable files under root as (relative path with '/', stat)
+function walk(root, visit, prefix = '') {
+  let entries;
+  try {
+    entries = readdirSync(prefix ? join(root, prefix) : root, { withFileTypes: true });
+  } catch {
+    return;
+  }
+  for (const entry of entries) {
+    const name = entry.name;
+    if (name.startsWith('.')) continue;
+    const rel = prefix ? `${prefix}/${name}` : name;
+    if (entry.isDirectory()) {
+      if (!SKIP_DIRS.has(name)) walk(root, visit, rel);
+      continue;
+    }
+    if (!entry.isFile() || !EXTENSIONS.has(extname(name).toLowerCase())) continue;
+    // The synonym table itself would match every query
+    if (name === 'ingredient-synonyms.json' && join(root, rel) === SYNONYMS_PATH) continue;
+    try {
+      const stat = statSync(join(root, rel));
+      if (stat.size <= MAX_FILE_BYTES) visit(rel, stat);
+    } catch {}
+  }
+}
+
+function parsePct(text) {
+  const value = Number(text.replace(',', '.'));
+  return value >= 0 && value <= 100 ? value : null;
+}
+
+const isTableRow = (line) => line !== undefined && line.trimStart().startsWith('|');
+
+const tableCells = (line) => line.trim().replace(/^\||\|$/g, '').split('|').map(c => c.trim());
+
+// First row of the markdown table containing lines[index] (memoized per file)
+function tableHeader(lines, index, memo) {
+  let i = index;
+  while (i > 0 && !memo.has(i) && isTableRow(lines[i - 1])) i--;
+  const header = memo.has(i) ? memo.get(i) : i;
+  memo.set(index, header);
+  return header;
+}
+
+// Concentration from the "%"/"함량" column of a markdown table row
+function tablePercent(lines, index, memo) {
+  const header = tableHeader(lines, index, memo);
+  if (header === index) return null;
+  const column = tableCells(lines[header]).findIndex(cell => PCT_HEADER.test(cell));
+  if (column === -1) return null;
+  const cell = tableCells(lines[index])[column] || '';
+  return /^\d{1,3}(?:[.,]\d+)?\s*%?$/.test(cell) ? parsePct(cell.replace('%', '').trim()) : null;
+}
+
+// Concentration keyed next to a JSON mention, within the same object
+function nearbyKeyedPercent(lines, index, matchedLines) {
+  for (const step of [1, -1]) {
+    if (lines[index].includes(step === 1 ? '}' : '{')) continue;
+    for (let k = 1; k <= JSON_WINDOW; k++) {
+      const line = lines[index + step * k];
+      if (line === undefined || matchedLines.has(index + step * k)) break;
+      const keyed = PCT_KEYED.exec(line);
+      if (keyed) return parsePct(keyed[1]);
+      if (line.includes(step === 1 ? '}' : '{')) break;
+    }
+  }
+  return null;
+}
+
+/**
+ * Ingredient mentions in one file as [line, ingredientId, pct] (1-based lines).
+ * A mention nested in a longer one ("Arbutin" in "Alpha-Arbutin") is dropped.
+ * The concentration is taken, in order, from "name 5%", "5% name", a
+ * "percent": 5 key on the line (or nearby in JSON), or the "%" column of a
+ * markdown table. Repeated mentions on one line count once.
+ */
+export function scanFile(text, ext = '') {
+  const found = [];
+  scanText(synonymAutomaton(), text, {
+    onMatch: ({ id, length }, end) => {
+      found.push([end - length + 1, end + 1, id]);
+    },
+  });
+  if (!found.length) return [];
+
+  found.sort((a, b) => a[0] - b[0] || b[1] - a[1]);
+  const mentions = [];
+  for (const match of found) {
+    const last = mentions[mentions.length - 1];
+    if (last && match[1] <= last[1]) continue;
+    mentions.push(match);
+  }
+
+  // Line number and bounds of every mention (mentions are in text order)
+  let line = 0;
+  let lineStart = 0;
+  let lineEnd = text.indexOf('\n');
+  if (lineEnd === -1) lineEnd = text.length;
+  for (const mention of mentions) {
+    while (mention[0] > lineEnd && lineEnd < text.length) {
+      line++;
+      lineStart = lineEnd + 1;
+      lineEnd = text.indexOf('\n', lineStart);
+      if (lineEnd === -1) lineEnd = text.length;
+    }
+    mention.push(line, lineStart, lineEnd);
+  }
+
+  let lines = null;
+  const matchedLines = new Set(mentions.map(m => m[3]));
+  const tableMemo = new Map();
+  const isJson = ext === '.json';
+  const hits = [];
+
+  for (let i = 0; i < mentions.length; i++) {
+    const [start, end, id, index, from, to] = mentions[i];
+    const next = mentions[i + 1];
+    const sameLineNext = next && next[3] === index;
+    const sameLinePrev = i > 0 && mentions[i - 1][3] === index;
+    const stop = sameLineNext ? next[0] : to;
+
+    let pct = null;
+    const after = PCT_AFTER.exec(text.slice(end, Math.min(stop, end + 48)));
+    if (after) pct = parsePct(after[1]);
+    // A leading "5%" belongs to this mention unless the previous one already has a value
+    if (pct === null && !(sameLinePrev && hits[hits.length - 1][2] !== null)) {
+      const before = PCT_BEFORE.exec(text.slice(Math.max(sameLinePrev ? mentions[i - 1][1] : from, start - 16), start));
+      if (before) pct = parsePct(before[1]);
+    }
+    if (pct === null) {
+      const keyed = PCT_KEYED.exec(text.slice(sameLinePrev ? start : from, stop));
+      if (keyed) pct = parsePct(keyed[1]);
+    }
+    if (pct === null && (isJson || isTableRow(text.slice(from, to)))) {
+      lines ??= text.split('\n');
+      pct = isJson ? nearbyKeyedPercent(lines, index, matchedLines) : tablePercent(lines, index, tableMemo);
+    }
+
+    // One hit per ingredient and line ("| Water | 정제수 | 70 |")
+    const last = hits[hits.length - 1];
+    if (last && last[0] === index + 1 && last[1] === id) {
+      last[2] ??= pct;
+      continue;
+    }
+    hits.push([index + 1, id, pct]);
+  }
+  return hits;
+}
+
+/**
+ * Bring the index for `root` up to date and return a change summary.
+ * Unchanged files (same mtime and size) are not read, and only the postings
+ * of ingredients mentioned in changed or deleted files are rewritten. A
+ * changed synonym table or `full` rebuilds from scratch.
+ */
+export function refreshIndex(root, { full = false } = {}) {
+  const { hash, ingredients } = loadSynonyms();
+  let meta = full ? null : loadMeta(root);
+  if (!meta || meta.synonyms !== hash) {
+    meta = emptyMeta(hash);
+    try { rmSync(postingsDir(root), { recursive: true, force: true }); } catch {}
+  }
+
+  const seen = new Set();
+  const changed = [];
+  walk(root, (rel, stat) => {
+    seen.add(rel);
+    const entry = meta.files[rel];
+    if (!entry || entry[MTIME] !== stat.mtimeMs || entry[SIZE] !== stat.size) changed.push([rel, stat]);
+  });
+
+  // Ingredients whose postings need rewriting, and the files to drop from them
+  const touched = new Set();
+  const dirty = new Set();
+  let removed = 0;
+  for (const [rel, entry] of Object.entries(meta.files)) {
+    if (seen.has(rel)) continue;
+    entry[INGREDIENTS].forEach(id => touched.add(id));
+    dirty.add(rel);
+    delete meta.files[rel];
+    removed++;
+  }
+
+  if (!changed.length && !removed) {
+    // Record the check so queries skip the walk until the next refresh interval
+    const now = new Date();
+    try { utimesSync(metaPath(root), now, now); } catch {}
+    return { meta, scanned: 0, removed: 0, updated: false };
+  }
+
+  // ingredient id -> relative path -> [line, pct, ...]
+  const added = new Map();
+  for (const [rel, stat] of changed) {
+    meta.files[rel]?.[INGREDIENTS].forEach(id => touched.add(id));
+    dirty.add(rel);
+    let hits = [];
+    try {
+      hits = scanFile(readFileSync(join(root, rel), 'utf-8'), extname(rel).toLowerCase());
+    } catch {}
+    const ids = new Set();
+    for (const [line, id, pct] of hits) {
+      ids.add(id);
+      touched.add(id);
+      if (!added.has(id)) added.set(id, new Map());
+      const files = added.get(id);
+      if (!files.has(rel)) files.set(rel, []);
+      files.get(rel).push(line, pct);
+    }
+    meta.files[rel] = [stat.mtimeMs, stat.size, [...ids]];
+  }
+
+  try { mkdirSync(postingsDir(root), { recursive: true }); } catch {}
+  for (const id of touched) {
+    const path = shardPath(root, ingredients[id].inci);
+    const postings = readJson(path) || {};
+    for (const rel of dirty) delete postings[rel];
+    for (const [rel, list] of added.get(id) || []) postings[rel] = list;
+    if (Object.keys(postings).length) {
+      writeJsonAtomic(path, postings);
+    } else {
+      try { unlinkSync(path); } catch {}
+    }
+  }
+
+  meta.built_at = Date.now();
+  writeJsonAtomic(metaPath(root), meta);
+  return { meta, scanned: changed.length, removed, updated: true };
+}
+
+// True when a query may skip the mtime walk
+function recentlyChecked(root) {
+  try {
+    return Date.now() - statSync(metaPath(root)).mtimeMs < REFRESH_SECONDS * 1000;
+  } catch {
+    return false;
+  }
+}
+
+// Search order of the old Grep strategy: data files, formulations, skills, reports
+function priority(rel) {
+  if (rel.endsWith('.json')) return 0;
+  if (/formulation[^/]*\.md$/i.test(rel)) return 1;
+  if (rel.startsWith('cosmetic-skills/')) return 2;
+  if (rel.startsWith('outputs/')) return 3;
+  return 4;
+}
+
+// Text of the reported lines, reading each file once
+function attachLines(root, hits) {
+  const byFile = new Map();
+  for (const hit of hits) {
+    if (!byFile.has(hit.file)) {
+      let lines = [];
+      try {
+        lines = readFileSync(join(root, hit.file), 'utf-8').split('\n');
+      } catch {}
+      byFile.set(hit.file, lines);
+    }
+    hit.text = (byFile.get(hit.file)[hit.line - 1] || '').trim().slice(0, 160);
+  }
+}
+
+/**
+ * Look up a term (INCI, English, Korean or CAS) in the index.
+ * Returns { query, known, ingredients, total, files, hits } where hits are
+ * { file, line, pct, inci, text }, ordered like the old Grep priorities.
+ * `min`/`max` keep only mentions with a known concentration in range.
+ * `refresh`: true always re-checks mtimes, false never does (except to build
+ * a missing index), undefined re-checks after the refresh interval.
+ */
+export function queryIndex(root, term, { limit = 50, min, max, refresh } = {}) {
+  const { ingredients } = loadSynonyms();
+  const ids = resolveTerm(term);
+  const matched = ids.map(id => ingredients[id]);
+  const result = { query: term, known: ids.length > 0, ingredients: matched, total: 0, files: 0, hits: [] };
+  if (!ids.length) return result;
+
+  if (refresh === true || (refresh === undefined && !recentlyChecked(root)) || !existsSync(metaPath(root))) refreshIndex(root);
+
+  const hasRange = min !== undefined || max !== undefined;
+  const hits = [];
+  for (const item of matched) {
+    const postings = readJson(shardPath(root, item.inci)) || {};
+    for (const [file, list] of Object.entries(postings)) {
+      for (let i = 0; i < list.length; i += STRIDE) {
+        const pct = list[i + 1];
+        if (hasRange && (pct === null || (min !== undefined && pct < min) || (max !== undefined && pct > max))) continue;
+        hits.push({ file, line: list[i], pct, inci: item.inci });
+      }
+    }
+  }
+
+  hits.sort((a, b) => priority(a.file) - priority(b.file) || (a.file < b.file ? -1 : a.file > b.file ? 1 : a.line - b.line));
+  result.total = hits.length;
+  result.files = new Set(hits.map(h => h.file)).size;
+  result.hits = hits.slice(0, limit);
+  attachLines(root, result.hits);
+  return result;
+}
+
+// Index size summary
+export function indexStatus(root) {
+  const meta = loadMeta(root);
+  if (!meta) return { root, index: indexDir(root), built: false };
+  let shards = [];
+  try { shards = readdirSync(postingsDir(root)).filter(f => f.endsWith('.json')); } catch {}
+  let postings = 0;
+  let bytes = 0;
+  for (const shard of shards) {
+    const path = join(postingsDir(root), shard);
+    try { bytes += statSync(path).size; } catch {}
+    for (const list of Object.values(readJson(path) || {})) postings += list.length / STRIDE;
+  }
+  try { bytes += statSync(metaPath(root)).size; } catch {}
+  return {
+    root,
+    index: indexDir(root),
+    built: true,
+    built_at: new Date(meta.built_at).toISOString(),
+    files: Object.keys(meta.files).length,
+    ingredients: shards.length,
+    postings,
+    bytes,
+    synonyms: meta.synonyms,
+  };
+}
+
+const formatPct = (pct) => (pct === null ? '-' : `${pct}%`);
+
+// Markdown report in the ingredient-explorer output format
+function formatResult(result) {
+  if (!result.known) {
+    return `성분 사전에 없는 검색어: ${result.query}\nscripts/ingredient-synonyms.json에 추가하거나 Grep으로 검색하세요.`;
+  }
+  const names = result.ingredients.map(i => (i.cas ? `${i.inci} (CAS ${i.cas})` : i.inci)).join(', ');
+  const out = [`## 검색: ${result.query} → ${names}`, ''];
+  if (result.hits.length) {
+    out.push('| 파일 | 라인 | 농도 | 내용 |', '|-----|-----|-----|-----|');
+    for (const hit of result.hits) {
+      out.push(`| ${hit.file}:${hit.line} | ${hit.line} | ${formatPct(hit.pct)} | ${hit.text.replace(/\|/g, '\\|')} |`);
+    }
+    out.push('');
+  }
+  out.push('## 요약');
+  const shown = result.hits.length < result.total ? ` (상위 ${result.hits.length}개 표시)` : '';
+  out.push(`- 총 ${result.files}개 파일에서 ${result.total}개 매칭${shown}`);
+  const pcts = result.hits.map(h => h.pct).filter(p => p !== null);
+  if (pcts.length) out.push(`- 표시된 농도 범위: ${Math.min(...pcts)}–${Math.max(...pcts)}%`);
+  return out.join('\n');
+}
+
+
+function main() {
+  const command = process.argv[2] || 'status';
+  const args = parseArgs(process.argv.slice(3));
+  const root = resolve(typeof args.root === 'string' ? args.root : process.cwd());
+
+  switch (command) {
+    case 'build': {
+      const begin = Date.now();
+      const { meta, scanned, removed } = refreshIndex(root, { full: Boolean(args.full) });
+      console.log(JSON.stringify({
+        ...indexStatus(root),
+        scanned,
+        removed,
+        unchanged: Object.keys(meta.files).length - scanned,
+        elapsed_ms: Date.now() - begin,
+      }, null, 2));
+      break;
+    }
+
+    case 'query': {
+      const term = args._.join(' ');
+      if (!term) {
+        console.error('usage: ingredient-index.mjs query <term> [--limit N] [--min pct] [--max pct] [--json] [--refresh | --no-refresh]');
+        process.exitCode = 1;
+        break;
+      }
+      const result = queryIndex(root, term, {
+        limit: Number(args.limit) || 50,
+        min: args.min !== undefined ? Number(args.min) : undefined,
+        max: args.max !== undefined ? Number(args.max) : undefined,
+        refresh: args['no-refresh'] ? false : args.refresh ? true : undefined,
+      });
+      console.log(args.json ? JSON.stringify(result, null, 2) : formatResult(result));
+      if (!result.known) process.exitCode = 2;
+      break;
+    }
+
+    case 'status':
+      console.log(JSON.stringify(indexStatus(root), null, 2));
+      break;
+
+    default:
+      console.error(`unknown command: ${command}`);
+      console.error('usage: ingredient-index.mjs build [--root <dir>] [--full] | query <term> [--json] [--refresh | --no-refresh] | status');
+      process.exitCode = 1;
+  }
+}
+
+if (isMain(import.meta.url)) {
+  main();
+}
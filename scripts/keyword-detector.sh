@@ -2,6 +2,13 @@
 # Sisyphus Keyword Detector Hook
 # Detects ultrawork/ultrathink/search/analyze keywords and injects enhanced mode messages
 
+# Prefer the Node.js detector (code stripped by two regex passes, then the
+# per-category regexes compiled from keyword-table.json)
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+if command -v node &> /dev/null && [ -f "$SCRIPT_DIR/keyword-detector.mjs" ]; then
+  . "$SCRIPT_DIR/hook-client.sh" keyword-detector
+fi
+
 # Read stdin (JSON input from Claude Code)
 INPUT=$(cat)
 
@@ -0,0 +1,321 @@
+/**
+ * Sisyphus Keyword Matcher (Node.js)
+ * Compiles a term list into one Aho-Corasick automaton and scans text in a
+ * single pass: case-folded, whitespace runs collapsed, optional word
+ * boundaries, and (optionally) fenced/inline code skipped on the fly.
+ * Used by model-router and ingredient-index; the keyword-detector hook
+ * compiles per-category regexes from keyword-table.json instead.
+ * Cross-platform: Windows, macOS, Linux
+ */
+
+const BACKTICK = 0x60;
+const SPACE = 0x20;
+
+// Characters matched by RegExp \s
+const SPACE_CODES = [
+  0x09, 0x0a, 0x0b, 0x0c, 0x0d, 0x20, 0xa0, 0x1680,
+  0x2000, 0x2001, 0x2002, 0x2003, 0x2004, 0x2005, 0x2006, 0x2007, 0x2008, 0x2009, 0x200a,
+  0x2028, 0x2029, 0x202f, 0x205f, 0x3000, 0xfeff,
+];
+const SPACE_SET = new Set(SPACE_CODES);
+
+// Character class 1 is whitespace; class 0 is "not in any term"
+const CLASS_SPACE = 1;
+
+// ASCII word characters, matching RegExp \b
+const WORD = new Uint8Array(128);
+for (let c = 0; c < 128; c++) {
+  WORD[c] = (c >= 97 && c <= 122) || (c >= 65 && c <= 90) || (c >= 48 && c <= 57) || c === 95 ? 1 : 0;
+}
+
+// Normalize a term the same way the scanner normalizes text
+function normalize(text) {
+  let out = '';
+  let lastSpace = false;
+  for (const ch of text.toLowerCase()) {
+    if (SPACE_SET.has(ch.charCodeAt(0))) {
+      if (!lastSpace) out += ' ';
+      lastSpace = true;
+    } else {
+      out += ch;
+      lastSpace = false;
+    }
+  }
+  return out;
+}
+
+// Expand `{any}` into every single printable ASCII character, or nothing
+function expandTerm(term) {
+  const at = term.indexOf('{any}');
+  if (at === -1) return [term];
+  const head = term.slice(0, at);
+  const tails = expandTerm(term.slice(at + 5));
+  const variants = [];
+  for (const tail of tails) {
+    variants.push(head + tail);
+    for (let c = 32; c < 127; c++) variants.push(head + String.fromCharCode(c) + tail);
+  }
+  return variants;
+}
+
+/**
+ * Compile entries into an automaton.
+ * entries: [{ text, value, boundary = false, inCode = false }]
+ *
+ * The trie is completed into a dense DFA over the characters that occur in
+ * any term (everything else shares one class), so scanning costs one table
+ * lookup per character.
+ */
+export function compilePatterns(entries) {
+  const compiled = [];
+  const terms = [];
+  let maxLen = 0;
+  let totalLen = 0;
+
+  for (const entry of entries) {
+    for (const variant of expandTerm(entry.text)) {
+      const text = normalize(variant);
+      if (!text) continue;
+      compiled.push({ value: entry.value, boundary: Boolean(entry.boundary), inCode: Boolean(entry.inCode), length: text.length });
+      terms.push(text);
+      maxLen = Math.max(maxLen, text.length);
+      totalLen += text.length;
+    }
+  }
+
+  const classOf = new Uint16Array(65536);
+  for (const c of SPACE_CODES) classOf[c] = CLASS_SPACE;
+  let classes = 2;
+  for (const text of terms) {
+    for (let i = 0; i < text.length; i++) {
+      const c = text.charCodeAt(i);
+      if (classOf[c]) continue;
+      classOf[c] = classes;
+      const upper = String.fromCharCode(c).toUpperCase();
+      if (upper.length === 1) classOf[upper.charCodeAt(0)] = classes;
+      classes++;
+    }
+  }
+
+  // Trie built directly in the transition table (0 = no child yet)
+  const delta = new Int32Array((totalLen + 1) * classes);
+  const outs = [[]];
+  let states = 1;
+  terms.forEach((text, index) => {
+    let node = 0;
+    for (let i = 0; i < text.length; i++) {
+      const slot = node * classes + classOf[text.charCodeAt(i)];
+      if (delta[slot] === 0) {
+        delta[slot] = states++;
+        outs.push([]);
+      }
+      node = delta[slot];
+    }
+    outs[node].push(index);
+  });
+
+  // Breadth-first failure links turn the trie into a complete DFA
+  const fail = new Int32Array(states);
+  const queue = new Int32Array(states);
+  let tail = 0;
+  for (let cls = 0; cls < classes; cls++) {
+    if (delta[cls]) queue[tail++] = delta[cls];
+  }
+  for (let head = 0; head < tail; head++) {
+    const node = queue[head];
+    const row = node * classes;
+    const failRow = fail[node] * classes;
+    if (outs[fail[node]].length) outs[node] = outs[node].concat(outs[fail[node]]);
+    for (let cls = 0; cls < classes; cls++) {
+      const child = delta[row + cls];
+      if (child === 0) {
+        delta[row + cls] = delta[failRow + cls];
+      } else {
+        fail[child] = delta[failRow + cls];
+        queue[tail++] = child;
+      }
+    }
+  }
+
+  const hasOut = new Uint8Array(states);
+  for (let s = 0; s < states; s++) hasOut[s] = outs[s].length ? 1 : 0;
+
+  let ringSize = 4;
+  while (ringSize < maxLen + 2) ringSize *= 2;
+
+  return {
+    entries: compiled,
+    classOf,
+    classes,
+    delta: delta.subarray(0, states * classes),
+    outs,
+    hasOut,
+    ringSize,
+    hasInCode: compiled.some(e => e.inCode),
+  };
+}
+
+// One normalized character stream through the automaton
+function createStream(automaton, accepts, emit) {
+  return {
+    ac: automaton,
+    accepts: automaton.entries.map(accepts),
+    emit,
+    words: new Uint8Array(automaton.ringSize),
+    state: 0,
+    pos: -1,
+    lastSpace: false,
+    pending: [],
+  };
+}
+
+// Advance a stream by one character (the hot path of every scan)
+function feed(stream, code, offset) {
+  const ac = stream.ac;
+  const cls = ac.classOf[code];
+  if (cls === CLASS_SPACE) {
+    if (stream.lastSpace) return;
+    stream.lastSpace = true;
+  } else {
+    stream.lastSpace = false;
+  }
+  const word = code < 128 ? WORD[code] : 0;
+
+  if (stream.pending.length) settle(stream, word);
+
+  const pos = ++stream.pos;
+  stream.words[pos & (ac.ringSize - 1)] = word;
+  const state = ac.delta[stream.state * ac.classes + cls];
+  stream.state = state;
+  if (ac.hasOut[state]) collect(stream, state, pos, offset);
+}
+
+// Report matches whose right-hand boundary is now known
+function settle(stream, nextIsWord) {
+  if (!nextIsWord) for (const [i, end] of stream.pending) stream.emit(i, end);
+  stream.pending = [];
+}
+
+// Outputs of an accepting state, after the left-hand boundary check
+function collect(stream, state, pos, offset) {
+  const ac = stream.ac;
+  for (const i of ac.outs[state]) {
+    if (!stream.accepts[i]) continue;
+    const entry = ac.entries[i];
+    if (!entry.boundary) {
+      stream.emit(i, offset);
+      continue;
+    }
+    const before = pos - entry.length;
+    if (before >= 0 && stream.words[before & (ac.ringSize - 1)]) continue;
+    stream.pending.push([i, offset]);
+  }
+}
+
+/**
+ * Scan text once, calling onMatch(value, endOffset) for every match.
+ * Returning true from onMatch stops the scan.
+ *
+ * With skipCode, ``` fenced blocks and `inline` spans are removed before
+ * matching (text on either side is joined, as if the code were deleted),
+ * except for entries flagged inCode, which see the raw text. Unterminated
+ * fences and spans are treated as plain text. Only the first `cap`
+ * characters are scanned.
+ */
+export function scanText(automaton, text, { skipCode = false, cap = Infinity, onMatch }) {
+  const limit = Math.min(text.length, cap);
+  let stopped = false;
+  const emit = (i, end) => {
+    if (!stopped && onMatch(automaton.entries[i].value, end) === true) stopped = true;
+  };
+
+  if (!skipCode) {
+    const stream = createStream(automaton, () => true, emit);
+    for (let i = 0; i < limit && !stopped; i++) feed(stream, text.charCodeAt(i), i);
+    if (!stopped) settle(stream, 0);
+    return;
+  }
+
+  const raw = automaton.hasInCode ? createStream(automaton, e => e.inCode, emit) : null;
+  const plain = createStream(automaton, e => !e.inCode, emit);
+  const tripleAt = (i) => i + 2 < limit && text.charCodeAt(i + 1) === BACKTICK && text.charCodeAt(i + 2) === BACKTICK;
+
+  const { classOf, delta, classes, hasOut } = automaton;
+  const mask = automaton.ringSize - 1;
+
+  // Walk [from, limit): code goes only to the raw stream, the rest to both
+  function run(from, allowFences, feedRaw) {
+    const rawStream = feedRaw ? raw : null;
+    let mode = 0; // 0 text, 1 fence, 2 inline
+    let openAt = -1;
+    let contentLen = 0;
+    let i = from;
+
+    while (i < limit && !stopped) {
+      const c = text.charCodeAt(i);
+
+      if (c !== BACKTICK) {
+        // Inlined feed() for the common case; rare events go through the helpers
+        const cls = classOf[c];
+        if (mode === 0) {
+          if (cls !== CLASS_SPACE || !plain.lastSpace) {
+            plain.lastSpace = cls === CLASS_SPACE;
+            const word = c < 128 ? WORD[c] : 0;
+            if (plain.pending.length) settle(plain, word);
+            const pos = ++plain.pos;
+            plain.words[pos & mask] = word;
+            const state = delta[plain.state * classes + cls];
+            plain.state = state;
+            if (hasOut[state]) collect(plain, state, pos, i);
+          }
+        } else if (mode === 2) {
+          contentLen++;
+        }
+        if (rawStream) feed(rawStream, c, i);
+        i++;
+        continue;
+      }
+
+      if (mode === 0) {
+        if (allowFences && tripleAt(i)) {
+          mode = 1;
+          openAt = i;
+          if (rawStream) for (let k = 0; k < 3; k++) feed(rawStream, BACKTICK, i + k);
+          i += 3;
+          continue;
+        }
+        mode = 2;
+        openAt = i;
+        contentLen = 0;
+      } else if (mode === 1) {
+        if (tripleAt(i)) {
+          mode = 0;
+          if (rawStream) for (let k = 0; k < 3; k++) feed(rawStream, BACKTICK, i + k);
+          i += 3;
+          continue;
+        }
+      } else if (contentLen === 0) {
+        // "``" is not a span: the first backtick stays as text
+        feed(plain, BACKTICK, openAt);
+        openAt = i;
+      } else {
+        mode = 0;
+      }
+
+      if (rawStream) feed(rawStream, c, i);
+      i++;
+    }
+
+    if (stopped) return;
+    if (mode === 1) {
+      // No closing fence: the opener and its content stay as text
+      run(openAt, false, false);
+    } else if (mode === 2) {
+      for (let k = openAt; k < limit && !stopped; k++) feed(plain, text.charCodeAt(k), k);
+    }
+  }
+
+  run(0, true, true);
+  if (!stopped) settle(plain, 0);
+  if (!stopped && raw) settle(raw, 0);
+}
@@ -0,0 +1,363 @@
+#!/usr/bin/env node
+
+/**
+ * Sisyphus Model Router (Node.js)
+ * Scores a prompt against the MODEL_ROUTING_V2 tier rules (model-routing.json)
+ * and recommends Opus (Tier 1), Sonnet (Tier 2) or Haiku (Tier 3). Decisions
+ * are cached per normalized prompt and appended to a JSONL log. Runs inside
+ * the UserPromptSubmit hook (keyword-detector) and offline against a labeled
+ * prompt set.
+ * Cross-platform: Windows, macOS, Linux
+ *
+ * Usage:
+ *   node model-router.mjs route <prompt...> [--json]
+ *   node model-router.mjs eval [--set <labeled.jsonl>] [--json]
+ *   node model-router.mjs log [--last N]
+ */
+
+import { appendFileSync, mkdirSync, readFileSync, renameSync, statSync } from 'fs';
+import { dirname, join } from 'path';
+import { homedir } from 'os';
+import { createHash } from 'crypto';
+import { isMain, parseArgs, writeJsonAtomic } from './common.mjs';
+import { compilePatterns, scanText } from './keyword-matcher.mjs';
+
+export const CACHE_FILE = join(homedir(), '.claude', '.model-router-cache.json');
+export const LOG_FILE = join(homedir(), '.claude', '.model-router.log');
+
+// Decisions kept in the cache (least recently used evicted first)
+const CACHE_SIZE = 500;
+
+// The log is rotated to <log>.1 past this size
+const LOG_MAX_BYTES = 1024 * 1024;
+
+// Only the first N characters of a prompt are scored
+const SCAN_CAP = 64 * 1024;
+
+const DEFAULT_EVAL_SET = new URL('./bench/routing-eval.jsonl', import.meta.url);
+
+// Routing rules, compiled once per process (once per daemon)
+const RULES_RAW = readFileSync(new URL('./model-routing.json', import.meta.url), 'utf-8');
+const RULES = JSON.parse(RULES_RAW);
+const RULES_HASH = createHash('sha1').update(RULES_RAW).digest('hex').slice(0, 12);
+const MATCHER = compilePatterns(RULES.rules.flatMap((rule, index) => rule.terms.map(text => ({
+  text,
+  value: index,
+  boundary: Boolean(rule.boundary),
+}))));
+
+// In-memory copy of the decision cache: key -> { tier, scores, reasons }
+let cache = null;
+
+/**
+ * Score a prompt against the tier rules.
+ * Every matched reason adds its weight once; two or more jurisdictions add the
+ * multi-jurisdiction weight. Tier 1 wins at its threshold; Tier 3 needs a
+ * short prompt whose lookup signals outweigh the Tier 2 ones.
+ */
+export function scorePrompt(prompt) {
+  const matched = new Set();
+  scanText(MATCHER, prompt, {
+    skipCode: true,
+    cap: SCAN_CAP,
+    onMatch(index) {
+      matched.add(index);
+    },
+  });
+
+  const scores = { 1: 0, 2: 0, 3: 0 };
+  const reasons = [];
+  const seen = new Set();
+  const jurisdictions = new Set();
+  for (const index of [...matched].sort((a, b) => a - b)) {
+    const rule = RULES.rules[index];
+    if (rule.jurisdiction) {
+      jurisdictions.add(rule.jurisdiction);
+      continue;
+    }
+    const key = `${rule.tier}:${rule.reason}`;
+    if (seen.has(key)) continue;
+    seen.add(key);
+    scores[rule.tier] += rule.weight;
+    reasons.push({ tier: rule.tier, reason: rule.reason });
+  }
+
+  if (jurisdictions.size >= 2) {
+    const { tier, weights } = RULES.multi_jurisdiction;
+    const steps = Object.keys(weights).map(Number).filter(n => n <= jurisdictions.size);
+    scores[tier] += weights[Math.max(...steps)];
+    reasons.push({ tier, reason: `복수 규제 (${[...jurisdictions].join('+')})` });
+  }
+
+  let tier = RULES.default_tier;
+  if (scores[1] >= RULES.tier1_threshold) {
+    tier = 1;
+  } else if (scores[3] >= RULES.tier3_threshold && scores[3] > scores[2] && prompt.length <= RULES.tier3_max_chars) {
+    tier = 3;
+  }
+  return { tier, scores, reasons };
+}
+
+// Cache key text: case and whitespace differences do not matter
+export function normalizePrompt(prompt) {
+  return prompt.slice(0, SCAN_CAP).toLowerCase().replace(/\s+/g, ' ').trim();
+}
+
+// Load the decision cache (memory first, then disk); a rules change empties it
+function loadCache() {
+  if (cache) return cache;
+  cache = new Map();
+  try {
+    const data = JSON.parse(readFileSync(CACHE_FILE, 'utf-8'));
+    if (data?.rules === RULES_HASH && Array.isArray(data.entries)) cache = new Map(data.entries);
+  } catch {}
+  return cache;
+}
+
+// Persist the cache with write-then-rename
+function saveCache() {
+  writeJsonAtomic(CACHE_FILE, { rules: RULES_HASH, entries: [...cache] });
+}
+
+// Append one decision to the JSONL log, rotating it when it grows too large
+function appendLog(entry) {
+  try {
+    mkdirSync(dirname(LOG_FILE), { recursive: true });
+    appendFileSync(LOG_FILE, JSON.stringify(entry) + '\n');
+    if (statSync(LOG_FILE).size > LOG_MAX_BYTES) renameSync(LOG_FILE, `${LOG_FILE}.1`);
+  } catch {}
+}
+
+/**
+ * Route a prompt: cached decision for the same normalized prompt, or a fresh
+ * score. Returns { tier, model, scores, reasons, cached, key } and logs it.
+ * The prompt text itself is never written to the log or the cache.
+ */
+export function routePrompt(prompt, { sessionId = '', log = true } = {}) {
+  const key = createHash('sha1').update(normalizePrompt(prompt)).digest('hex').slice(0, 16);
+  const entries = loadCache();
+  let decision = entries.get(key);
+  const cached = Boolean(decision);
+
+  if (cached) {
+    // Most recently used entries go last
+    entries.delete(key);
+    entries.set(key, decision);
+  } else {
+    decision = scorePrompt(prompt);
+    entries.set(key, decision);
+    while (entries.size > CACHE_SIZE) entries.delete(entries.keys().next().value);
+    saveCache();
+  }
+
+  const result = { ...decision, model: RULES.tiers[decision.tier].model, cached, key };
+  if (log) {
+    appendLog({
+      ts: new Date().toISOString(),
+      session: sessionId,
+      key,
+      tier: result.tier,
+      model: result.model,
+      scores: result.scores,
+      reasons: result.reasons.map(r => `T${r.tier} ${r.reason}`),
+      cached,
+      chars: prompt.length,
+    });
+  }
+  return result;
+}
+
+// Hook message for a non-default tier, or '' when the static defaults apply
+export function routingMessage(result) {
+  if (result.tier === RULES.default_tier) return '';
+  const tier = RULES.tiers[result.tier];
+  const why = result.reasons.filter(r => r.tier === result.tier).map(r => r.reason);
+  const because = why.length ? ` — ${[...new Set(why)].join(', ')}` : '';
+  const advice = result.tier === 1
+    ? `심층 분석·판단이 필요한 작업입니다. 하위 에이전트 위임 시 Task(model="${tier.model}")를 사용하세요.`
+    : `단순 조회·변환 작업입니다. Opus 에이전트 대신 Task(model="${tier.model}") 또는 ingredient-explorer에 위임하세요.`;
+  return `<model-routing tier="${result.tier}" model="${tier.model}">
+Tier ${result.tier} (${tier.name}) 권장${because}.
+${advice}
+</model-routing>
+
+---
+`;
+}
+
+// Projected cost (USD) and latency (ms) of one request on a tier
+function projection(tier, inputTokens, outputTokens) {
+  const { price, latency } = RULES.tiers[tier];
+  return {
+    cost: (inputTokens * price.input + outputTokens * price.output) / 1e6,
+    latency: latency.first_token_ms + (outputTokens / latency.tokens_per_sec) * 1000,
+  };
+}
+
+/**
+ * Replay a labeled prompt set ({ prompt, tier, output_tokens? } per line).
+ * Reports routing accuracy and the projected cost/latency of four
+ * strategies: everything on Opus (v1), the static v2 setup (Sonnet unless
+ * keyword-detector sees ultrawork), this router, and the labels themselves.
+ * Output size follows the labeled tier (the task), not the routed model.
+ */
+export async function evaluate(samples) {
+  const { detectKeyword } = await import('./hooks/keyword-detector.mjs');
+  const { estimateTokens } = await import('./hooks/context-monitor.mjs');
+  const { context_tokens: contextTokens, output_tokens: outputByTier } = RULES.eval;
+  const strategies = { opus: 0, static: 0, router: 0, labels: 0 };
+  const totals = Object.fromEntries(Object.keys(strategies).map(s => [s, { cost: 0, latency: 0 }]));
+  const confusion = { 1: { 1: 0, 2: 0, 3: 0 }, 2: { 1: 0, 2: 0, 3: 0 }, 3: { 1: 0, 2: 0, 3: 0 } };
+  const misrouted = [];
+  let correct = 0;
+  let under = 0;
+  let over = 0;
+
+  for (const sample of samples) {
+    const label = Number(sample.tier);
+    const routed = scorePrompt(sample.prompt);
+    confusion[label][routed.tier]++;
+    if (routed.tier === label) correct++;
+    else {
+      if (routed.tier > label) under++;
+      else over++;
+      misrouted.push({ prompt: sample.prompt, label, routed: routed.tier, reasons: routed.reasons.map(r => `T${r.tier} ${r.reason}`) });
+    }
+
+    const input = estimateTokens(sample.prompt) + contextTokens;
+    const output = Number(sample.output_tokens) || outputByTier[label];
+    const chosen = {
+      opus: 1,
+      static: detectKeyword(sample.prompt) === 'ultrawork' ? 1 : 2,
+      router: routed.tier,
+      labels: label,
+    };
+    for (const [strategy, tier] of Object.entries(chosen)) {
+      const { cost, latency } = projection(tier, input, output);
+      totals[strategy].cost += cost;
+      totals[strategy].latency += latency;
+    }
+  }
+
+  const n = samples.length || 1;
+  const round = (value, digits) => Number(value.toFixed(digits));
+  const summary = Object.fromEntries(Object.entries(totals).map(([strategy, t]) => [strategy, {
+    cost_usd: round(t.cost, 4),
+    mean_latency_s: round(t.latency / n / 1000, 2),
+    cost_vs_static_pct: round(((t.cost - totals.static.cost) / totals.static.cost) * 100, 1),
+    latency_vs_static_pct: round(((t.latency - totals.static.latency) / totals.static.latency) * 100, 1),
+  }]));
+
+  return {
+    prompts: samples.length,
+    accuracy: round(correct / n, 4),
+    under_routed: under,
+    over_routed: over,
+    confusion,
+    strategies: summary,
+    misrouted,
+  };
+}
+
+function printEvaluation(report) {
+  console.log(`prompts: ${report.prompts}  accuracy: ${(report.accuracy * 100).toFixed(1)}%  `
+    + `(under-routed ${report.under_routed}, over-routed ${report.over_routed})`);
+  console.log('');
+  console.log('label \\ routed'.padEnd(16) + ['T1', 'T2', 'T3'].map(t => t.padStart(6)).join(''));
+  for (const label of [1, 2, 3]) {
+    console.log(`T${label}`.padEnd(16) + [1, 2, 3].map(t => String(report.confusion[label][t]).padStart(6)).join(''));
+  }
+  console.log('');
+  const names = { opus: 'all Opus (v1)', static: 'static (v2)', router: 'router', labels: 'labels (ideal)' };
+  console.log('strategy'.padEnd(16) + 'cost $'.padStart(10) + 'latency s'.padStart(12) + 'cost Δ'.padStart(10) + 'latency Δ'.padStart(12));
+  for (const [strategy, s] of Object.entries(report.strategies)) {
+    console.log(names[strategy].padEnd(16)
+      + s.cost_usd.toFixed(3).padStart(10)
+      + s.mean_latency_s.toFixed(2).padStart(12)
+      + `${s.cost_vs_static_pct}%`.padStart(10)
+      + `${s.latency_vs_static_pct}%`.padStart(12));
+  }
+  if (report.misrouted.length) {
+    console.log('');
+    console.log('misrouted:');
+    for (const m of report.misrouted) {
+      console.log(`  T${m.label} -> T${m.routed}  ${m.prompt.replace(/\s+/g, ' ').slice(0, 70)}  [${m.reasons.join(', ')}]`);
+    }
+  }
+  console.log('');
+  console.log('Δ relative to static (v2); cost/latency are projections from model-routing.json prices and latency assumptions');
+}
+
+// Tier counts and cache hit rate over the last `last` log entries
+function summarizeLog(last) {
+  let lines = [];
+  try {
+    lines = readFileSync(LOG_FILE, 'utf-8').split('\n').filter(Boolean).slice(-last);
+  } catch {}
+  const tiers = { 1: 0, 2: 0, 3: 0 };
+  let hits = 0;
+  const entries = [];
+  for (const line of lines) {
+    try {
+      const entry = JSON.parse(line);
+      tiers[entry.tier] = (tiers[entry.tier] || 0) + 1;
+      if (entry.cached) hits++;
+      entries.push(entry);
+    } catch {}
+  }
+  return {
+    log: LOG_FILE,
+    decisions: entries.length,
+    tiers,
+    cache_hit_rate: entries.length ? Number((hits / entries.length).toFixed(3)) : 0,
+    recent: entries.slice(-5),
+  };
+}
+
+
+async function main() {
+  const command = process.argv[2] || 'eval';
+  const args = parseArgs(process.argv.slice(3));
+
+  switch (command) {
+    case 'route': {
+      const prompt = args._.join(' ');
+      if (!prompt) {
+        console.error('usage: model-router.mjs route <prompt...> [--json]');
+        process.exitCode = 1;
+        break;
+      }
+      const result = scorePrompt(prompt);
+      const tier = RULES.tiers[result.tier];
+      if (args.json) {
+        console.log(JSON.stringify({ ...result, model: tier.model }, null, 2));
+      } else {
+        console.log(`Tier ${result.tier} (${tier.name})  scores T1=${result.scores[1]} T2=${result.scores[2]} T3=${result.scores[3]}`);
+        for (const r of result.reasons) console.log(`  T${r.tier} ${r.reason}`);
+      }
+      break;
+    }
+
+    case 'eval': {
+      const path = typeof args.set === 'string' ? args.set : DEFAULT_EVAL_SET;
+      const samples = readFileSync(path, 'utf-8').split('\n').filter(Boolean).map(line => JSON.parse(line));
+      const report = await evaluate(samples);
+      if (args.json) console.log(JSON.stringify(report, null, 2));
+      else printEvaluation(report);
+      break;
+    }
+
+    case 'log':
+      console.log(JSON.stringify(summarizeLog(Number(args.last) || 1000), null, 2));
+      break;
+
+    default:
+      console.error(`unknown command: ${command}`);
+      console.error('usage: model-router.mjs route <prompt...> [--json] | eval [--set <file>] [--json] | log [--last N]');
+      process.exitCode = 1;
+  }
+}
+
+if (isMain(import.meta.url)) {
+  main();
+}
@@ -2,216 +2,14 @@
 
 /**
  * PostToolUse Hook: Verification Reminder System (Node.js)
- * Monitors tool execution and provides contextual guidance
+ * Entry point: hands the payload to the hook daemon and loads the handler
+ * (hooks/post-tool-verifier.mjs) only when it has to run in-process.
  * Cross-platform: Windows, macOS, Linux
  */
 
-import { existsSync, readFileSync, writeFileSync, mkdirSync } from 'fs';
-import { join } from 'path';
-import { homedir } from 'os';
+import { isMain } from './common.mjs';
+import { runHook } from './hook-client.mjs';
 
-// State file for session tracking
-const STATE_FILE = join(homedir(), '.claude', '.session-stats.json');
-
-// Ensure state directory exists
-try {
-  const stateDir = join(homedir(), '.claude');
-  if (!existsSync(stateDir)) {
-    mkdirSync(stateDir, { recursive: true });
-  }
-} catch {}
-
-// Read all stdin
-async function readStdin() {
-  const chunks = [];
-  for await (const chunk of process.stdin) {
-    chunks.push(chunk);
-  }
-  return Buffer.concat(chunks).toString('utf-8');
-}
-
-// Load session statistics
-function loadStats() {
-  try {
-    if (existsSync(STATE_FILE)) {
-      return JSON.parse(readFileSync(STATE_FILE, 'utf-8'));
-    }
-  } catch {}
-  return { sessions: {} };
-}
-
-// Save session statistics
-function saveStats(stats) {
-  try {
-    writeFileSync(STATE_FILE, JSON.stringify(stats, null, 2));
-  } catch {}
-}
-
-// Update stats for this session
-function updateStats(toolName, sessionId) {
-  const stats = loadStats();
-
-  if (!stats.sessions[sessionId]) {
-    stats.sessions[sessionId] = {
-      tool_counts: {},
-      last_tool: '',
-      total_calls: 0,
-      started_at: Math.floor(Date.now() / 1000)
-    };
-  }
-
-  const session = stats.sessions[sessionId];
-  session.tool_counts[toolName] = (session.tool_counts[toolName] || 0) + 1;
-  session.last_tool = toolName;
-  session.total_calls = (session.total_calls || 0) + 1;
-  session.updated_at = Math.floor(Date.now() / 1000);
-
-  saveStats(stats);
-  return session.tool_counts[toolName];
-}
-
-// Detect failures in Bash output
-function detectBashFailure(output) {
-  const errorPatterns = [
-    /error:/i,
-    /failed/i,
-    /cannot/i,
-    /permission denied/i,
-    /command not found/i,
-    /no such file/i,
-    /exit code: [1-9]/i,
-    /exit status [1-9]/i,
-    /fatal:/i,
-    /abort/i,
-  ];
-
-  return errorPatterns.some(pattern => pattern.test(output));
-}
-
-// Detect background operation
-function detectBackgroundOperation(output) {
-  const bgPatterns = [
-    /started/i,
-    /running/i,
-    /background/i,
-    /async/i,
-    /task_id/i,
-    /spawned/i,
-  ];
-
-  return bgPatterns.some(pattern => pattern.test(output));
-}
-
-// Detect write failure
-function detectWriteFailure(output) {
-  const errorPatterns = [
-    /error/i,
-    /failed/i,
-    /permission denied/i,
-    /read-only/i,
-    /not found/i,
-  ];
-
-  return errorPatterns.some(pattern => pattern.test(output));
+if (isMain(import.meta.url)) {
+  runHook('post-tool-verifier', () => import('./hooks/post-tool-verifier.mjs'), { indent: 2 });
 }
-
-// Generate contextual message
-function generateMessage(toolName, toolOutput, sessionId, toolCount) {
-  let message = '';
-
-  switch (toolName) {
-    case 'Bash':
-      if (detectBashFailure(toolOutput)) {
-        message = 'Command failed. Please investigate the error and fix before continuing.';
-      } else if (detectBackgroundOperation(toolOutput)) {
-        message = 'Background operation detected. Remember to verify results before proceeding.';
-      }
-      break;
-
-    case 'Task':
-      if (detectWriteFailure(toolOutput)) {
-        message = 'Task delegation failed. Verify agent name and parameters.';
-      } else if (detectBackgroundOperation(toolOutput)) {
-        message = 'Background task launched. Use TaskOutput to check results when needed.';
-      } else if (toolCount > 5) {
-        message = `Multiple tasks delegated (${toolCount} total). Track their completion status.`;
-      }
-      break;
-
-    case 'Edit':
-      if (detectWriteFailure(toolOutput)) {
-        message = 'Edit operation failed. Verify file exists and content matches exactly.';
-      } else {
-        message = 'Code modified. Verify changes work as expected before marking complete.';
-      }
-      break;
-
-    case 'Write':
-      if (detectWriteFailure(toolOutput)) {
-        message = 'Write operation failed. Check file permissions and directory existence.';
-      } else {
-        message = 'File written. Test the changes to ensure they work correctly.';
-      }
-      break;
-
-    case 'TodoWrite':
-      if (/created|added/i.test(toolOutput)) {
-        message = 'Todo list updated. Proceed with next task on the list.';
-      } else if (/completed|done/i.test(toolOutput)) {
-        message = 'Task marked complete. Continue with remaining todos.';
-      } else if (/in_progress/i.test(toolOutput)) {
-        message = 'Task marked in progress. Focus on completing this task.';
-      }
-      break;
-
-    case 'Read':
-      if (toolCount > 10) {
-        message = `Extensive reading (${toolCount} files). Consider using Grep for pattern searches.`;
-      }
-      break;
-
-    case 'Grep':
-      if (/^0$|no matches/i.test(toolOutput)) {
-        message = 'No matches found. Verify pattern syntax or try broader search.';
-      }
-      break;
-
-    case 'Glob':
-      if (!toolOutput.trim() || /no files/i.test(toolOutput)) {
-        message = 'No files matched pattern. Verify glob syntax and directory.';
-      }
-      break;
-  }
-
-  return message;
-}
-
-async function main() {
-  try {
-    const input = await readStdin();
-    const data = JSON.parse(input);
-
-    const toolName = data.toolName || '';
-    const toolOutput = data.toolOutput || '';
-    const sessionId = data.sessionId || 'unknown';
-
-    // Update session statistics
-    const toolCount = updateStats(toolName, sessionId);
-
-    // Generate contextual message
-    const message = generateMessage(toolName, toolOutput, sessionId, toolCount);
-
-    // Build response
-    const response = { continue: true };
-    if (message) {
-      response.message = message;
-    }
-
-    console.log(JSON.stringify(response, null, 2));
-  } catch (error) {
-    // On error, always continue
-    console.log(JSON.stringify({ continue: true }));
-  }
-}
-
-main();
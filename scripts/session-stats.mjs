@@ -0,0 +1,233 @@
+#!/usr/bin/env node
+
+/**
+ * Sisyphus Session Stats Store (Node.js)
+ * Append-only, per-session tool-call log with a periodically compacted snapshot.
+ * Each tool call appends one short line (O_APPEND, safe for parallel hooks);
+ * counts are snapshot + unread log tail, so per-call cost does not grow with history.
+ * Cross-platform: Windows, macOS, Linux
+ *
+ * Layout (~/.claude/session-stats/):
+ *   <session>.log        "<unix_ms>\t<tool>\n" per tool call
+ *   <session>.snap.json  counts folded from the log up to `offset`
+ *
+ * Usage:
+ *   node session-stats.mjs query [--session <id>] [--json]
+ *   node session-stats.mjs compact
+ *   node session-stats.mjs prune [--days 7]
+ */
+
+import {
+  appendFileSync, closeSync, existsSync, fstatSync, mkdirSync, openSync, readFileSync, readSync,
+  readdirSync, statSync, unlinkSync
+} from 'fs';
+import { join } from 'path';
+import { homedir } from 'os';
+import { isMain, parseArgs, sweepDir, writeJsonAtomic } from './common.mjs';
+
+export const STATS_DIR = join(homedir(), '.claude', 'session-stats');
+
+// Fold the log tail into the snapshot once it grows past this many bytes
+const COMPACT_BYTES = 16 * 1024;
+
+// Session shards untouched for this long are evicted
+const TTL_DAYS = Number(process.env.SISYPHUS_STATS_TTL_DAYS) || 7;
+
+// Snapshots cached across calls inside the hook daemon: session -> { mtimeMs, snap }
+const snapshots = new Map();
+
+// Session ids become file names
+function shardName(sessionId) {
+  return String(sessionId || 'unknown').replace(/[^A-Za-z0-9._-]/g, '_').slice(0, 128);
+}
+
+function logPath(sessionId) {
+  return join(STATS_DIR, `${shardName(sessionId)}.log`);
+}
+
+function snapPath(sessionId) {
+  return join(STATS_DIR, `${shardName(sessionId)}.snap.json`);
+}
+
+function emptySnapshot() {
+  return { offset: 0, tool_counts: {}, total_calls: 0, last_tool: '', started_at: 0, updated_at: 0 };
+}
+
+// Load a snapshot, reusing the cached copy while the file is unchanged
+function loadSnapshot(sessionId) {
+  const path = snapPath(sessionId);
+  let mtimeMs = 0;
+  try {
+    mtimeMs = statSync(path).mtimeMs;
+  } catch {
+    return emptySnapshot();
+  }
+
+  const hit = snapshots.get(path);
+  if (hit && hit.mtimeMs === mtimeMs) return structuredClone(hit.snap);
+
+  try {
+    const snap = { ...emptySnapshot(), ...JSON.parse(readFileSync(path, 'utf-8')) };
+    snapshots.set(path, { mtimeMs, snap: structuredClone(snap) });
+    return snap;
+  } catch {
+    return emptySnapshot();
+  }
+}
+
+// Write a snapshot atomically (write-then-rename)
+function saveSnapshot(sessionId, snap) {
+  const path = snapPath(sessionId);
+  if (writeJsonAtomic(path, snap)) snapshots.delete(path);
+}
+
+// Read log bytes from `offset` to the end of the last complete line
+function readTail(path, offset) {
+  let fd;
+  try {
+    fd = openSync(path, 'r');
+  } catch {
+    return { text: '', end: offset };
+  }
+  try {
+    const size = fstatSync(fd).size;
+    if (size <= offset) return { text: '', end: offset };
+    const buffer = Buffer.alloc(size - offset);
+    const read = readSync(fd, buffer, 0, buffer.length, offset);
+    const lastNewline = buffer.lastIndexOf(0x0a, read - 1);
+    if (lastNewline === -1) return { text: '', end: offset };
+    return { text: buffer.toString('utf-8', 0, lastNewline + 1), end: offset + lastNewline + 1 };
+  } finally {
+    closeSync(fd);
+  }
+}
+
+// Apply log lines to a snapshot
+function fold(snap, text) {
+  for (const line of text.split('\n')) {
+    if (!line) continue;
+    const tab = line.indexOf('\t');
+    if (tab === -1) continue;
+    const ts = Number(line.slice(0, tab));
+    const tool = line.slice(tab + 1);
+    snap.tool_counts[tool] = (snap.tool_counts[tool] || 0) + 1;
+    snap.total_calls++;
+    snap.last_tool = tool;
+    if (!snap.started_at || ts < snap.started_at) snap.started_at = ts;
+    if (ts > snap.updated_at) snap.updated_at = ts;
+  }
+  return snap;
+}
+
+// Current counts for a session: snapshot plus the not-yet-compacted tail
+function currentSnapshot(sessionId) {
+  const snap = loadSnapshot(sessionId);
+  const { text, end } = readTail(logPath(sessionId), snap.offset);
+  fold(snap, text);
+  return { snap, tailBytes: end - snap.offset, end };
+}
+
+/**
+ * Record one tool call and return how many times this session has used the tool.
+ */
+export function recordToolCall(sessionId, toolName) {
+  try {
+    mkdirSync(STATS_DIR, { recursive: true });
+    const tool = String(toolName || 'unknown').replace(/[\t\n]/g, ' ');
+    appendFileSync(logPath(sessionId), `${Date.now()}\t${tool}\n`);
+
+    const { snap, tailBytes, end } = currentSnapshot(sessionId);
+    if (tailBytes >= COMPACT_BYTES) {
+      snap.offset = end;
+      saveSnapshot(sessionId, snap);
+    }
+    // Throttled to one directory scan an hour, so it is cheap on every call
+    sweepExpired();
+    return snap.tool_counts[tool] || 1;
+  } catch {
+    return 1;
+  }
+}
+
+// Evict shards older than the TTL (throttled to one scan an hour)
+export function sweepExpired({ days = TTL_DAYS, force = false } = {}) {
+  return sweepDir(STATS_DIR, {
+    maxAgeMs: days * 24 * 3600 * 1000,
+    match: name => name.endsWith('.log'),
+    onRemove: log => {
+      const snap = log.replace(/\.log$/, '.snap.json');
+      if (existsSync(snap)) unlinkSync(snap);
+    },
+    force,
+  }).map(name => name.replace(/\.log$/, ''));
+}
+
+// Session ids with a log shard
+function listSessions() {
+  try {
+    return readdirSync(STATS_DIR).filter(n => n.endsWith('.log')).map(n => n.replace(/\.log$/, ''));
+  } catch {
+    return [];
+  }
+}
+
+// Aggregate one session for the query CLI
+function summarizeSession(sessionId) {
+  const { snap } = currentSnapshot(sessionId);
+  const minutes = Math.max((snap.updated_at - snap.started_at) / 60000, 1 / 60);
+  return {
+    session: sessionId,
+    total_calls: snap.total_calls,
+    calls_per_min: Number((snap.total_calls / minutes).toFixed(2)),
+    started_at: snap.started_at ? new Date(snap.started_at).toISOString() : null,
+    updated_at: snap.updated_at ? new Date(snap.updated_at).toISOString() : null,
+    last_tool: snap.last_tool,
+    tool_counts: Object.fromEntries(Object.entries(snap.tool_counts).sort((a, b) => b[1] - a[1])),
+  };
+}
+
+
+function main() {
+  const command = process.argv[2] || 'query';
+  const args = parseArgs(process.argv.slice(3));
+
+  switch (command) {
+    case 'query': {
+      const sessions = args.session ? [shardName(args.session)] : listSessions();
+      const rows = sessions.map(summarizeSession).sort((a, b) => (b.updated_at || '').localeCompare(a.updated_at || ''));
+      if (args.json) {
+        console.log(JSON.stringify(rows, null, 2));
+        break;
+      }
+      for (const row of rows) {
+        const tools = Object.entries(row.tool_counts).map(([t, n]) => `${t}=${n}`).join(' ');
+        console.log(`${row.session}  calls=${row.total_calls}  rate=${row.calls_per_min}/min  last=${row.updated_at || '-'}`);
+        if (tools) console.log(`  ${tools}`);
+      }
+      break;
+    }
+
+    case 'compact':
+      for (const sessionId of listSessions()) {
+        const { snap, end } = currentSnapshot(sessionId);
+        snap.offset = end;
+        saveSnapshot(sessionId, snap);
+      }
+      break;
+
+    case 'prune': {
+      const removed = sweepExpired({ days: Number(args.days) || TTL_DAYS, force: true });
+      console.log(`removed ${removed.length} session shard(s)`);
+      break;
+    }
+
+    default:
+      console.error(`unknown command: ${command}`);
+      console.error('usage: session-stats.mjs query [--session <id>] [--json] | compact | prune [--days N]');
+      process.exitCode = 1;
+  }
+}
+
+if (isMain(import.meta.url)) {
+  main();
+}
@@ -0,0 +1,321 @@
+#!/usr/bin/env node
+
+/**
+ * Sisyphus State Store (Node.js)
+ * One lock-protected state file per project for the persistent modes
+ * (ultrawork, ralph loop, oracle verification, todo continuation), keyed by
+ * session. Each hook does a single locked read-modify-write with
+ * write-then-rename, so parallel sessions in one project no longer lose
+ * updates and one project's state never leaks into another.
+ * Cross-platform: Windows, macOS, Linux
+ *
+ * Layout (~/.claude/sisyphus-state/):
+ *   <project-hash>.json       { version, project, legacy, sessions: { <session>: {...} } }
+ *   <project-hash>.json.lock  advisory lock, held for one read-modify-write
+ *
+ * Legacy files in <project>/.sisyphus/ (ultrawork-state.json, ralph-state.json,
+ * ralph-verification.json, continuation-count.json) are imported into the
+ * session that touches the project next whenever they change, and dropped from
+ * it when they are deleted, so tools that still write them keep working.
+ *
+ * Usage:
+ *   node state-store.mjs show [--dir <project>] [--session <id>] [--json]
+ *   node state-store.mjs clear [--dir <project>] [--session <id>] [--mode ultrawork|ralph|verification|continuation]
+ *   node state-store.mjs prune [--hours 72]
+ */
+
+import {
+  closeSync, mkdirSync, openSync, readFileSync, statSync, unlinkSync, writeSync
+} from 'fs';
+import { join, resolve } from 'path';
+import { homedir } from 'os';
+import { createHash } from 'crypto';
+import { isMain, parseArgs, sweepDir, writeJsonAtomic } from './common.mjs';
+
+export const STATE_DIR = join(homedir(), '.claude', 'sisyphus-state');
+
+// Sessions (and legacy files) untouched for this long are expired
+const TTL_HOURS = Number(process.env.SISYPHUS_STATE_TTL_HOURS) || 72;
+
+// Give up waiting for the lock after this long (the hook then runs read-only).
+// The hook daemon lowers it with setLockTimeout(): there the wait blocks every
+// queued request, so it must stay well under the client's reply timeout.
+let lockTimeoutMs = 3000;
+
+// A lock older than this belongs to a crashed process and is broken
+const LOCK_STALE_MS = 10000;
+
+// Session key used when the hook payload carries no session id
+const NO_SESSION = 'default';
+
+// Legacy per-project files and the session field each one maps to
+const LEGACY_FILES = {
+  'ultrawork-state.json': 'ultrawork',
+  'ralph-state.json': 'ralph',
+  'ralph-verification.json': 'verification',
+  'continuation-count.json': 'continuation',
+};
+
+export const MODES = Object.values(LEGACY_FILES);
+
+const sleeper = new Int32Array(new SharedArrayBuffer(4));
+
+// Locks this process holds, and when it last gave up waiting for each path
+const heldLocks = new Set();
+const lockGaveUp = new Map();
+
+// Block the thread for `ms` milliseconds (hooks are synchronous)
+function sleep(ms) {
+  Atomics.wait(sleeper, 0, 0, ms);
+}
+
+// Change how long this process waits for a state lock
+export function setLockTimeout(ms) {
+  lockTimeoutMs = ms;
+}
+
+// State file for a project directory
+export function statePath(directory) {
+  const project = resolve(directory || process.cwd());
+  const hash = createHash('sha1').update(project).digest('hex').slice(0, 16);
+  return join(STATE_DIR, `${hash}.json`);
+}
+
+function sessionKey(sessionId) {
+  return String(sessionId || NO_SESSION).replace(/[^A-Za-z0-9._-]/g, '_').slice(0, 128);
+}
+
+function emptyState(directory) {
+  return { version: 1, project: resolve(directory || process.cwd()), legacy: {}, sessions: {} };
+}
+
+// Parse the project state file (empty state when missing or unreadable)
+function readState(path, directory) {
+  try {
+    const state = JSON.parse(readFileSync(path, 'utf-8'));
+    if (state?.version === 1 && state.sessions) return { legacy: {}, ...state };
+  } catch {}
+  return emptyState(directory);
+}
+
+// Write the project state file atomically (write-then-rename)
+function writeState(path, state) {
+  return writeJsonAtomic(path, state, { space: 2 });
+}
+
+/**
+ * Take the advisory lock next to `path` (O_EXCL create). Retries with jitter,
+ * breaks locks older than LOCK_STALE_MS and returns false after the lock timeout.
+ * A long-running process (the hook daemon) waits out a stuck lock only once per
+ * timeout; requests queued behind it try once instead of each blocking
+ * the event loop again, and a nested call never waits on its own lock.
+ */
+function acquireLock(path) {
+  const lock = `${path}.lock`;
+  if (heldLocks.has(path)) return false;
+  const now = Date.now();
+  const deadline = now - (lockGaveUp.get(path) || 0) < lockTimeoutMs ? now : now + lockTimeoutMs;
+  try { mkdirSync(STATE_DIR, { recursive: true }); } catch {}
+
+  while (true) {
+    try {
+      const fd = openSync(lock, 'wx');
+      try { writeSync(fd, `${process.pid}\n`); } catch {}
+      closeSync(fd);
+      heldLocks.add(path);
+      lockGaveUp.delete(path);
+      return true;
+    } catch (error) {
+      if (error.code !== 'EEXIST') return false;
+    }
+
+    try {
+      if (Date.now() - statSync(lock).mtimeMs > LOCK_STALE_MS) {
+        unlinkSync(lock);
+        continue;
+      }
+    } catch {
+      // Released between our open and stat; retry right away
+      continue;
+    }
+
+    if (Date.now() >= deadline) {
+      lockGaveUp.set(path, Date.now());
+      return false;
+    }
+    sleep(2 + Math.floor(Math.random() * 8));
+  }
+}
+
+function releaseLock(path) {
+  heldLocks.delete(path);
+  try { unlinkSync(`${path}.lock`); } catch {}
+}
+
+// Pull changed legacy .sisyphus/*.json files into `session`; forget deleted ones
+function importLegacy(state, directory, key, now) {
+  const cutoff = now - TTL_HOURS * 3600 * 1000;
+  for (const [name, field] of Object.entries(LEGACY_FILES)) {
+    const path = join(resolve(directory || process.cwd()), '.sisyphus', name);
+    const seen = state.legacy[name];
+    let mtimeMs;
+    try {
+      mtimeMs = statSync(path).mtimeMs;
+    } catch {
+      if (seen) {
+        delete state.sessions[seen.session]?.[field];
+        delete state.legacy[name];
+      }
+      continue;
+    }
+    if (seen?.mtimeMs === mtimeMs || mtimeMs < cutoff) continue;
+
+    try {
+      const value = JSON.parse(readFileSync(path, 'utf-8'));
+      if (seen && seen.session !== key) delete state.sessions[seen.session]?.[field];
+      state.sessions[key] ||= {};
+      state.sessions[key][field] = value;
+      state.sessions[key].updated_at = now;
+      state.legacy[name] = { mtimeMs, session: key };
+    } catch {
+      // Mid-write or invalid; picked up once it changes again
+    }
+  }
+}
+
+// Drop sessions untouched for longer than the TTL
+function expireSessions(state, now) {
+  const cutoff = now - TTL_HOURS * 3600 * 1000;
+  for (const [key, session] of Object.entries(state.sessions)) {
+    if ((session.updated_at || 0) < cutoff) delete state.sessions[key];
+  }
+}
+
+/**
+ * Locked read-modify-write of one session's state.
+ * `mutate(session, state)` may change `session` (modes: ultrawork, ralph,
+ * verification, continuation) and read other sessions through `state`; its
+ * return value is returned. The file is rewritten only when something changed.
+ * When the lock cannot be taken the mutation runs on a copy and is not saved.
+ */
+export function updateSession(directory, sessionId, mutate) {
+  const path = statePath(directory);
+  const key = sessionKey(sessionId);
+  const locked = acquireLock(path);
+  try {
+    const now = Date.now();
+    const state = readState(path, directory);
+    const before = JSON.stringify(state);
+
+    importLegacy(state, directory, key, now);
+    expireSessions(state, now);
+
+    const session = state.sessions[key] || { updated_at: now };
+    const sessionBefore = JSON.stringify(session);
+    const result = mutate(session, state);
+    if (JSON.stringify(session) !== sessionBefore) {
+      session.updated_at = now;
+      state.sessions[key] = session;
+    }
+
+    if (locked && JSON.stringify(state) !== before) writeState(path, state);
+    return result;
+  } finally {
+    if (locked) releaseLock(path);
+    sweepExpired();
+  }
+}
+
+// Unlocked snapshot of a project's state (legacy files not imported)
+export function readProjectState(directory) {
+  return readState(statePath(directory), directory);
+}
+
+// Remove modes (all when `modes` is empty) from one session, or from every session
+export function clearState(directory, { sessionId = '', modes = [] } = {}) {
+  const fields = modes.length ? modes : MODES;
+  const path = statePath(directory);
+  const locked = acquireLock(path);
+  if (!locked) return false;
+  try {
+    const state = readState(path, directory);
+    const keys = sessionId ? [sessionKey(sessionId)] : Object.keys(state.sessions);
+    for (const key of keys) {
+      for (const field of fields) delete state.sessions[key]?.[field];
+    }
+    return writeState(path, state);
+  } finally {
+    releaseLock(path);
+  }
+}
+
+// Delete project state files untouched for longer than the TTL (throttled to one scan an hour)
+export function sweepExpired({ hours = TTL_HOURS, force = false } = {}) {
+  return sweepDir(STATE_DIR, {
+    maxAgeMs: hours * 3600 * 1000,
+    match: name => name.endsWith('.json'),
+    force,
+  });
+}
+
+
+function main() {
+  const command = process.argv[2] || 'show';
+  const args = parseArgs(process.argv.slice(3));
+  const directory = typeof args.dir === 'string' ? args.dir : process.cwd();
+
+  switch (command) {
+    case 'show': {
+      const state = readProjectState(directory);
+      const sessions = Object.entries(state.sessions)
+        .filter(([key]) => !args.session || key === sessionKey(args.session))
+        .sort((a, b) => (b[1].updated_at || 0) - (a[1].updated_at || 0));
+      if (args.json) {
+        console.log(JSON.stringify({ file: statePath(directory), ...state, sessions: Object.fromEntries(sessions) }, null, 2));
+        break;
+      }
+      console.log(`${state.project}  (${statePath(directory)})`);
+      for (const [key, session] of sessions) {
+        const modes = MODES.filter(m => session[m]).map((m) => {
+          const value = session[m];
+          if (m === 'ultrawork') return `ultrawork=${value.active ? 'active' : 'off'}#${value.reinforcement_count || 0}`;
+          if (m === 'ralph') return `ralph=${value.active ? 'active' : 'off'} ${value.iteration || 1}/${value.max_iterations || 10}`;
+          if (m === 'verification') return `verification=${value.pending ? 'pending' : 'done'}`;
+          return `continuation=${value.count || 0}`;
+        });
+        console.log(`  ${key}  ${new Date(session.updated_at || 0).toISOString()}  ${modes.join('  ') || '-'}`);
+      }
+      break;
+    }
+
+    case 'clear': {
+      const modes = typeof args.mode === 'string' ? [args.mode] : [];
+      const unknown = modes.filter(m => !MODES.includes(m));
+      if (unknown.length) {
+        console.error(`unknown mode: ${unknown.join(', ')} (expected ${MODES.join(', ')})`);
+        process.exitCode = 1;
+        break;
+      }
+      if (!clearState(directory, { sessionId: typeof args.session === 'string' ? args.session : '', modes })) {
+        console.error('state is locked or not writable');
+        process.exitCode = 1;
+      }
+      break;
+    }
+
+    case 'prune': {
+      const removed = sweepExpired({ hours: Number(args.hours) || TTL_HOURS, force: true });
+      console.log(`removed ${removed.length} project state file(s)`);
+      break;
+    }
+
+    default:
+      console.error(`unknown command: ${command}`);
+      console.error('usage: state-store.mjs show [--dir <project>] [--session <id>] [--json] | clear [--dir <project>] [--session <id>] [--mode <mode>] | prune [--hours N]');
+      process.exitCode = 1;
+  }
+}
+
+if (isMain(import.meta.url)) {
+  main();
+}
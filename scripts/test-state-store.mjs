@@ -0,0 +1,190 @@
+#!/usr/bin/env node
+
+/**
+ * State Store Stress Test
+ * Fires many concurrent Stop hooks (persistent-mode.mjs, one process each)
+ * against a throwaway HOME and checks that no counter increment is lost and
+ * that state stays scoped to its session and project.
+ *
+ * Tests:
+ *   1. Ultrawork reinforcements: N concurrent Stops in one session
+ *   2. Todo continuations: M sessions x K Stops in one project, all at once
+ *   3. Ralph iterations imported from a legacy .sisyphus/ralph-state.json
+ *   4. Project isolation: ultrawork in one project never reaches another
+ *   5. A stale lock left by a crashed process is broken
+ *   6. Through the hook daemon: concurrent Stops (daemon and in-process mixed)
+ *      lose nothing, and a lock held by another process never makes the
+ *      daemon miss the client's reply timeout
+ *
+ * Usage: node scripts/test-state-store.mjs [--stops 40] [--sessions 6] [--per-session 8] [--keep]
+ */
+
+import { spawn } from 'child_process';
+import { existsSync, mkdirSync, mkdtempSync, readFileSync, rmSync, unlinkSync, utimesSync, writeFileSync } from 'fs';
+import { join } from 'path';
+import { tmpdir } from 'os';
+import { fileURLToPath } from 'url';
+import { parseArgs } from './common.mjs';
+
+const HOOK = fileURLToPath(new URL('./persistent-mode.mjs', import.meta.url));
+const DAEMON = fileURLToPath(new URL('./hook-daemon.mjs', import.meta.url));
+
+
+const args = parseArgs(process.argv.slice(2));
+const STOPS = Number(args.stops) || 40;
+const SESSIONS = Number(args.sessions) || 6;
+const PER_SESSION = Math.min(Number(args['per-session']) || 8, 15);
+
+const home = mkdtempSync(join(tmpdir(), 'state-store-test-'));
+const socket = join(home, 'hookd.sock');
+process.env.HOME = home;
+process.env.USERPROFILE = home;
+const { readProjectState, statePath, updateSession } = await import('./state-store.mjs');
+
+let failures = 0;
+
+function check(name, ok, detail = '') {
+  console.log(`${ok ? 'PASS' : 'FAIL'}  ${name}${detail ? `  (${detail})` : ''}`);
+  if (!ok) failures++;
+}
+
+// A project directory with one pending todo, so every Stop has work to enforce
+function makeProject(name) {
+  const dir = join(home, name);
+  mkdirSync(join(dir, '.sisyphus'), { recursive: true });
+  writeFileSync(join(dir, '.sisyphus', 'todos.json'), JSON.stringify([{ content: 'x', status: 'pending' }]));
+  return dir;
+}
+
+// Run one Stop hook process (in-process, or through the daemon); resolves to its parsed JSON response
+function stop(directory, sessionId, { daemon = false } = {}) {
+  return new Promise((resolvePromise) => {
+    const env = daemon ? { SISYPHUS_HOOKD_SOCKET: socket } : { SISYPHUS_HOOKD: '0' };
+    const child = spawn(process.execPath, [HOOK], { env: { ...process.env, HOME: home, ...env } });
+    let out = '';
+    child.stdout.on('data', (chunk) => { out += chunk; });
+    child.on('close', () => {
+      try {
+        resolvePromise(JSON.parse(out));
+      } catch {
+        resolvePromise({ error: out });
+      }
+    });
+    child.stdin.end(JSON.stringify({ hook_event_name: 'Stop', session_id: sessionId, directory }));
+  });
+}
+
+// Start `hook-daemon.mjs serve` on the test socket and wait until it listens
+async function startDaemon() {
+  const child = spawn(process.execPath, [DAEMON, 'serve'], {
+    env: { ...process.env, HOME: home, SISYPHUS_HOOKD_SOCKET: socket },
+    stdio: 'ignore',
+  });
+  for (let i = 0; i < 100 && !existsSync(socket); i++) {
+    await new Promise(r => setTimeout(r, 50));
+  }
+  return child;
+}
+
+// Numbers matched by `pattern` across responses, sorted
+function counters(responses, pattern) {
+  return responses.map(r => Number(pattern.exec(r.reason || '')?.[1])).filter(Number.isFinite).sort((a, b) => a - b);
+}
+
+// 1..n without gaps or duplicates
+function isSequence(values, n) {
+  return values.length === n && values.every((v, i) => v === i + 1);
+}
+
+try {
+  // 1. Ultrawork reinforcements
+  const alpha = makeProject('alpha');
+  updateSession(alpha, 'uw', (session) => {
+    session.ultrawork = { active: true, original_prompt: 'stress', reinforcement_count: 0, max_reinforcements: STOPS + 10 };
+  });
+  let begin = Date.now();
+  const uwResponses = await Promise.all(Array.from({ length: STOPS }, () => stop(alpha, 'uw')));
+  const uwCount = readProjectState(alpha).sessions.uw?.ultrawork?.reinforcement_count;
+  const uwSeen = counters(uwResponses, /Reinforcement #(\d+)/);
+  check(`${STOPS} concurrent Stops, one session: reinforcement_count == ${STOPS}`, uwCount === STOPS, `got ${uwCount}, ${Date.now() - begin} ms`);
+  check('each Stop saw a distinct reinforcement number', isSequence(uwSeen, STOPS), `${new Set(uwSeen).size} distinct of ${uwSeen.length}`);
+
+  // 2. Todo continuations across sessions in one project
+  const beta = makeProject('beta');
+  const jobs = [];
+  for (let k = 0; k < PER_SESSION; k++) {
+    for (let s = 0; s < SESSIONS; s++) jobs.push(stop(beta, `s${s}`).then(r => ({ session: `s${s}`, r })));
+  }
+  begin = Date.now();
+  const contResults = await Promise.all(jobs);
+  const betaState = readProjectState(beta);
+  const lost = [];
+  for (let s = 0; s < SESSIONS; s++) {
+    const count = betaState.sessions[`s${s}`]?.continuation?.count;
+    const seen = counters(contResults.filter(x => x.session === `s${s}`).map(x => x.r), /TODO CONTINUATION (\d+)\//);
+    if (count !== PER_SESSION || !isSequence(seen, PER_SESSION)) lost.push(`s${s}=${count}`);
+  }
+  check(`${SESSIONS} sessions x ${PER_SESSION} concurrent Stops: every session counted ${PER_SESSION}`, lost.length === 0,
+    lost.length ? lost.join(' ') : `${jobs.length} Stops, ${Date.now() - begin} ms`);
+
+  // 3. Ralph loop from a legacy file
+  const gamma = makeProject('gamma');
+  writeFileSync(join(gamma, '.sisyphus', 'ralph-state.json'), JSON.stringify({ active: true, iteration: 1, max_iterations: 1000, prompt: 'loop' }));
+  const ralphResponses = await Promise.all(Array.from({ length: STOPS }, () => stop(gamma, 'ralph')));
+  const iteration = readProjectState(gamma).sessions.ralph?.ralph?.iteration;
+  const ralphSeen = counters(ralphResponses, /ITERATION (\d+)\//).map(v => v - 1);
+  check(`${STOPS} concurrent Stops, legacy ralph-state.json: iteration == ${STOPS + 1}`, iteration === STOPS + 1, `got ${iteration}`);
+  check('each Stop saw a distinct iteration', isSequence(ralphSeen, STOPS));
+  const legacy = JSON.parse(readFileSync(join(gamma, '.sisyphus', 'ralph-state.json'), 'utf-8'));
+  check('legacy file is left untouched', legacy.iteration === 1);
+
+  // 4. Project isolation
+  const delta = makeProject('delta');
+  const [other] = await Promise.all([stop(delta, 'uw'), stop(alpha, 'uw')]);
+  check('ultrawork in one project does not reach another', /todo-continuation/.test(other.reason || ''), (other.reason || other.error || '').split('\n')[2]);
+
+  // 5. Stale lock
+  const epsilon = makeProject('epsilon');
+  const lock = `${statePath(epsilon)}.lock`;
+  writeFileSync(lock, '99999\n');
+  const old = new Date(Date.now() - 60 * 1000);
+  utimesSync(lock, old, old);
+  begin = Date.now();
+  await stop(epsilon, 'crash');
+  const count = readProjectState(epsilon).sessions.crash?.continuation?.count;
+  check('stale lock is broken and the update saved', count === 1, `${Date.now() - begin} ms`);
+
+  // 6. Through the hook daemon
+  const daemon = await startDaemon();
+  try {
+    const zeta = makeProject('zeta');
+    updateSession(zeta, 'uw', (session) => {
+      session.ultrawork = { active: true, original_prompt: 'stress', reinforcement_count: 0, max_reinforcements: STOPS + 10 };
+    });
+    begin = Date.now();
+    const mixed = await Promise.all(Array.from({ length: STOPS }, (_, i) => stop(zeta, 'uw', { daemon: i % 2 === 0 })));
+    const zetaCount = readProjectState(zeta).sessions.uw?.ultrawork?.reinforcement_count;
+    check(`${STOPS} concurrent Stops, daemon and in-process mixed: reinforcement_count == ${STOPS}`, zetaCount === STOPS,
+      `got ${zetaCount}, ${Date.now() - begin} ms`);
+    check('each Stop saw a distinct reinforcement number', isSequence(counters(mixed, /Reinforcement #(\d+)/), STOPS));
+
+    // Another process holds the lock for 2.5 s: every queued daemon reply still beats the client timeout
+    const eta = makeProject('eta');
+    const held = `${statePath(eta)}.lock`;
+    writeFileSync(held, '99999\n');
+    setTimeout(() => { try { unlinkSync(held); } catch {} }, 2500);
+    begin = Date.now();
+    const blocked = await Promise.all(Array.from({ length: 4 }, (_, i) => stop(eta, `h${i}`, { daemon: true })));
+    const elapsed = Date.now() - begin;
+    check('a held lock does not stall the daemon past the client timeout',
+      blocked.every(r => /TODO CONTINUATION/.test(r.reason || '')) && elapsed < 2000, `${elapsed} ms`);
+  } finally {
+    daemon.kill();
+  }
+} finally {
+  if (args.keep) console.error(`kept ${home}`);
+  else rmSync(home, { recursive: true, force: true });
+}
+
+console.log(failures ? `\n${failures} check(s) failed` : '\nall checks passed');
+process.exitCode = failures ? 1 : 0;
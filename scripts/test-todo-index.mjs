@@ -0,0 +1,103 @@
+#!/usr/bin/env node
+
+/**
+ * Todo Index Regression Test
+ * Runs the hooks that read todo counts (one process each, no daemon) and
+ * the index directly against a throwaway HOME, and checks that counts stay
+ * scoped to their session and project.
+ *
+ * Tests:
+ *   1. A session's todos are counted for it in its own project
+ *   2. SessionStart in a fresh project does not report another project's todos
+ *   3. A later session in the same project does see them
+ *   4. Without a session or project, an old todo file rewritten in place is counted
+ *   5. The in-memory index reloads when another process rewrites the index file
+ *
+ * Usage: node scripts/test-todo-index.mjs [--keep]
+ */
+
+import { spawnSync } from 'child_process';
+import { mkdirSync, mkdtempSync, rmSync, utimesSync, writeFileSync } from 'fs';
+import { join } from 'path';
+import { tmpdir } from 'os';
+import { fileURLToPath } from 'url';
+
+const keep = process.argv.includes('--keep');
+
+const home = mkdtempSync(join(tmpdir(), 'todo-index-test-'));
+process.env.HOME = home;
+process.env.USERPROFILE = home;
+const { INDEX_FILE, TODOS_DIR, getTodoCounts } = await import('./todo-index.mjs');
+
+let failures = 0;
+
+function check(name, ok, detail = '') {
+  console.log(`${ok ? 'PASS' : 'FAIL'}  ${name}${detail ? `  (${detail})` : ''}`);
+  if (!ok) failures++;
+}
+
+// Run one hook entry point in-process; returns its stdout
+function hook(name, payload) {
+  const script = fileURLToPath(new URL(`./${name}.mjs`, import.meta.url));
+  const result = spawnSync(process.execPath, [script], {
+    input: JSON.stringify(payload),
+    env: { ...process.env, HOME: home, SISYPHUS_HOOKD: '0' },
+    encoding: 'utf-8',
+  });
+  return result.stdout;
+}
+
+// Global todo file for a session (~/.claude/todos/<session>-agent-<session>.json)
+function writeTodos(sessionId, todos) {
+  const path = join(TODOS_DIR, `${sessionId}-agent-${sessionId}.json`);
+  writeFileSync(path, JSON.stringify(todos));
+  return path;
+}
+
+try {
+  mkdirSync(TODOS_DIR, { recursive: true });
+  const projectA = join(home, 'project-a');
+  const projectB = join(home, 'project-b');
+  mkdirSync(projectA);
+  mkdirSync(projectB);
+  writeTodos('sA', [{ content: 'one', status: 'pending' }, { content: 'two', status: 'pending' }]);
+
+  // 1. Own session and project
+  const pre = hook('pre-tool-enforcer', { session_id: 'sA', directory: projectA, toolName: 'Read' });
+  check('PreToolUse for sA in project A counts its 2 pending todos', /\[0 active, 2 pending\]/.test(pre),
+    pre.match(/\[\d+ active, \d+ pending\]/)?.[0] || 'no todo status');
+
+  // 2. Fresh project
+  const fresh = hook('session-start', { session_id: 'sB', directory: projectB });
+  check('SessionStart in a fresh project reports no tasks from project A', !/incomplete tasks/.test(fresh),
+    /incomplete tasks/.test(fresh) ? 'leaked' : '');
+
+  // 3. Same project, new session
+  const resumed = hook('session-start', { session_id: 'sC', directory: projectA });
+  check('SessionStart in project A reports its 2 incomplete tasks', /You have 2 incomplete tasks/.test(resumed));
+
+  // 4. Old file rewritten in place (the todos directory mtime does not change)
+  const old = writeTodos('sOld', [{ content: 'stale', status: 'pending' }]);
+  const past = new Date(Date.now() - 48 * 3600 * 1000);
+  utimesSync(old, past, past);
+  const before = getTodoCounts().pending;
+  writeFileSync(old, JSON.stringify([{ content: 'stale', status: 'pending' }, { content: 'new', status: 'in_progress' }]));
+  const after = getTodoCounts();
+  check('an old todo file rewritten in place is counted again', before === 2 && after.pending === 3 && after.in_progress === 1,
+    `before ${before} pending, after ${after.pending} pending / ${after.in_progress} active`);
+
+  // 5. Index rewritten by another process
+  getTodoCounts({ sessionId: 'sA', directory: projectA });
+  writeFileSync(INDEX_FILE, JSON.stringify({ version: 1, dir_mtime: 0, names: [], files: {}, sessions: {} }));
+  const future = new Date(Date.now() + 5000);
+  utimesSync(INDEX_FILE, future, future);
+  const reloaded = getTodoCounts({ directory: projectA }).incomplete;
+  check('the in-memory index reloads after another process rewrites it', reloaded === 0,
+    `project A without its session mapping: ${reloaded}`);
+} finally {
+  if (keep) console.error(`kept ${home}`);
+  else rmSync(home, { recursive: true, force: true });
+}
+
+console.log(failures ? `\n${failures} check(s) failed` : '\nall checks passed');
+process.exitCode = failures ? 1 : 0;
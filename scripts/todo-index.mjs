@@ -0,0 +1,274 @@
+#!/usr/bin/env node
+
+/**
+ * Sisyphus Todo Index (Node.js)
+ * Incremental, mtime-keyed summary of Claude Code todo files shared by the hooks.
+ * Only files whose mtime/size changed are re-parsed; counts are scoped to the
+ * current session (or the sessions seen in the current project).
+ * Cross-platform: Windows, macOS, Linux
+ *
+ * Usage:
+ *   node todo-index.mjs status [--session <id>] [--directory <dir>]
+ *   node todo-index.mjs prune [--days 7] [--dry-run]
+ */
+
+import { existsSync, readFileSync, readdirSync, statSync, unlinkSync } from 'fs';
+import { join, resolve } from 'path';
+import { homedir } from 'os';
+import { isMain, parseArgs, writeJsonAtomic } from './common.mjs';
+
+export const TODOS_DIR = join(homedir(), '.claude', 'todos');
+export const INDEX_FILE = join(homedir(), '.claude', '.todo-index.json');
+
+const INDEX_VERSION = 1;
+
+// Without a session or project, only todo files this recent are counted
+const DEFAULT_MAX_AGE_HOURS = Number(process.env.SISYPHUS_TODO_MAX_AGE_HOURS) || 24;
+
+// Index entry layout: [mtimeMs, size, pending, inProgress, incomplete]
+const MTIME = 0, SIZE = 1, PENDING = 2, IN_PROGRESS = 3, INCOMPLETE = 4;
+
+// In-memory copy, reused across calls inside the hook daemon until another
+// process rewrites the index file
+let cached = null;
+let cachedMtime = 0;
+
+function emptyIndex() {
+  return { version: INDEX_VERSION, dir_mtime: 0, names: [], files: {}, sessions: {} };
+}
+
+function indexMtime() {
+  try {
+    return statSync(INDEX_FILE).mtimeMs;
+  } catch {
+    return 0;
+  }
+}
+
+// Load the index (memory first, then disk when the file changed since we read or wrote it)
+function loadIndex() {
+  const mtime = indexMtime();
+  if (cached && mtime === cachedMtime) return cached;
+  cachedMtime = mtime;
+  try {
+    const data = JSON.parse(readFileSync(INDEX_FILE, 'utf-8'));
+    if (data?.version === INDEX_VERSION && Array.isArray(data.names) && data.files && data.sessions) {
+      cached = data;
+      return cached;
+    }
+  } catch {}
+  cached = emptyIndex();
+  return cached;
+}
+
+// Persist the index with write-then-rename so readers never see a partial file
+function saveIndex(index) {
+  if (writeJsonAtomic(INDEX_FILE, index)) cachedMtime = indexMtime();
+}
+
+// Count todo statuses in one parsed todo file
+function summarize(data) {
+  const todos = data?.todos || data;
+  const summary = [0, 0, 0];
+  if (!Array.isArray(todos)) return summary;
+  for (const t of todos) {
+    if (t?.status === 'pending') summary[0]++;
+    else if (t?.status === 'in_progress') summary[1]++;
+    if (t?.status !== 'completed' && t?.status !== 'cancelled') summary[2]++;
+  }
+  return summary;
+}
+
+// Global todo files are keyed by bare name, project-local files by absolute path
+function pathOf(key) {
+  return key.includes('/') || key.includes('\\') ? key : join(TODOS_DIR, key);
+}
+
+// Re-parse a file only when its mtime or size changed; returns true if the index changed
+function refreshEntry(index, key) {
+  const path = pathOf(key);
+  let stat;
+  try {
+    stat = statSync(path);
+  } catch {
+    if (!index.files[key]) return false;
+    delete index.files[key];
+    return true;
+  }
+
+  const entry = index.files[key];
+  if (entry && entry[MTIME] === stat.mtimeMs && entry[SIZE] === stat.size) return false;
+
+  let summary = [0, 0, 0];
+  try {
+    summary = summarize(JSON.parse(readFileSync(path, 'utf-8')));
+  } catch {
+    // Unreadable or mid-write files count as empty until they change again
+  }
+  index.files[key] = [stat.mtimeMs, stat.size, ...summary];
+  return true;
+}
+
+// Session id a global todo file belongs to (`<session>-agent-<agent>.json`)
+function sessionOf(name) {
+  const base = name.replace(/\.json$/, '');
+  const at = base.indexOf('-agent-');
+  return at === -1 ? base : base.slice(0, at);
+}
+
+// Names of the global todo files, re-listed only when the directory changed
+function listTodoFiles(index) {
+  let dirMtime;
+  try {
+    dirMtime = statSync(TODOS_DIR).mtimeMs;
+  } catch {
+    return { names: [], changed: false };
+  }
+
+  if (index.dir_mtime === dirMtime) return { names: index.names, changed: false };
+
+  let names = [];
+  try {
+    names = readdirSync(TODOS_DIR).filter(f => f.endsWith('.json'));
+  } catch {}
+
+  // Forget files that disappeared from the directory
+  const present = new Set(names);
+  for (const key of Object.keys(index.files)) {
+    if (pathOf(key) === key) continue;
+    if (!present.has(key)) delete index.files[key];
+  }
+  index.dir_mtime = dirMtime;
+  index.names = names;
+  return { names, changed: true };
+}
+
+/**
+ * Todo counts for the current scope.
+ * - sessionId: only that session's global todo files
+ * - directory only: sessions previously seen in that project (none when the
+ *   project has no known sessions, so other projects' todos never leak in)
+ * - neither: global todo files changed in the last maxAgeHours
+ * Project-local .sisyphus/todos.json and .claude/todos.json are always included.
+ */
+export function getTodoCounts({ sessionId = '', directory = '', maxAgeHours = DEFAULT_MAX_AGE_HOURS } = {}) {
+  const index = loadIndex();
+  const { names, changed } = listTodoFiles(index);
+  let dirty = changed;
+
+  const project = directory ? resolve(directory) : '';
+  if (sessionId && project && index.sessions[sessionId] !== project) {
+    index.sessions[sessionId] = project;
+    dirty = true;
+  }
+
+  let selected;
+  let cutoff = 0;
+  if (sessionId) {
+    selected = names.filter(n => sessionOf(n) === sessionId);
+  } else {
+    const projectSessions = new Set(
+      Object.entries(index.sessions).filter(([, dir]) => dir === project).map(([sid]) => sid)
+    );
+    if (project) {
+      selected = names.filter(n => projectSessions.has(sessionOf(n)));
+    } else {
+      // Every file is stat()ed: an old one rewritten in place leaves the directory mtime alone
+      cutoff = Date.now() - maxAgeHours * 3600 * 1000;
+      selected = names;
+    }
+  }
+
+  const keys = [...selected];
+  if (project) {
+    keys.push(join(project, '.sisyphus', 'todos.json'), join(project, '.claude', 'todos.json'));
+  }
+
+  const counts = { pending: 0, in_progress: 0, incomplete: 0 };
+  for (const key of keys) {
+    if (refreshEntry(index, key)) dirty = true;
+    const entry = index.files[key];
+    if (!entry) continue;
+    if (cutoff && pathOf(key) !== key && entry[MTIME] < cutoff) continue;
+    counts.pending += entry[PENDING];
+    counts.in_progress += entry[IN_PROGRESS];
+    counts.incomplete += entry[INCOMPLETE];
+  }
+
+  if (dirty) saveIndex(index);
+  return counts;
+}
+
+/**
+ * Drop index entries for missing files and delete global todo files older than
+ * `days` that have nothing left to do. Files with incomplete todos are kept.
+ */
+export function pruneTodoIndex({ days = 7, dryRun = false } = {}) {
+  const index = loadIndex();
+  index.dir_mtime = 0;
+  const { names } = listTodoFiles(index);
+  const cutoff = Date.now() - days * 24 * 3600 * 1000;
+  const result = { scanned: names.length, deleted: [], kept_incomplete: 0 };
+
+  for (const name of names) {
+    refreshEntry(index, name);
+    const entry = index.files[name];
+    if (!entry || entry[MTIME] >= cutoff) continue;
+    if (entry[INCOMPLETE] > 0) {
+      result.kept_incomplete++;
+      continue;
+    }
+    result.deleted.push(name);
+    if (!dryRun) {
+      try { unlinkSync(join(TODOS_DIR, name)); } catch {}
+      delete index.files[name];
+    }
+  }
+
+  // Project-local entries whose files are gone
+  for (const key of Object.keys(index.files)) {
+    if (pathOf(key) === key && !existsSync(key)) delete index.files[key];
+  }
+
+  // Sessions that no longer have any todo files
+  const liveSessions = new Set(Object.keys(index.files).filter(k => pathOf(k) !== k).map(sessionOf));
+  for (const sid of Object.keys(index.sessions)) {
+    if (!liveSessions.has(sid)) delete index.sessions[sid];
+  }
+
+  if (!dryRun) {
+    index.dir_mtime = 0;
+    saveIndex(index);
+  }
+  return result;
+}
+
+
+function main() {
+  const command = process.argv[2] || 'status';
+  const args = parseArgs(process.argv.slice(3));
+
+  switch (command) {
+    case 'status':
+      console.log(JSON.stringify(getTodoCounts({
+        sessionId: args.session || '',
+        directory: args.directory || process.cwd(),
+      }), null, 2));
+      break;
+
+    case 'prune': {
+      const result = pruneTodoIndex({ days: Number(args.days) || 7, dryRun: Boolean(args['dry-run']) });
+      console.log(JSON.stringify({ ...result, deleted: result.deleted.length }, null, 2));
+      break;
+    }
+
+    default:
+      console.error(`unknown command: ${command}`);
+      console.error('usage: todo-index.mjs status [--session <id>] [--directory <dir>] | prune [--days N] [--dry-run]');
+      process.exitCode = 1;
+  }
+}
+
+if (isMain(import.meta.url)) {
+  main();
+}
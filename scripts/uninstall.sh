@@ -24,6 +24,7 @@ echo "  - Agents (oracle, librarian, explore, etc.)"
 echo "  - Commands (sisyphus, ultrawork, plan, etc.)"
 echo "  - Skills (ultrawork, git-master, frontend-ui-ux)"
 echo "  - Hooks (keyword-detector, silent-auto-update, stop-continuation)"
+echo "  - Agent tools in ~/.claude/sisyphus/ (ingredient-index)"
 echo "  - Version and state files"
 echo "  - Hook configurations from settings.json"
 echo ""
@@ -47,33 +48,37 @@ if [[ ! $REPLY =~ ^[Yy]$ ]]; then
     exit 0
 fi
 
-# Remove agents
-echo -e "${BLUE}Removing agents...${NC}"
-rm -f "$CLAUDE_CONFIG_DIR/agents/oracle.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/librarian.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/explore.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/frontend-engineer.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/document-writer.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/multimodal-looker.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/momus.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/metis.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/sisyphus-junior.md"
-rm -f "$CLAUDE_CONFIG_DIR/agents/prometheus.md"
-
-# Remove commands
-echo -e "${BLUE}Removing commands...${NC}"
-rm -f "$CLAUDE_CONFIG_DIR/commands/sisyphus.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/sisyphus-default.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/sisyphus-default-global.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/ultrawork.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/deepsearch.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/analyze.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/plan.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/review.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/prometheus.md"
+# Remove agents, commands, hooks and agent tools listed in the install manifest. Installs
+# made before the manifest existed fall back to the one shipped next to this script.
+MANIFEST=""
+SCRIPT_MANIFEST="$(dirname "${BASH_SOURCE[0]}")/install/MANIFEST"
+if [ -f "$CLAUDE_CONFIG_DIR/.sisyphus-manifest" ]; then
+    MANIFEST="$CLAUDE_CONFIG_DIR/.sisyphus-manifest"
+elif [ -f "$SCRIPT_MANIFEST" ]; then
+    MANIFEST="$SCRIPT_MANIFEST"
+fi
+
+echo -e "${BLUE}Removing agents, commands and hooks...${NC}"
+if [ -n "$MANIFEST" ]; then
+    REMOVED=0
+    while read -r hash path; do
+        case "$path" in
+            agents/*|commands/*|hooks/*|sisyphus/*) ;;
+            *) continue ;;
+        esac
+        if [ -f "$CLAUDE_CONFIG_DIR/$path" ]; then
+            rm -f "$CLAUDE_CONFIG_DIR/$path"
+            REMOVED=$((REMOVED + 1))
+        fi
+    done < "$MANIFEST"
+    rmdir "$CLAUDE_CONFIG_DIR/sisyphus" 2>/dev/null || true
+    echo -e "${GREEN}✓ Removed $REMOVED files listed in $MANIFEST${NC}"
+else
+    echo -e "${YELLOW}⚠ No install manifest found; run this script from a checkout to remove agents, commands and hooks${NC}"
+fi
+
+# Commands shipped by releases older than the manifest
 rm -f "$CLAUDE_CONFIG_DIR/commands/orchestrator.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/ralph-loop.md"
-rm -f "$CLAUDE_CONFIG_DIR/commands/cancel-ralph.md"
 rm -f "$CLAUDE_CONFIG_DIR/commands/update.md"
 
 # Remove skills
@@ -82,18 +87,14 @@ rm -rf "$CLAUDE_CONFIG_DIR/skills/ultrawork"
 rm -rf "$CLAUDE_CONFIG_DIR/skills/git-master"
 rm -rf "$CLAUDE_CONFIG_DIR/skills/frontend-ui-ux"
 
-# Remove hooks
-echo -e "${BLUE}Removing hooks...${NC}"
-rm -f "$CLAUDE_CONFIG_DIR/hooks/keyword-detector.sh"
-rm -f "$CLAUDE_CONFIG_DIR/hooks/stop-continuation.sh"
-rm -f "$CLAUDE_CONFIG_DIR/hooks/silent-auto-update.sh"
-
 # Remove version, state, and config files
 echo -e "${BLUE}Removing state and config files...${NC}"
 rm -f "$CLAUDE_CONFIG_DIR/.sisyphus-version.json"
 rm -f "$CLAUDE_CONFIG_DIR/.sisyphus-silent-update.json"
 rm -f "$CLAUDE_CONFIG_DIR/.sisyphus-update.log"
 rm -f "$CLAUDE_CONFIG_DIR/.sisyphus-config.json"
+rm -f "$CLAUDE_CONFIG_DIR/.sisyphus-manifest"
+rm -rf "$CLAUDE_CONFIG_DIR/.sisyphus-backup"
 
 # Remove hook configurations from settings.json
 SETTINGS_FILE="$CLAUDE_CONFIG_DIR/settings.json"